@@ -0,0 +1,126 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Count the natural sorting work done while validating a padframe and rendering the RTL, the driver and the pad list.
+
+For every phase, the number of natsorted() calls, the number of natural sort keys computed (i.e. the number of
+invocations of key functions created with natsort_keygen(), including the ones natsorted() uses internally) and the
+duration are reported. Without a config file, a synthetic padframe with --pads pads is used (see
+synthetic_padframe.py).
+
+Usage: python benchmarks/natsort_calls.py [--pads PADS] [CONFIG_FILE]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import natsort
+import natsort.natsort
+
+
+class NatsortCounter:
+    """
+    Counts the calls to natsorted() and to natsort key functions. Must be installed before padrick is imported since
+    padrick binds the natsort functions at import time.
+    """
+
+    def __init__(self):
+        self.natsorted_calls = 0
+        self.key_calls = 0
+
+    def install(self):
+        original_natsorted = natsort.natsorted
+        original_keygen = natsort.natsort.natsort_keygen
+
+        def natsorted(*args, **kwargs):
+            self.natsorted_calls += 1
+            return original_natsorted(*args, **kwargs)
+
+        def natsort_keygen(*args, **kwargs):
+            key = original_keygen(*args, **kwargs)
+
+            def counting_key(value):
+                self.key_calls += 1
+                return key(value)
+            return counting_key
+
+        natsort.natsorted = natsort.natsort.natsorted = natsorted
+        # natsorted() looks up natsort_keygen in its own module
+        natsort.natsort_keygen = natsort.natsort.natsort_keygen = natsort_keygen
+
+    def snapshot(self):
+        return self.natsorted_calls, self.key_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('config_file', type=Path, nargs='?')
+    parser.add_argument('--pads', type=int, default=500, help="Number of pads of the synthetic padframe.")
+    args = parser.parse_args()
+
+    counter = NatsortCounter()
+    counter.install()
+
+    from padrick.ConfigParser import parse_config
+    from padrick.Generators.DocGenerator.DocGenerator import generate_padlist
+    from padrick.Generators.DriverGenerator.DriverGenerator import generate_driver
+    from padrick.Generators.GeneratorSettings import GeneratorSettings
+    from padrick.Generators.RTLGenerator.RTLGenerator import generate_rtl
+    from padrick.Model.Padframe import Padframe
+    from synthetic_padframe import SyntheticPadframeParams, generate_padframe, dump_yaml
+
+    logging.getLogger("padrick").setLevel(logging.ERROR)
+    warnings.simplefilter('ignore')
+    settings = GeneratorSettings()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        config_file = args.config_file
+        if config_file is None:
+            config_file = tmp_dir / 'synthetic.yml'
+            config_file.write_text(dump_yaml(generate_padframe(SyntheticPadframeParams(pads=args.pads))))
+        phases = [
+            ('validate', lambda: parse_config(Padframe, config_file)),
+            ('rtl', lambda: generate_rtl(settings.rtl_templates, padframe, tmp_dir / 'rtl', header_text="")),
+            ('driver', lambda: generate_driver(settings.driver_templates, padframe, tmp_dir / 'driver',
+                                               header_text="")),
+            ('padlist', lambda: generate_padlist(padframe, tmp_dir / 'padlist')),
+        ]
+        print(f"{'phase':<10}  {'natsorted':>10}  {'sort keys':>10}  {'time':>9}")
+        total_natsorted, total_keys = 0, 0
+        for name, run in phases:
+            natsorted_before, keys_before = counter.snapshot()
+            start = time.perf_counter()
+            result = run()
+            duration = time.perf_counter() - start
+            if name == 'validate':
+                if result is None:
+                    raise SystemExit(f"Failed to parse {config_file}")
+                padframe = result
+            natsorted_calls = counter.natsorted_calls - natsorted_before
+            key_calls = counter.key_calls - keys_before
+            total_natsorted += natsorted_calls
+            total_keys += key_calls
+            print(f"{name:<10}  {natsorted_calls:>10}  {key_calls:>10}  {duration:>8.3f}s")
+        print(f"{'total':<10}  {total_natsorted:>10}  {total_keys:>10}")
+
+
+if __name__ == '__main__':
+    main()
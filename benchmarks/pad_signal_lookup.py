@@ -0,0 +1,145 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the validation time of a padframe with many pad types and port connections.
+
+Loading the YAML file and validating the loaded data with pydantic are timed separately.
+
+The generated configuration contains a single pad domain with PAD_TYPES pad types (each with a few shared and a few
+pad type specific pad signals) and port groups with a total of CONNECTIONS port connections. Linking the port
+connections to the pad signals of the pad types dominates the validation time of such a configuration.
+
+The configuration is validated twice: once with the pad signal index of the parse context ("indexed") and once with
+the linear scan over all pad signals of all pad types that padrick used before ("linear"). Besides the timings, the
+number of pad signal lookups and the number of pad signal name comparisons (dictionary probes for the index) are
+reported. These counts do not depend on the machine.
+
+Usage: python benchmarks/pad_signal_lookup.py [-n REPETITIONS] [--pad-types PAD_TYPES] [--connections CONNECTIONS]
+"""
+
+import argparse
+import logging
+import time
+import warnings
+from contextlib import contextmanager
+
+import ruamel.yaml
+
+from padrick.Model.ParseContext import PARSE_CONTEXT, ParseContext
+from padrick.Model.Padframe import Padframe
+
+# Connections per port: chip2pad, output_en, rx_en and one pad2chip port signal
+CONNECTIONS_PER_PORT = 4
+PORTS_PER_GROUP = 25
+
+
+def generate_config(num_pad_types: int, num_connections: int) -> str:
+    lines = ["name: lookup_benchmark", "manifest_version: 3", "pad_domains:", "  - name: main", "    pad_types:"]
+    for t in range(num_pad_types):
+        lines += [f"      - name: pad_type_{t}",
+                  "        template: |",
+                  f"          PAD_{t} ${{instance_name}} (.PAD(${{conn[\"pad\"]}}));",
+                  "        pad_signals:",
+                  "          - {name: chip2pad, size: 1, kind: input, conn_type: dynamic, default_reset_value: 0, default_static_value: \"1'b0\"}",
+                  "          - {name: output_en, size: 1, kind: input, conn_type: dynamic, default_reset_value: 0, default_static_value: \"1'b0\"}",
+                  "          - {name: rx_en, size: 1, kind: input, conn_type: dynamic, default_reset_value: 0, default_static_value: \"1'b0\"}",
+                  "          - {name: pad2chip, size: 1, kind: output, conn_type: dynamic, default_static_value: ~}",
+                  f"          - {{name: drive_strength_{t}, size: 2, kind: input, conn_type: static, default_reset_value: 0, default_static_value: \"2'b0\"}}",
+                  f"          - {{name: pull_{t}, size: 1, kind: input, conn_type: static, default_reset_value: 0, default_static_value: \"1'b0\"}}",
+                  "          - {name: pad, size: 1, kind: pad}"]
+    lines.append("    pad_list:")
+    for t in range(num_pad_types):
+        lines.append(f"      - {{name: pad_{t}, pad_type: pad_type_{t}, mux_groups: [all]}}")
+    lines.append("    port_groups:")
+    num_ports = max(1, num_connections // CONNECTIONS_PER_PORT)
+    for g in range(0, num_ports, PORTS_PER_GROUP):
+        lines += [f"      - name: group_{g // PORTS_PER_GROUP}", "        mux_groups: [all]",
+                  "        output_defaults: \"'0\"", "        ports:"]
+        for p in range(g, min(g + PORTS_PER_GROUP, num_ports)):
+            lines.append(f"          - {{name: port_{p}, connections: {{chip2pad: port_{p}_o, output_en: port_{p}_oe, "
+                         f"rx_en: \"~port_{p}_oe\", port_{p}_i: pad2chip}}}}")
+    return "\n".join(lines) + "\n"
+
+
+class LookupCounter:
+    def __init__(self):
+        self.lookups = 0
+        self.comparisons = 0
+
+
+@contextmanager
+def counted_lookups(linear: bool):
+    """
+    Count the pad signal lookups of the parse context. With linear=True, the lookups scan all pad signals of all
+    registered pad types like padrick did before the pad signals were indexed by name.
+    """
+    counter = LookupCounter()
+    indexed_lookup = ParseContext.find_pad_signal_instances
+
+    def counting_indexed_lookup(self, name):
+        counter.lookups += 1
+        counter.comparisons += 1
+        return indexed_lookup(self, name)
+
+    def counting_linear_lookup(self, name):
+        counter.lookups += 1
+        pad_signal_references = []
+        for pad_type in self._state.pad_types.values():
+            for pad_signal in pad_type.pad_signals:
+                counter.comparisons += 1
+                if pad_signal.name == name:
+                    pad_signal_references.append(pad_signal)
+        return pad_signal_references
+
+    ParseContext.find_pad_signal_instances = counting_linear_lookup if linear else counting_indexed_lookup
+    try:
+        yield counter
+    finally:
+        ParseContext.find_pad_signal_instances = indexed_lookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--repetitions', type=int, default=3)
+    parser.add_argument('--pad-types', type=int, default=50)
+    parser.add_argument('--connections', type=int, default=5000)
+    args = parser.parse_args()
+
+    # The generated ports are deliberately not connectable to distinct pads. Silence the resulting warnings.
+    logging.getLogger("padrick").setLevel(logging.ERROR)
+    warnings.simplefilter("ignore")
+    config_text = generate_config(args.pad_types, args.connections)
+    print(f"{args.pad_types} pad types, {args.connections} port connections (best of {args.repetitions}):")
+    print(f"{'mode':<8}  {'loading':>8}  {'validation':>10}  {'lookups':>8}  {'comparisons':>11}")
+    for mode in ['linear', 'indexed']:
+        load_timings = []
+        validation_timings = []
+        for _ in range(args.repetitions):
+            start = time.perf_counter()
+            config_data = ruamel.yaml.YAML(typ='rt').load(config_text)
+            load_timings.append(time.perf_counter() - start)
+            with counted_lookups(linear=mode == 'linear') as counter:
+                start = time.perf_counter()
+                with PARSE_CONTEXT.scope():
+                    Padframe.parse_obj(config_data)
+                validation_timings.append(time.perf_counter() - start)
+        print(f"{mode:<8}  {min(load_timings) * 1000:>6.0f}ms  {min(validation_timings) * 1000:>8.0f}ms  "
+              f"{counter.lookups:>8}  {counter.comparisons:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the two ways of building the reggen IpBlock of a pad domain's register file:
+
+* hjson: Render regfile.hjson.mako, write it to disk and parse it back with IpBlock.from_path (the old flow).
+* memory: Build the register file description from the padframe model and pass it to IpBlock.from_raw.
+
+Usage: python benchmarks/regfile_ip_block.py [-n REPETITIONS] CONFIG_FILE...
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from padrick.ConfigParser import parse_config
+from padrick.Generators.GeneratorSettings import RTLTemplates
+from padrick.Generators.RegisterFile import regfile_description
+from padrick.Model import Constants
+from padrick.Model.Padframe import Padframe
+from reggen.gen_rtl import gen_rtl
+from reggen.ip_block import IpBlock
+
+logger = logging.getLogger("padrick.benchmarks")
+
+
+def build_via_hjson(padframe, pad_domain, output_dir: Path) -> IpBlock:
+    regfile_template = RTLTemplates().regfile_hjson
+    regfile_template.render(output_dir, logger=logger, padframe=padframe, pad_domain=pad_domain,
+                            start_address_offset=hex(0), header_text="", hw_version=Constants.HARDWARE_VERSION)
+    return IpBlock.from_path(str(regfile_template.target_path(output_dir, padframe, pad_domain=pad_domain)), [])
+
+
+def build_in_memory(padframe, pad_domain) -> IpBlock:
+    return IpBlock.from_raw([], regfile_description(padframe, pad_domain, 0), "benchmark")
+
+
+def rendered_rtl(ip_block: IpBlock) -> dict:
+    rendered = {}
+    gen_rtl(ip_block, "", write_file=lambda path, content: rendered.__setitem__(path, content))
+    return rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('config_files', nargs='+', type=Path)
+    parser.add_argument('-n', '--repetitions', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for config_file in args.config_files:
+            padframe = parse_config(Padframe, config_file)
+            if not padframe:
+                raise SystemExit(f"Failed to parse {config_file}")
+            for pad_domain in padframe.pad_domains:
+                # Both paths must result in the exact same register file RTL
+                if rendered_rtl(build_via_hjson(padframe, pad_domain, Path(tmp_dir))) != \
+                        rendered_rtl(build_in_memory(padframe, pad_domain)):
+                    raise SystemExit(f"Register file RTL of pad domain {pad_domain.name} differs between both paths.")
+                start = time.perf_counter()
+                for _ in range(args.repetitions):
+                    build_via_hjson(padframe, pad_domain, Path(tmp_dir))
+                hjson_time = (time.perf_counter() - start) / args.repetitions
+                start = time.perf_counter()
+                for _ in range(args.repetitions):
+                    build_in_memory(padframe, pad_domain)
+                memory_time = (time.perf_counter() - start) / args.repetitions
+                print(f"{config_file} / {pad_domain.name} ({len(pad_domain.pad_list)} pads): "
+                      f"hjson {hjson_time * 1000:.1f} ms, memory {memory_time * 1000:.1f} ms, "
+                      f"speedup {hjson_time / memory_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure how padrick scales with the size of the padframe configuration.
+
+For every scale (total number of pads), a synthetic padframe is generated (see synthetic_padframe.py) and the
+following phases are measured:
+
+* parse: Loading the YAML configuration.
+* validate: Validating the loaded data with pydantic (including expansion).
+* expand: The part of the validation spent expanding pads, ports and port groups with 'multiple'.
+* rtl, driver, constraints, padlist: The individual generators. They run one after another on the same validated
+  padframe (like 'padrick generate all').
+
+The reported time is the minimum over all repetitions. The peak memory is the maximum amount of memory allocated on
+top of what was allocated at the start of the phase, measured with tracemalloc in a separate run (since tracemalloc
+slows down the measured code considerably).
+
+The results are written to a JSON file. Pass the JSON file of a previous run with --compare to print the relative
+changes. The script exits with status 1 if a phase got slower than --threshold times its baseline.
+
+The largest default scale (10000 pads) takes several minutes per repetition.
+
+Usage: python benchmarks/scalability.py [--scales 10 100 1000 10000] [-o results.json] [--compare baseline.json]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import ruamel.yaml
+
+import padrick
+from padrick.Generators.ConstraintsGenerator.ConstraintsGenerator import generate_constraints
+from padrick.Generators.ConstraintsGenerator.ConstraintsSpec import ConstraintsSpec
+from padrick.Generators.DocGenerator.DocGenerator import generate_padlist
+from padrick.Generators.DriverGenerator.DriverGenerator import generate_driver
+from padrick.Generators.GeneratorSettings import GeneratorSettings
+from padrick.Generators.RTLGenerator.RTLGenerator import generate_rtl
+from padrick.Model.ParseContext import PARSE_CONTEXT
+from padrick.Model.Padframe import Padframe
+from padrick.Profiling import enable_timings, disable_timings
+
+from synthetic_padframe import SyntheticPadframeParams, generate_padframe, generate_constraints_spec, dump_yaml, \
+    add_params_arguments, params_from_arguments
+
+PHASES = ('parse', 'validate', 'expand', 'rtl', 'driver', 'constraints', 'padlist')
+GENERATOR_PHASES = ('rtl', 'driver', 'constraints', 'padlist')
+EXPAND_PHASES = ('expand multiple pads', 'expand multiple ports', 'expand multiple port groups')
+
+
+class PhaseRecorder:
+    """
+    Records the duration and optionally the peak memory (with tracemalloc) of the phases of a single run.
+    """
+
+    def __init__(self, trace_memory: bool):
+        self.trace_memory = trace_memory
+        self.times: Dict[str, float] = {}
+        self.peak_memory: Dict[str, int] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield
+        self.times[name] = time.perf_counter() - start
+        if self.trace_memory:
+            self.peak_memory[name] = tracemalloc.get_traced_memory()[1] - start_memory
+
+
+def run_once(config_text: str, output_dir: Path, recorder: PhaseRecorder) -> Padframe:
+    settings = GeneratorSettings()
+    with recorder.phase('parse'):
+        config_data = ruamel.yaml.YAML(typ='rt').load(config_text)
+    timer = enable_timings(instrument_models=False)
+    try:
+        with recorder.phase('validate'), PARSE_CONTEXT.scope():
+            padframe = Padframe.parse_obj(config_data)
+    finally:
+        disable_timings()
+    # The expansion phases are nested in each other (e.g. expanded port groups expand their ports). Their self times
+    # add up to the total time spent expanding.
+    recorder.times['expand'] = sum(timer.stats[name].self_time for name in EXPAND_PHASES if name in timer.stats)
+    with recorder.phase('rtl'):
+        generate_rtl(settings.rtl_templates, padframe, output_dir / 'rtl', header_text="")
+    with recorder.phase('driver'):
+        generate_driver(settings.driver_templates, padframe, output_dir / 'driver', header_text="")
+    with recorder.phase('constraints'):
+        constraints_spec = ConstraintsSpec.parse_obj(generate_constraints_spec(padframe))
+        constraints_spec.link_with_pad_domain(padframe)
+        generate_constraints(settings.constraints_templates, padframe, constraints_spec, output_dir / 'constraints',
+                             header_text="")
+    with recorder.phase('padlist'):
+        generate_padlist(padframe, output_dir / 'padlist')
+    return padframe
+
+
+def run_scale(params: SyntheticPadframeParams, repetitions: int, measure_memory: bool) -> Dict[str, Any]:
+    config_text = dump_yaml(generate_padframe(params))
+    times: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    padframe = None
+    for _ in range(repetitions):
+        recorder = PhaseRecorder(trace_memory=False)
+        with tempfile.TemporaryDirectory() as output_dir:
+            padframe = run_once(config_text, Path(output_dir), recorder)
+        for phase, duration in recorder.times.items():
+            times[phase].append(duration)
+    result = {
+        'pads': params.pads,
+        'expanded_pads': sum(len(pad_domain.pad_list) for pad_domain in padframe.pad_domains),
+        'ports': sum(len(port_group.ports) for pad_domain in padframe.pad_domains
+                     for port_group in pad_domain.port_groups),
+        'config_size': len(config_text),
+        'phases': {phase: {'time': min(times[phase])} for phase in PHASES}
+    }
+    if measure_memory:
+        recorder = PhaseRecorder(trace_memory=True)
+        tracemalloc.start()
+        try:
+            with tempfile.TemporaryDirectory() as output_dir:
+                run_once(config_text, Path(output_dir), recorder)
+        finally:
+            tracemalloc.stop()
+        for phase, peak_memory in recorder.peak_memory.items():
+            result['phases'][phase]['peak_memory'] = peak_memory
+    return result
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=Path(__file__).parent, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: Dict[str, Any]):
+    header = f"{'pads':>8}  " + "  ".join(f"{phase:>11}" for phase in PHASES)
+    print(header)
+    for scale in results['results']:
+        print(f"{scale['pads']:>8}  " + "  ".join(f"{scale['phases'][phase]['time']:>10.3f}s" for phase in PHASES))
+
+
+def compare_results(baseline: Dict[str, Any], results: Dict[str, Any], threshold: float) -> bool:
+    """
+    Print the relative change of every phase with respect to the baseline. Returns True if no phase got slower (or
+    allocates more memory) than threshold times its baseline value.
+    """
+    ok = True
+    baseline_scales = {scale['pads']: scale for scale in baseline['results']}
+    print(f"Comparison with baseline {baseline.get('commit') or 'unknown commit'}:")
+    print(f"{'pads':>8}  {'phase':<12}  {'baseline':>10}  {'current':>10}  {'ratio':>6}  "
+          f"{'baseline mem':>13}  {'current mem':>13}  {'ratio':>6}")
+    for scale in results['results']:
+        baseline_scale = baseline_scales.get(scale['pads'])
+        if baseline_scale is None:
+            continue
+        for phase in PHASES:
+            current = scale['phases'].get(phase)
+            old = baseline_scale['phases'].get(phase)
+            if current is None or old is None:
+                continue
+            time_ratio = current['time'] / old['time'] if old['time'] > 0 else float('inf')
+            line = f"{scale['pads']:>8}  {phase:<12}  {old['time']:>9.3f}s  {current['time']:>9.3f}s  " \
+                   f"{time_ratio:>6.2f}"
+            regression = time_ratio > threshold
+            if 'peak_memory' in current and 'peak_memory' in old:
+                memory_ratio = current['peak_memory'] / old['peak_memory'] if old['peak_memory'] > 0 else 1.0
+                line += f"  {old['peak_memory'] / 2**20:>10.1f}MiB  {current['peak_memory'] / 2**20:>10.1f}MiB  " \
+                        f"{memory_ratio:>6.2f}"
+                regression = regression or memory_ratio > threshold
+            if regression:
+                line += "  <-- regression"
+                ok = False
+            print(line)
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[10, 100, 1000, 10000],
+                        help="Total number of pads of the synthetic padframes.")
+    parser.add_argument('-n', '--repetitions', type=int, default=3)
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help="Do not measure the peak memory of the phases.")
+    parser.add_argument('-o', '--output', type=Path, help="Write the results to this JSON file.")
+    parser.add_argument('--compare', type=Path, help="JSON file of a previous run to compare the results with.")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Ratio to the baseline above which a phase is reported as a regression.")
+    add_params_arguments(parser)
+    args = parser.parse_args()
+
+    # The synthetic padframes deliberately contain orphan pads and ports. Don't flood the output with warnings.
+    logging.getLogger("padrick").setLevel(logging.ERROR)
+    warnings.simplefilter('ignore')
+
+    results = {
+        'padrick_version': padrick.__version__,
+        'commit': git_commit(),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'repetitions': args.repetitions,
+        'params': {key: value for key, value in params_from_arguments(args, 0).as_dict().items() if key != 'pads'},
+        'results': []
+    }
+    for pads in args.scales:
+        print(f"Benchmarking padframe with {pads} pads...", file=sys.stderr)
+        results['results'].append(run_scale(params_from_arguments(args, pads), args.repetitions, args.memory))
+    print_results(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        if not compare_results(json.loads(args.compare.read_text()), results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
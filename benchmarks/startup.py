@@ -0,0 +1,114 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the startup time of padrick with and without the serialized parser tables (see padrick.Model.LazyParser).
+
+Every repetition runs in a fresh interpreter and measures the following phases:
+
+* import: Importing the CLI entry point (padrick.CLIEntryPoint).
+* parsers: Building the parsers of all padrick grammars (loading their tables or analyzing the grammar).
+* first parse: Parsing and validating a configuration file (examples/kraken_padframe.yml by default) without the
+  model cache.
+
+The parser tables are generated into a temporary directory so the source tree is left untouched. The reported time is
+the minimum over all repetitions.
+
+Usage: python benchmarks/startup.py [-n REPETITIONS] [CONFIG_FILE]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+KRAKEN_PADFRAME = Path(__file__).parent.parent / 'examples' / 'kraken_padframe.yml'
+TABLES_PACKAGE = 'padrick_startup_benchmark_tables'
+PHASES = ['import', 'parsers', 'first parse']
+
+# Runs in the child interpreter. argv: config file, tables package (empty to build the parsers from the grammars)
+CHILD_SCRIPT = r"""
+import json
+import sys
+import time
+from pathlib import Path
+
+start = time.perf_counter()
+# Select the parser tables before any other padrick module is imported
+import padrick.Model.LazyParser as LazyParser
+LazyParser.PARSER_TABLES_PACKAGE = sys.argv[2] or 'padrick_startup_benchmark_no_tables'
+import padrick.CLIEntryPoint
+import_done = time.perf_counter()
+# Importing padrick must not build any parser
+assert all(parser._parser is None for parser in LazyParser.PARSER_REGISTRY.values())
+
+parsers_start = time.perf_counter()
+import padrick.Model.SignalExpressionType
+import padrick.Model.TemplatedIdentifier
+import padrick.Model.TemplatedString
+for parser in LazyParser.PARSER_REGISTRY.values():
+    parser.parser
+parsers_done = time.perf_counter()
+
+from padrick.ConfigParser import parse_config
+from padrick.Model.Padframe import Padframe
+parse_start = time.perf_counter()
+if parse_config(Padframe, Path(sys.argv[1])) is None:
+    sys.exit(1)
+parse_done = time.perf_counter()
+print(json.dumps({'import': import_done - start, 'parsers': parsers_done - parsers_start,
+                  'first parse': parse_done - parse_start}))
+"""
+
+
+def measure(config_file: Path, tables_package: str, env: dict) -> dict:
+    result = subprocess.run([sys.executable, '-c', CHILD_SCRIPT, str(config_file), tables_package], env=env,
+                            check=True, stdout=subprocess.PIPE, text=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('config_file', type=Path, nargs='?', default=KRAKEN_PADFRAME)
+    parser.add_argument('-n', '--repetitions', type=int, default=5)
+    args = parser.parse_args()
+
+    from padrick.Model.LazyParser import build_parser_tables
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tables_dir = Path(tmp_dir) / TABLES_PACKAGE
+        build_parser_tables(tables_dir)
+        (tables_dir / '__init__.py').touch()
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [tmp_dir] + sys.path[1:]))
+        results = {}
+        for label, tables_package in [('grammar', ''), ('tables', TABLES_PACKAGE)]:
+            runs = [measure(args.config_file.resolve(), tables_package, env) for _ in range(args.repetitions)]
+            results[label] = {phase: min(run[phase] for run in runs) for phase in PHASES}
+
+    print(f"{'phase':<12}  {'grammar':>9}  {'tables':>9}  {'speedup':>7}")
+    for phase in PHASES + ['total']:
+        if phase == 'total':
+            grammar_time, tables_time = (sum(results[label].values()) for label in ('grammar', 'tables'))
+        else:
+            grammar_time, tables_time = results['grammar'][phase], results['tables'][phase]
+        print(f"{phase:<12}  {grammar_time:>8.3f}s  {tables_time:>8.3f}s  {grammar_time / tables_time:>6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
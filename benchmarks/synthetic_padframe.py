@@ -0,0 +1,257 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generate synthetic padframe configurations of arbitrary size.
+
+Every port group of a pad domain has its own mux group ('grp<n>') that contains all of its ports. The mux group density
+is controlled by the number of mux groups per dynamic pad: every dynamic pad can be connected to the ports of that many
+(consecutive) port groups. By default there are as many ports as dynamic pads, so the number of connectable
+(pad, port) pairs and thus the size of the generated pad multiplexers grows linearly with the number of pads. A
+fraction of the pads and ports is declared with 'multiple' instead of one entry per pad/port.
+
+Usage: python benchmarks/synthetic_padframe.py [OPTIONS] OUTPUT_FILE
+"""
+
+import argparse
+import io
+import math
+import random
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import ruamel.yaml
+
+from padrick.Model.Constants import MANIFEST_VERSION
+
+
+@dataclass
+class SyntheticPadframeParams:
+    pads: int = 100
+    pad_domains: int = 1
+    pad_types: int = 4
+    # Number of port groups per pad domain. If None, there are enough port groups to provide a port for every dynamic
+    # pad.
+    port_groups: Optional[int] = None
+    ports_per_group: int = 8
+    # Number of port groups (i.e. mux groups) the ports of which can be connected to a dynamic pad.
+    mux_groups_per_pad: int = 2
+    # Fraction of the pads and ports that are declared with 'multiple' in blocks of multiple_size.
+    multiple_fraction: float = 0.5
+    multiple_size: int = 8
+    # Fraction of the pads that are static (i.e. not muxed).
+    static_fraction: float = 0.1
+    seed: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _pad_type(idx: int) -> Dict[str, Any]:
+    return {
+        'name': f"pad_type_{idx}",
+        'description': f"Synthetic pad type {idx}",
+        'template': f"PAD_TYPE_{idx} ${{instance_name}} (\n"
+                    f"  .OE(${{conn['output_en']}}),\n"
+                    f"  .A(${{conn['chip2pad']}}),\n"
+                    f"  .Y(${{conn['pad2chip']}}),\n"
+                    f"  .DS(${{conn['drive_strength']}}),\n"
+                    f"  .PAD(${{conn['pad']}})\n"
+                    f");\n",
+        'pad_signals': [
+            {'name': 'chip2pad', 'size': 1, 'kind': 'input', 'conn_type': 'dynamic', 'default_reset_value': 0,
+             'default_static_value': "1'b0"},
+            {'name': 'output_en', 'size': 1, 'kind': 'input', 'conn_type': 'dynamic', 'default_reset_value': 0,
+             'default_static_value': "1'b0"},
+            {'name': 'pad2chip', 'size': 1, 'kind': 'output', 'conn_type': 'dynamic', 'default_static_value': None},
+            {'name': 'drive_strength', 'size': 2, 'kind': 'input', 'conn_type': 'static', 'default_reset_value': 0,
+             'default_static_value': "2'b00"},
+            {'name': 'pad', 'size': 1, 'kind': 'pad'},
+        ]
+    }
+
+
+def _split_into_blocks(count: int, multiple_fraction: float, multiple_size: int) -> List[int]:
+    """
+    Split count entries into a list of block sizes. Blocks of size > 1 are declared with 'multiple'.
+    """
+    num_multiple_blocks = int(count * multiple_fraction) // multiple_size if multiple_size > 1 else 0
+    return [multiple_size] * num_multiple_blocks + [1] * (count - num_multiple_blocks * multiple_size)
+
+
+def _entry_name(prefix: str, idx: int, block_size: int) -> str:
+    return f"{prefix}{idx}_{{i}}" if block_size > 1 else f"{prefix}{idx}"
+
+
+def _pad_domain(params: SyntheticPadframeParams, domain_idx: int, num_pads: int, rng: random.Random) -> Dict[str, Any]:
+    num_static_pads = int(num_pads * params.static_fraction)
+    num_dynamic_pads = num_pads - num_static_pads
+    num_port_groups = params.port_groups if params.port_groups is not None else \
+        max(1, math.ceil(num_dynamic_pads / params.ports_per_group))
+
+    pad_list = []
+    for idx in range(num_static_pads):
+        pad_list.append({
+            'name': f"pad_d{domain_idx}_static{idx}",
+            'pad_type': f"pad_type_{idx % params.pad_types}",
+            'is_static': True,
+            'connections': {
+                'chip2pad': f"static{idx}_o",
+                'output_en': "1'b1",
+                'pad2chip': f"static{idx}_i",
+                'drive_strength': f"static{idx}_ds_i",
+            }
+        })
+    for block_idx, block_size in enumerate(_split_into_blocks(num_dynamic_pads, params.multiple_fraction,
+                                                              params.multiple_size)):
+        first_group = rng.randrange(num_port_groups)
+        mux_groups = sorted({f"grp{(first_group + k) % num_port_groups}" for k in range(params.mux_groups_per_pad)})
+        pad = {
+            'name': _entry_name(f"pad_d{domain_idx}_", block_idx, block_size),
+            'description': f"Synthetic pad {block_idx}",
+            'pad_type': f"pad_type_{block_idx % params.pad_types}",
+            'mux_groups': mux_groups,
+            'connections': {'drive_strength': "2'b01"},
+        }
+        if block_size > 1:
+            pad['multiple'] = block_size
+        pad_list.append(pad)
+
+    port_groups = []
+    for group_idx in range(num_port_groups):
+        ports = []
+        for block_idx, block_size in enumerate(_split_into_blocks(params.ports_per_group, params.multiple_fraction,
+                                                                  params.multiple_size)):
+            signal_prefix = _entry_name(f"pg{group_idx}_p", block_idx, block_size)
+            port = {
+                'name': _entry_name("port", block_idx, block_size),
+                'description': "Synthetic port",
+                'mux_groups': [f"grp{group_idx}"],
+                'connections': {
+                    'chip2pad': f"{signal_prefix}_o",
+                    'output_en': f"{signal_prefix}_oe",
+                    f"{signal_prefix}_i": 'pad2chip',
+                }
+            }
+            if block_size > 1:
+                port['multiple'] = block_size
+            ports.append(port)
+        port_groups.append({
+            'name': f"group{group_idx}",
+            'output_defaults': "1'b0",
+            'ports': ports,
+        })
+
+    pad_domain = {
+        'name': f"domain{domain_idx}",
+        'pad_types': [_pad_type(idx) for idx in range(params.pad_types)],
+        'pad_list': pad_list,
+    }
+    if num_dynamic_pads > 0:
+        pad_domain['port_groups'] = port_groups
+    return pad_domain
+
+
+def generate_padframe(params: SyntheticPadframeParams) -> Dict[str, Any]:
+    """
+    Returns the (unvalidated) configuration data of a synthetic padframe with params.pads pads in total.
+    """
+    rng = random.Random(params.seed)
+    pad_domains = []
+    for domain_idx in range(params.pad_domains):
+        num_pads = params.pads // params.pad_domains + (1 if domain_idx < params.pads % params.pad_domains else 0)
+        pad_domains.append(_pad_domain(params, domain_idx, num_pads, rng))
+    return {
+        'name': "synthetic",
+        'manifest_version': MANIFEST_VERSION,
+        'pad_domains': pad_domains,
+    }
+
+
+def generate_constraints_spec(padframe, max_pads_per_mode: int = 64) -> Dict[str, Any]:
+    """
+    Returns the configuration data of a constraints spec for the given (validated) padframe. For every pad domain, a
+    mode pins up to max_pads_per_mode dynamic pads to the first port they can be connected to.
+    """
+    modes = []
+    for pad_domain in padframe.pad_domains:
+        pad_modes = []
+        for pad in pad_domain.pad_list:
+            if len(pad_modes) >= max_pads_per_mode:
+                break
+            if pad.is_static:
+                continue
+            connectable_ports = pad_domain.mux_group_index.get_connectable_ports(pad)
+            if connectable_ports:
+                port_group, port = connectable_ports[0]
+                pad_modes.append({'pad_inst': str(pad.name), 'port_sel': f"{port_group.name}.{port.name}",
+                                  'pad_cfg': {'output_en': 1}})
+        if pad_modes:
+            modes.append({'name': f"mode_{pad_domain.name}", 'pad_domain': str(pad_domain.name),
+                          'pad_mode': pad_modes})
+    return {'manifest_version': MANIFEST_VERSION, 'modes': modes}
+
+
+def dump_yaml(config_data: Dict[str, Any]) -> str:
+    yaml = ruamel.yaml.YAML(typ='safe', pure=True)
+    yaml.default_flow_style = False
+    yaml.sort_base_mapping_type_on_output = False
+    buffer = io.StringIO()
+    yaml.dump(config_data, buffer)
+    return buffer.getvalue()
+
+
+def add_params_arguments(parser: argparse.ArgumentParser):
+    """
+    Add command line arguments for all SyntheticPadframeParams (except the number of pads) to parser.
+    """
+    defaults = SyntheticPadframeParams()
+    parser.add_argument('--pad-domains', type=int, default=defaults.pad_domains)
+    parser.add_argument('--pad-types', type=int, default=defaults.pad_types, help="Pad types per pad domain.")
+    parser.add_argument('--port-groups', type=int, default=defaults.port_groups,
+                        help="Port groups per pad domain. Defaults to as many ports as there are dynamic pads.")
+    parser.add_argument('--ports-per-group', type=int, default=defaults.ports_per_group)
+    parser.add_argument('--mux-groups-per-pad', type=int, default=defaults.mux_groups_per_pad,
+                        help="Mux group density: Number of port groups a dynamic pad can be connected to.")
+    parser.add_argument('--multiple-fraction', type=float, default=defaults.multiple_fraction,
+                        help="Fraction of the pads and ports declared with 'multiple'.")
+    parser.add_argument('--multiple-size', type=int, default=defaults.multiple_size,
+                        help="Value of 'multiple' for pads and ports declared with 'multiple'.")
+    parser.add_argument('--static-fraction', type=float, default=defaults.static_fraction,
+                        help="Fraction of static pads.")
+    parser.add_argument('--seed', type=int, default=defaults.seed)
+
+
+def params_from_arguments(args: argparse.Namespace, pads: int) -> SyntheticPadframeParams:
+    return SyntheticPadframeParams(pads=pads, pad_domains=args.pad_domains, pad_types=args.pad_types,
+                                   port_groups=args.port_groups, ports_per_group=args.ports_per_group,
+                                   mux_groups_per_pad=args.mux_groups_per_pad, multiple_fraction=args.multiple_fraction,
+                                   multiple_size=args.multiple_size, static_fraction=args.static_fraction,
+                                   seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('output_file', type=Path)
+    parser.add_argument('--pads', type=int, default=SyntheticPadframeParams.pads, help="Total number of pads.")
+    add_params_arguments(parser)
+    args = parser.parse_args()
+    args.output_file.write_text(dump_yaml(generate_padframe(params_from_arguments(args, args.pads))))
+
+
+if __name__ == '__main__':
+    main()
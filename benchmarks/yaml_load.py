@@ -0,0 +1,76 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the time it takes to load padframe configurations with the round-trip YAML loader and with the fast loader
+parse_config uses on the success path (the safe loader, which is C accelerated if ruamel.yaml's C extension is
+installed).
+
+By default, examples/kraken_padframe.yml and a synthetic padframe with --pads pads (see synthetic_padframe.py) are
+loaded. The reported time is the minimum over all repetitions.
+
+Usage: python benchmarks/yaml_load.py [--pads PADS] [-n REPETITIONS] [CONFIG_FILE ...]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import ruamel.yaml
+
+from padrick.ConfigParser import load_yaml, FAST_YAML_TYPE
+from synthetic_padframe import SyntheticPadframeParams, generate_padframe, dump_yaml
+
+KRAKEN_PADFRAME = Path(__file__).parent.parent / 'examples' / 'kraken_padframe.yml'
+
+
+def measure(config_file: Path, typ: str, repetitions: int) -> float:
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        load_yaml(config_file, config_file.parent, typ=typ)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('config_files', type=Path, nargs='*')
+    parser.add_argument('--pads', type=int, default=10000, help="Number of pads of the synthetic padframe.")
+    parser.add_argument('-n', '--repetitions', type=int, default=3)
+    args = parser.parse_args()
+
+    fast_parser = ruamel.yaml.YAML(typ=FAST_YAML_TYPE).Parser
+    print(f"Fast loader: typ='{FAST_YAML_TYPE}' ({'C' if 'CParser' in fast_parser.__name__ else 'pure Python'} "
+          f"parser)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_files = args.config_files
+        if not config_files:
+            synthetic_config = Path(tmp_dir) / f'synthetic_{args.pads}.yml'
+            synthetic_config.write_text(dump_yaml(generate_padframe(SyntheticPadframeParams(pads=args.pads))))
+            config_files = [KRAKEN_PADFRAME, synthetic_config]
+        print(f"{'config file':<30}  {'size':>10}  {'rt':>9}  {FAST_YAML_TYPE:>9}  {'speedup':>7}")
+        for config_file in config_files:
+            rt_time = measure(config_file, 'rt', args.repetitions)
+            fast_time = measure(config_file, FAST_YAML_TYPE, args.repetitions)
+            size = f"{config_file.stat().st_size / 1024:.0f} KiB"
+            print(f"{config_file.name:<30}  {size:>10}  {rt_time:>8.3f}s  {fast_time:>8.3f}s  "
+                  f"{rt_time / fast_time:>6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
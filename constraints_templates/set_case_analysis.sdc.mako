@@ -0,0 +1,66 @@
+## Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+##
+## Copyright (C) 2021-2022 ETH Zürich
+## 
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+% for line in header_text.splitlines():
+# ${line}
+% endfor
+
+# Use current_instance <pad_mux_inst> to set the correct scope for applying the constraints
+
+<%
+from typing import Generator
+from natsort import natsorted
+from math import ceil, log2
+
+def as_bin(value:int, width:int):
+   for c in "{value:0{width}b}".format(value=value, width=width):
+     yield c
+
+def sort_by_name(seq):
+    return natsorted(seq, lambda x: x.name)
+
+def get_sel_index_width(pad, port_group, port, pad_domain):
+    index = pad_domain.mux_group_index
+    sel_value = index.get_select_value(pad.mux_groups, port_group, port)
+    return sel_value, ceil(log2(len(index.get_connectable_ports(pad)) + 1))
+%>
+# Mode: ${constraints_mode.name}
+# Pad Domain: ${constraints_mode.pad_domain.name}
+
+% for pad_mode in constraints_mode.pad_mode:
+% if pad_mode.port_sel:
+# Pad ${pad_mode.pad_inst.name} -> ${pad_mode.port_sel[0].name}.${pad_mode.port_sel[1].name}
+<%
+    sel_value, width = get_sel_index_width(pad_mode.pad_inst, pad_mode.port_sel[0], pad_mode.port_sel[1], constraints_mode.pad_domain)
+%>
+% for i, bit in enumerate(as_bin(sel_value, width)):
+set_case_analysis ${bit} i_${constraints_mode.pad_domain.name}/i_${constraints_mode.pad_domain.name}_muxer/i_regfile/u_${pad_mode.pad_inst.name}_mux_sel/q${f"\[{i}\]" if width > 1 else ""}
+% endfor
+
+% else:
+# Pad ${pad_mode.pad_inst.name}
+% endif
+% if pad_mode.pad_cfg:
+# Pad Signal Config (${pad_mode.pad_inst.name})
+% for ps, value in pad_mode.pad_cfg.items():
+# ${ps.name} -> ${value}
+% for i, bit in enumerate(as_bin(value, ps.size)):
+set_case_analysis ${bit} i_${constraints_mode.pad_domain.name}/i_${constraints_mode.pad_domain.name}_muxer/i_regfile/u_${pad_mode.pad_inst.name}_cfg_${ps.name}/q${f"\[{i}\]" if ps.size > 1 else ""}
+%endfor
+
+% endfor
+% endif
+% endfor
\ No newline at end of file
@@ -0,0 +1,35 @@
+## Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+##
+## Copyright (C) 2021-2022 ETH Zürich
+## 
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+% for line in header_text.splitlines():
+# ${line}
+% endfor
+# IPApprox dependencies for ${padframe.name}
+common_cells:
+  commit: v1.21.0
+  domain: [cluster, soc]
+  server: https://github.com
+  group: pulp-platform
+register_interface:
+  commit: v0.2.1
+  domain: [soc]
+  server: https://github.com
+  group: pulp-platform
+axi/axi:
+  commit: v0.27.0
+  domain: [cluster, soc]
+  server: https://github.com
+  group: pulp-platform
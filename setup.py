@@ -8,9 +8,11 @@
     Learn more under: https://pyscaffold.org/
 """
 import sys
+from pathlib import Path
 
 from pkg_resources import VersionConflict, require
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 try:
     require('setuptools>=38.3')
@@ -19,5 +21,20 @@ except VersionConflict:
     sys.exit(1)
 
 
+class BuildPyWithParserTables(build_py):
+    """Serialize the Lark parser tables into the build directory to speed up the startup of padrick."""
+
+    def run(self):
+        super().run()
+        sys.path.insert(0, str(Path(__file__).parent / "src"))
+        try:
+            from padrick.Model.LazyParser import build_parser_tables
+        except ImportError as e:
+            print(f"Warning: Skipping generation of serialized parser tables ({e}). Padrick will build the parsers "
+                  f"at runtime instead.")
+            return
+        build_parser_tables(Path(self.build_lib) / "padrick" / "Model" / "ParserTables")
+
+
 if __name__ == "__main__":
-    setup(use_pyscaffold=True)
+    setup(use_pyscaffold=True, cmdclass={'build_py': BuildPyWithParserTables})
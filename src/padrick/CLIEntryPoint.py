@@ -32,9 +32,12 @@ from padrick.Generators.FuseSoCGenerator.FuseSoCGenerator import generate_core
 from padrick.Generators.GeneratorSettings import RTLTemplates
 from padrick.Generators.RTLGenerator.RTLGenerator import generate_rtl
 from padrick.Generators import CLIGeneratorCommands
-from padrick.ConfigParser import parse_config
+from padrick.ConfigParser import parse_config, INCLUDE_JOBS_META_KEY
+from padrick.Generators.PadrickTemplate import set_template_module_directory
+from padrick.ModelCache import ModelCache, MODEL_CACHE_META_KEY, get_model_cache, default_cache_dir
+from padrick.Profiling import ProfilingSession
 from padrick.Model.Padframe import Padframe
-from padrick.Model.PadSignal import Signal
+from padrick.Model.PadSignal import Signal, PadSignal
 from padrick.Model.SignalExpressionType import SignalExpressionType
 
 logger = logging.getLogger("padrick")
@@ -45,10 +48,46 @@ _CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
 @click.group(context_settings=_CONTEXT_SETTINGS)
 @click.version_option()
-def cli():
+@click.option('--cache/--no-cache', default=True, show_default=True, envvar='PADRICK_CACHE',
+              help="Cache validated padframe configurations and compiled templates on disk and reuse them if their "
+                   "sources did not change.")
+@click.option('--cache-dir', type=click.Path(file_okay=False, dir_okay=True), envvar='PADRICK_CACHE_DIR',
+              help="Directory for padrick's caches. Defaults to $XDG_CACHE_HOME/padrick.")
+@click.option('--cache-size', type=click.IntRange(min=0), default=256, show_default=True, envvar='PADRICK_CACHE_SIZE',
+              help="Maximum size of the configuration cache in MiB. The least recently used entries are evicted first.")
+@click.option('--include-jobs', type=click.IntRange(min=0), default=1, show_default=True,
+              envvar='PADRICK_INCLUDE_JOBS',
+              help="Number of threads used to read and parse the files matched by a wildcard !include pattern "
+                   "concurrently. 0 uses the default number of threads of Python's ThreadPoolExecutor.")
+@click.option('--timings', '--profile', 'timings', is_flag=True, default=False,
+              help="Print a summary of the time spent in the individual phases (YAML loading, include resolution, "
+                   "validation per model class, expansion of multiple pads/ports, template rendering, reggen and file "
+                   "writes) to stderr. Phases executed in worker processes (--jobs) are not accounted.")
+@click.option('--profile-out', type=click.Path(dir_okay=False, file_okay=True, writable=True),
+              help="Write profiling data of the command to the given file. If the file name ends with .json, a Chrome "
+                   "trace event file of the timed phases is written (open it with chrome://tracing or Perfetto). "
+                   "Otherwise, the cProfile statistics of the whole command are written (see python -m pstats).")
+@click.option('--memory-report', is_flag=True, default=False,
+              help="Trace all memory allocations with tracemalloc. Prints the peak memory of every phase and, after "
+                   "validating the configuration, the live objects per type and the top allocation sites to stderr. "
+                   "Slows padrick down considerably. Use it with --no-cache to account the validation.")
+@click.pass_context
+def cli(ctx, cache, cache_dir, cache_size, include_jobs, timings, profile_out, memory_report):
     """
     Generate padframes for SoC
     """
+    if timings or profile_out or memory_report:
+        profiling_session = ProfilingSession(timings, Path(profile_out) if profile_out else None,
+                                             print_memory_report=memory_report)
+        profiling_session.start()
+        ctx.call_on_close(profiling_session.stop)
+    if cache:
+        cache_root = Path(cache_dir) if cache_dir else default_cache_dir()
+        ctx.meta[MODEL_CACHE_META_KEY] = ModelCache(cache_root/'models', max_size=cache_size*1024*1024)
+        set_template_module_directory(cache_root/'templates')
+    else:
+        ctx.meta[MODEL_CACHE_META_KEY] = None
+    ctx.meta[INCLUDE_JOBS_META_KEY] = include_jobs
 
 @cli.command()
 @click.option('--append/--overwrite', help="Append the completion code to the file", default=None)
@@ -70,7 +109,7 @@ def validate(file):
     """ Parse and validate the given config file
     """
     with click_spinner.spinner():
-        model = parse_config(Padframe, Path(file))
+        model = parse_config(Padframe, Path(file), cache=get_model_cache())
         if model != None:
             click.echo(f"Successfully parsed configuration file.")
         else:
@@ -82,7 +121,7 @@ def validate(file):
 def config(file):
     """ Print the parsed padframe configuration file """
     with click_spinner.spinner():
-        model = parse_config(Padframe, Path(file))
+        model = parse_config(Padframe, Path(file), cache=get_model_cache())
     if model != None:
         class ModelEncoder(json.JSONEncoder):
             def default(self, o):
@@ -101,7 +140,7 @@ def config(file):
                         return None
                     else:
                         return o.expression
-                elif isinstance(o, Signal):
+                elif isinstance(o, (Signal, PadSignal)):
                     return o.name
                 else:
                     return o
@@ -120,7 +159,7 @@ def fusesoc_gen(config_file):
     Check the documentation for more information about available FuseSoC Generator parameters.
     """
     click.echo("Padrick started in FuseSoC generator mode.")
-    generate_core(Path(config_file))
+    generate_core(Path(config_file), cache=get_model_cache())
     click.echo("Finished core generation")
 
 # Register first level subcommand
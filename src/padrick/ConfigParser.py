@@ -22,7 +22,12 @@ import click_log
 from pydantic import ValidationError, BaseModel
 from ruamel.yaml.comments import CommentedMap
 from yamlinclude import YamlIncludeConstructor
-from yamlinclude.constructor import IgnoreIncludeConstructor
+from yamlinclude.constructor import IgnoreIncludeConstructor, register_include_constructor
+
+from padrick.Model.PadListCSV import PadListCSVReader
+from padrick.Model.ParseContext import PARSE_CONTEXT
+from padrick.ModelCache import ModelCache, record_validation_warnings
+from padrick.Profiling import timed, timed_function, get_timer, memory_report
 
 logger = logging.getLogger("padrick.ConfigParser")
 click_log.basic_config(logger)
@@ -76,39 +81,102 @@ def get_file_location(config_data: CommentedMap, error_location: List[Union[str,
     return location, subtree
 
 
+# Type of the ruamel.yaml loader used to parse config files. The safe loader uses the C implementation of ruamel.yaml
+# if it is available. It is much faster than the round-trip loader but does not keep track of line numbers, which are
+# only needed to report validation errors.
+FAST_YAML_TYPE = 'safe'
+
+INCLUDE_JOBS_META_KEY = 'padrick.include_jobs'
+
+
+def get_include_jobs() -> int:
+    """
+    Returns the number of threads used to load the files matched by wildcard !include patterns as configured on the
+    command line (1 if we are not running within a click command).
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return 1
+    return ctx.meta.get(INCLUDE_JOBS_META_KEY, 1)
+
+
+def load_yaml(config_file: Path, include_base_dir: Path, ignore_includes: bool = False, typ: str = 'rt',
+              include_jobs: int = 1) -> Tuple[object, Union[YamlIncludeConstructor, Type[IgnoreIncludeConstructor]]]:
+    """
+    Load the YAML config file with a ruamel.yaml loader of the given type (e.g. 'rt' or 'safe') and resolve its
+    !include directives relative to include_base_dir. Included YAML files are loaded with the same type of loader. The
+    files matched by a wildcard include are loaded concurrently by include_jobs threads (0 uses the default number of
+    threads).
+
+    Returns the loaded data and the include constructor (which knows the included files).
+
+    Raises YAMLError if the config file or one of the included files is malformed.
+    """
+    yaml = ruamel.yaml.YAML(typ=typ)
+    # enable support for !include directives (see pyyaml-include package)
+    if not ignore_includes:
+        include_constructor = YamlIncludeConstructor(base_dir=str(include_base_dir), yaml_typ=typ,
+                                                     max_workers=include_jobs, readers={'pad_list': PadListCSVReader})
+    else:
+        include_constructor = IgnoreIncludeConstructor
+    if get_timer() is not None and not ignore_includes:
+        include_constructor.load = timed_function("include resolution", include_constructor.load)
+    register_include_constructor(yaml, include_constructor)
+    with config_file.open() as file, timed("yaml load", file=config_file, loader=typ):
+        return yaml.load(file), include_constructor
+
+
 T = TypeVar('T', bound=BaseModel)
 
-def parse_config(cls: T, config_file: Path, include_base_dir: Optional[Path] = None, ignore_includes = False) -> Union[T, None]:
-    with config_file.open() as file:
-        try:
-            yaml = ruamel.yaml.YAML(typ='rt')
-            # enable support for !include directives (see pyyaml-include package)
-            if not include_base_dir:
-                include_base_dir = config_file.parent
-            if not ignore_includes:
-                include_constructor = YamlIncludeConstructor(base_dir=str(include_base_dir))
-            else:
-                include_constructor = IgnoreIncludeConstructor
-            yaml.register_class(include_constructor)
-            config_data = yaml.load(file)
-            #config_data = ruamel.yaml.load(file, Loader=ruamel.yaml.RoundTripLoader)
-        except YAMLError as e:
-            logger.error(f"Error while parsing config_file:\n{e}")
-            return None
+def parse_config(cls: T, config_file: Path, include_base_dir: Optional[Path] = None, ignore_includes = False,
+                 cache: Optional[ModelCache] = None, include_jobs: Optional[int] = None) -> Union[T, None]:
+    if not include_base_dir:
+        include_base_dir = config_file.parent
+    if include_jobs is None:
+        include_jobs = get_include_jobs()
+    if cache and not ignore_includes:
+        with timed("model cache load"):
+            model = cache.load(cls, config_file, include_base_dir)
+        if model is not None:
+            memory_report(f"loading {config_file} from the cache")
+            return model
+    else:
+        cache = None
+    try:
         try:
+            config_data, include_constructor = load_yaml(config_file, include_base_dir, ignore_includes,
+                                                         FAST_YAML_TYPE, include_jobs)
+        except YAMLError:
+            # Let the round-trip loader report the error. Its messages are more detailed than the ones of the C loader.
+            config_data, include_constructor = load_yaml(config_file, include_base_dir, ignore_includes, 'rt',
+                                                         include_jobs)
+    except YAMLError as e:
+        logger.error(f"Error while parsing config_file:\n{e}")
+        return None
+    try:
+        with PARSE_CONTEXT.scope(), record_validation_warnings() as warnings:
             model = cls.parse_obj(config_data)
-            return model
-        except ValidationError as e:
-            logger.error(f"Encountered {len(e.errors())} validation errors while parsing the configuration file:")
-            for error in e.errors():
-                if error['type'] == 'value_error.extra':
-                    error['msg'] = f'Unknown field {error["loc"][-1]}. Did you mispell the field name?'
-                if error['type'] == 'value_error.missing':
-                    error['msg'] = f'Missing field \'{error["loc"][-1]}\''
-                # error_path = get_human_readable_error_path(config_data, error["loc"])
-                (line, column), subtree = get_file_location(config_data, error["loc"])
-                error_context = get_error_context(config_file, line, column, context_after=10)
-                logger.error(f"Line {line}, Column {column}:")
-                logger.error(f"...\n{error_context}\n...")
-                logger.error(f"Error: {error['msg']}")
-            return None
+        memory_report(f"validating {config_file}")
+        if cache:
+            with timed("model cache store"):
+                cache.store(model, config_file, include_base_dir, include_constructor.included_files,
+                            include_constructor.include_patterns, warnings)
+        return model
+    except ValidationError as e:
+        if not isinstance(config_data, CommentedMap):
+            # The fast loader does not keep track of line numbers. Parse the config file again in round-trip mode to
+            # map the errors back to their location in the file.
+            config_data, _ = load_yaml(config_file, include_base_dir, ignore_includes, 'rt', include_jobs)
+        logger.error(f"Encountered {len(e.errors())} validation errors while parsing the configuration file:")
+        for error in e.errors():
+            if error['type'] == 'value_error.extra':
+                error['msg'] = f'Unknown field {error["loc"][-1]}. Did you mispell the field name?'
+            if error['type'] == 'value_error.missing':
+                error['msg'] = f'Missing field \'{error["loc"][-1]}\''
+            # error_path = get_human_readable_error_path(config_data, error["loc"])
+            (line, column), subtree = get_file_location(config_data, error["loc"])
+            error_context = get_error_context(config_file, line, column, context_after=10)
+            logger.error(f"Line {line}, Column {column}:")
+            logger.error(f"...\n{error_context}\n...")
+            logger.error(f"Error: {error['msg']}")
+        return None
@@ -28,6 +28,7 @@ from mako.template import Template
 
 from padrick.Generators.ConstraintsGenerator.ConstraintsGenerator import generate_constraints
 from padrick.Generators.ConstraintsGenerator.ConstraintsSpec import ConstraintsGenException, ConstraintsSpec
+from padrick.Generators.GeneratedFiles import GENERATED_FILES
 from padrick.Generators.GeneratorSettings import GeneratorSettings, RTLTemplates, DriverTemplates, DocTemplates
 from padrick.Model.Padframe import Padframe
 
@@ -36,8 +37,11 @@ yaml = YAML()
 
 import padrick
 from padrick.ConfigParser import parse_config
+from padrick.ModelCache import get_model_cache
 from padrick.Generators.DocGenerator.DocGenerator import generate_padlist, DocGenException
-from padrick.Generators.DriverGenerator.DriverGenerator import generate_driver
+from padrick.Generators.DriverGenerator.DriverGenerator import generate_driver, DriverGenException
+from padrick.Generators.MultiTargetGenerator import generate_targets, MultiTargetGenException, GENERATOR_TARGETS, \
+    DEFAULT_GENERATOR_TARGETS
 from padrick.Generators.RTLGenerator.RTLGenerator import generate_rtl, RTLGenException
 from padrick.Generators.PadrickTemplate import TemplateRenderException, PadrickTemplate
 from click import UsageError, ClickException
@@ -53,7 +57,12 @@ pass_generator_settings = click.make_pass_decorator(GeneratorSettings, ensure=Tr
 @click.option('-s','--generator_settings_file', type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True), help="A yaml file containing custom settings for the generate command.")
 @click.pass_context
 def generate(ctx, generator_settings_file: str):
-    """ Generate various output files for the provided pad_frame configuration"""
+    """ Generate various output files for the provided pad_frame configuration
+
+    Generated files are only written if their content changed to keep the modification time of unchanged outputs
+    stable.
+    """
+    GENERATED_FILES.reset()
     if generator_settings_file:
         generator_settings = parse_config(GeneratorSettings, Path(generator_settings_file))
         if not generator_settings:
@@ -118,15 +127,18 @@ def template_customization(output):
 @click.option('--header', type=click.Path(dir_okay=False, file_okay=True, exists=True), help="A text file who's content (extended with appropriate comment characters) is inserted as the header in each auto-generated file. "
                                                                                              "Useful for copyright and author information.")
 @click.option('--version-string/--no-version-string', default=True, show_default=True, help="Append current version of padrick to the header of each generated file.")
+@click.option('--regfile-hjson/--no-regfile-hjson', default=True, show_default=True, help="Emit the hjson description of the configuration register files.")
+@click.option('-j', '--jobs', type=click.IntRange(min=0), default=1, show_default=True, help="Number of processes used to generate the RTL of the individual pad domains in parallel. "
+                                                                                              "0 uses one process per CPU core.")
 @click_log.simple_verbosity_option(logger)
 @pass_generator_settings
-def rtl(generator_settings: GeneratorSettings, config_file: str, output: str, header, version_string):
+def rtl(generator_settings: GeneratorSettings, config_file: str, output: str, header, version_string, regfile_hjson, jobs):
     """
     Generate SystemVerilog implementation from the padframe configuration.
     """
     logger.info("Parsing configuration file...")
     with click_spinner.spinner():
-        padframe = parse_config(Padframe, Path(config_file))
+        padframe = parse_config(Padframe, Path(config_file), cache=get_model_cache())
     if not padframe:
         raise UsageError("Failed to parse the configuration file")
 
@@ -147,13 +159,16 @@ def rtl(generator_settings: GeneratorSettings, config_file: str, output: str, he
     header_text = "\n\n".join(header_sections)
     with click_spinner.spinner():
         try:
-            generate_rtl(generator_settings.rtl_templates, padframe, Path(output), header_text)
+            if not regfile_hjson:
+                generator_settings.rtl_templates.regfile_hjson.skip_generation = True
+            generate_rtl(generator_settings.rtl_templates, padframe, Path(output), header_text, jobs=jobs)
         except (RTLGenException, TemplateRenderException) as e:
             raise ClickException("RTL Generation failed") from e
         except Exception as e:
             logger.error("Padrick crashed while generating RTL :-(")
             raise e
         logger.info(f"Successfully generated RTL files in {output}")
+        logger.info(GENERATED_FILES.summary())
 
 @generate.command()
 @click.argument('config_file', type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True))
@@ -161,15 +176,16 @@ def rtl(generator_settings: GeneratorSettings, config_file: str, output: str, he
 @click.option('--header', type=click.Path(dir_okay=False, file_okay=True, exists=True), help="A text file who's content (extended with appropriate comment characters) is inserted as the header in each auto-generated file. "
                                                                                              "Useful for copyright and author information.")
 @click.option('--version-string/--no-version-string', default=True, show_default=True, help="Append current version of padrick to the header of each generated file.")
+@click.option('--regfile-hjson/--no-regfile-hjson', default=True, show_default=True, help="Emit the hjson description of the configuration register files.")
 @click_log.simple_verbosity_option(logger)
 @pass_generator_settings
-def driver(generator_settings: GeneratorSettings, config_file: str, output: str, header, version_string):
+def driver(generator_settings: GeneratorSettings, config_file: str, output: str, header, version_string, regfile_hjson):
     """
     Generate C driver to interact with the padframe.
     """
     logger.info("Parsing configuration file...")
     with click_spinner.spinner():
-        padframe = parse_config(Padframe, Path(config_file))
+        padframe = parse_config(Padframe, Path(config_file), cache=get_model_cache())
     logger.info("Parsing successful. Generating C-Driver...")
     if not Path(output).exists():
         logger.debug("Output directory does not exist. Creating new one.")
@@ -187,6 +203,8 @@ def driver(generator_settings: GeneratorSettings, config_file: str, output: str,
     header_text = "\n\n".join(header_sections)
     with click_spinner.spinner():
         try:
+            if not regfile_hjson:
+                generator_settings.driver_templates.regfile_hjson.skip_generation = True
             generate_driver(generator_settings.driver_templates, padframe, Path(output), header_text)
         except (RTLGenException, TemplateRenderException) as e:
             raise ClickException("C Driver Generation failed") from e
@@ -194,6 +212,7 @@ def driver(generator_settings: GeneratorSettings, config_file: str, output: str,
             logger.error("Padrick crashed while generating the C Driver :-(")
             raise e
         logger.info(f"Successfully generated C driver files in {output}")
+        logger.info(GENERATED_FILES.summary())
 
 @generate.command()
 @click.argument('config_file', type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True))
@@ -227,7 +246,7 @@ def constraints(generator_settings: GeneratorSettings, config_file: str, constra
     logger.info("Parsing configuration files...")
     with click_spinner.spinner():
         constraints_specs: ConstraintsSpec = parse_config(ConstraintsSpec, Path(constraints_spec_file))
-        padframe = parse_config(Padframe, Path(config_file))
+        padframe = parse_config(Padframe, Path(config_file), cache=get_model_cache())
     if not padframe or not constraints_specs:
         raise click.UsageError("Failed to parse configuration file.")
 
@@ -250,6 +269,7 @@ def constraints(generator_settings: GeneratorSettings, config_file: str, constra
             logger.error("Padrick crashed while generating the constraints :-(")
             raise e
         logger.info(f"Successfully generated constraints.")
+        logger.info(GENERATED_FILES.summary())
 
 
 @generate.command()
@@ -263,7 +283,7 @@ def padlist(generator_settings: GeneratorSettings, config_file: str, output: str
     """
     logger.info("Parsing configuration file...")
     with click_spinner.spinner():
-        padframe = parse_config(Padframe, Path(config_file))
+        padframe = parse_config(Padframe, Path(config_file), cache=get_model_cache())
     logger.info("Parsing successful. Generating pad list...")
     if not Path(output).exists():
         logger.debug("Output directory does not exist. Creating new one.")
@@ -280,6 +300,94 @@ def padlist(generator_settings: GeneratorSettings, config_file: str, output: str
             logger.error("Padrick crashed while generating the padlist :-(")
             raise e
         logger.info(f"Successfully generated the padlist CSV file in {output}")
+        logger.info(GENERATED_FILES.summary())
+
+
+def _parse_targets(ctx, param, value):
+    if value is None:
+        return None
+    targets = [target.strip() for target in value.split(",") if target.strip()]
+    for target in targets:
+        if target not in GENERATOR_TARGETS:
+            raise click.BadParameter(f"Unknown target '{target}'. Valid targets are: {', '.join(GENERATOR_TARGETS)}")
+    if not targets:
+        raise click.BadParameter("At least one target is required.")
+    return list(dict.fromkeys(targets))
+
+
+@generate.command(name='all')
+@click.argument('config_file', type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True))
+@click.option('-o', '--output', type=click.Path(dir_okay=True, file_okay=False), default=".", help="Location where to save the generated files. Each target is generated into its own subdirectory (e.g. rtl/ or driver/).")
+@click.option('-t', '--targets', callback=_parse_targets, help=f"Comma separated list of targets to generate. Valid targets are: {', '.join(GENERATOR_TARGETS)}. "
+                                                               f"Defaults to {','.join(DEFAULT_GENERATOR_TARGETS)} (and constraints if a constraints specification file is provided).")
+@click.option('-c', '--constraints-spec', 'constraints_spec_file', type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True), help="Case specification file for the constraints target.")
+@click.option('--header', type=click.Path(dir_okay=False, file_okay=True, exists=True), help="A text file who's content (extended with appropriate comment characters) is inserted as the header in each auto-generated file. "
+                                                                                             "Useful for copyright and author information.")
+@click.option('--version-string/--no-version-string', default=True, show_default=True, help="Append current version of padrick to the header of each generated file.")
+@click.option('--regfile-hjson/--no-regfile-hjson', default=True, show_default=True, help="Emit the hjson description of the configuration register files.")
+@click.option('-j', '--jobs', type=click.IntRange(min=0), default=1, show_default=True, help="Number of processes used to generate the targets in parallel. 0 uses one process per CPU core.")
+@click_log.simple_verbosity_option(logger)
+@pass_generator_settings
+def generate_all(generator_settings: GeneratorSettings, config_file: str, output: str, targets, constraints_spec_file, header, version_string, regfile_hjson, jobs):
+    """
+    Generate several outputs (RTL, C driver, padlist and constraints) at once.
+
+    The configuration file is only parsed once and the register files of the pad domains are shared between the RTL
+    and the driver target. This is considerably faster than invoking the individual generate commands one after the
+    other.
+    """
+    if targets is None:
+        targets = list(DEFAULT_GENERATOR_TARGETS)
+        if constraints_spec_file:
+            targets.append('constraints')
+    if 'constraints' in targets and not constraints_spec_file:
+        raise UsageError("The constraints target requires a constraints specification file (--constraints-spec).")
+
+    header_sections = []
+    if version_string:
+        header_sections.append(f"File auto-generated by Padrick {padrick.__version__}")
+
+    if header:
+        logger.debug(f"Using text in {header} for headers.")
+        header_sections.append(Path(header).read_text())
+
+    header_text = "\n\n".join(header_sections)
+    logger.info("Parsing configuration file...")
+    with click_spinner.spinner():
+        padframe = parse_config(Padframe, Path(config_file), cache=get_model_cache())
+        constraints_specs = None
+        if padframe and 'constraints' in targets:
+            constraints_specs = parse_config(ConstraintsSpec, Path(constraints_spec_file))
+            if not constraints_specs:
+                raise UsageError("Failed to parse the constraints specification file")
+    if not padframe:
+        raise UsageError("Failed to parse the configuration file")
+    if constraints_specs:
+        try:
+            constraints_specs.link_with_pad_domain(padframe)
+        except ConstraintsGenException as e:
+            logger.error(e)
+            raise ClickException("Constraints Spec parsing failed") from e
+
+    logger.info(f"Parsing successful. Generating {', '.join(targets)}...")
+    if not Path(output).exists():
+        logger.debug("Output directory does not exist. Creating new one.")
+        os.makedirs(output, exist_ok=True)
+    with click_spinner.spinner():
+        try:
+            if not regfile_hjson:
+                generator_settings.rtl_templates.regfile_hjson.skip_generation = True
+                generator_settings.driver_templates.regfile_hjson.skip_generation = True
+            generate_targets(generator_settings, padframe, targets, Path(output), header_text,
+                             constraints_spec=constraints_specs, jobs=jobs)
+        except (MultiTargetGenException, RTLGenException, DriverGenException, DocGenException,
+                ConstraintsGenException, TemplateRenderException) as e:
+            raise ClickException("Generation failed") from e
+        except Exception as e:
+            logger.error("Padrick crashed while generating the output files :-(")
+            raise e
+        logger.info(f"Successfully generated {', '.join(targets)} in {output}")
+        logger.info(GENERATED_FILES.summary())
 
 
 @generate.command()
@@ -297,7 +405,7 @@ def custom(config_file:str, template, output):
     """
     logger.info("Parsing configuration file...")
     with click_spinner.spinner():
-        padframe = parse_config(Padframe, Path(config_file))
+        padframe = parse_config(Padframe, Path(config_file), cache=get_model_cache())
     if not padframe:
         raise UsageError("Failed to parse the configuration file")
     logger.info("Parsing successful.")
@@ -22,27 +22,16 @@
 
 <%
 from typing import Generator
-from natsort import natsorted
 from math import ceil, log2
 
 def as_bin(value:int, width:int):
    for c in "{value:0{width}b}".format(value=value, width=width):
      yield c
 
-def sort_by_name(seq):
-    return natsorted(seq, lambda x: x.name)
-
 def get_sel_index_width(pad, port_group, port, pad_domain):
-    idx = 1
-    sel_value = 0
-    mux_groups = pad.mux_groups
-    for p_group in sort_by_name(pad_domain.port_groups):
-      for p in sort_by_name(p_group.ports):
-        if p.mux_groups.intersection(mux_groups):
-          if p_group.name == port_group.name and p.name == port.name:
-            sel_value = idx
-          idx += 1
-    return sel_value, ceil(log2(idx))
+    index = pad_domain.mux_group_index
+    sel_value = index.get_select_value(pad.mux_groups, port_group, port)
+    return sel_value, ceil(log2(len(index.get_connectable_ports(pad)) + 1))
 %>
 # Mode: ${constraints_mode.name}
 # Pad Domain: ${constraints_mode.pad_domain.name}
@@ -15,10 +15,12 @@
 # limitations under the License.
 
 import csv
+import io
 import os
 from importlib import resources
 from pathlib import Path
 
+from padrick.Generators.GeneratedFiles import write_if_changed
 from padrick.Generators.PadrickTemplate import PadrickTemplate
 from padrick.Model.PadInstance import PadInstance
 from padrick.Model.Padframe import Padframe
@@ -33,7 +35,7 @@ def generate_padlist(padframe: Padframe, dir: Path):
     os.makedirs(dir, exist_ok=True)
     output_file_path = dir/f"{padframe.name}.csv"
 
-    with  output_file_path.open("w", newline="") as f:
+    with io.StringIO(newline="") as f:
         writer = csv.DictWriter(f, fieldnames=["pad_nr", "pad_name", "type"])
         writer.writeheader()
         pad_index = 0
@@ -47,3 +49,4 @@ def generate_padlist(padframe: Padframe, dir: Path):
                            'type': pad.pad_type.name}
                     pad_index += 1
                     writer.writerow(row)
+        write_if_changed(output_file_path, f.getvalue(), newline="")
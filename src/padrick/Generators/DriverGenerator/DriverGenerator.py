@@ -15,19 +15,22 @@
 # limitations under the License.
 
 import importlib.resources as resources
+import io
 import logging
 import os
 import shutil
 from pathlib import Path
-from typing import Tuple, Mapping
+from typing import Tuple, Mapping, List, Optional
 
 import click_log
 import hjson
 
 from padrick.Generators.GeneratorSettings import DriverTemplates
+from padrick.Generators.GeneratedFiles import write_if_changed
 from padrick.Generators.PadrickTemplate import PadrickTemplate
-from padrick.Model import Constants
+from padrick.Generators.RegisterFile import build_regfile, render_regfile_hjson
 from padrick.Model.Padframe import Padframe
+from padrick.Profiling import timed
 from reggen import gen_cheader as reggen_gen_header
 from reggen import validate as reggen_validate
 from reggen.ip_block import IpBlock
@@ -42,34 +45,41 @@ template_package = 'padrick.Generators.DriverGenerator.Templates'
 class DriverGenException(Exception):
     pass
 
-def generate_driver(templates:DriverTemplates, padframe: Padframe, dir: Path,  header_text: str, **extra_template_kwargs):
+def generate_driver(templates:DriverTemplates, padframe: Padframe, dir: Path,  header_text: str,
+                    regfiles: Optional[List[IpBlock]] = None, **extra_template_kwargs):
+    """
+    Generate the C driver. If regfiles is provided (see RegisterFile.build_regfiles), the given register files are used
+    instead of building them from the regfile_hjson template again.
+    """
     os.makedirs(dir/"src", exist_ok=True)
     os.makedirs(dir/"include", exist_ok=True)
     next_pad_domain_reg_offset = 0 # Offset of the first register of the current pad_frame's register file. All
     address_ranges: Mapping[str, Tuple[int, int]] = {} # dictionary of pad_domain to start- end-address tupple
-    for pad_domain in padframe.pad_domains:
-        templates.regfile_hjson.render(dir, logger=logger, padframe=padframe, pad_domain=pad_domain,
-                                   start_address_offset=hex(next_pad_domain_reg_offset), header_text=header_text,
-                                   hw_version=Constants.HARDWARE_VERSION, **extra_template_kwargs)
-
+    for idx, pad_domain in enumerate(padframe.pad_domains):
         logger.debug("Invoking reggen to generate C header file for the padframe configuration registers.")
-        hjson_reg_file = dir/f"{padframe.name}_{pad_domain.name}_regs.hjson"
-        try:
-            obj = IpBlock.from_path(str(hjson_reg_file), [])
-        except ValueError as e:
-            logger.error(f"Fatal error while parsing auto generated register file for pad_domain {pad_domain.name}.")
-            raise DriverGenException(f"Error parsing regfile.") from e
+        if regfiles is not None:
+            obj = regfiles[idx]
+            render_regfile_hjson(templates.regfile_hjson, dir, logger, padframe, pad_domain,
+                                 next_pad_domain_reg_offset, header_text, **extra_template_kwargs)
+        else:
+            try:
+                obj = build_regfile(templates.regfile_hjson, dir, logger, padframe, pad_domain,
+                                    next_pad_domain_reg_offset, header_text, **extra_template_kwargs)
+            except ValueError as e:
+                logger.error(f"Fatal error while parsing auto generated register file for pad_domain {pad_domain.name}.")
+                raise DriverGenException(f"Error parsing regfile.") from e
         address_ranges[pad_domain.name] = (next_pad_domain_reg_offset, obj.reg_blocks[None].offset)
         next_pad_domain_reg_offset = obj.reg_blocks[None].offset
         address_space_size = next_pad_domain_reg_offset-4
         output_file = dir/f"include/{padframe.name}_{pad_domain.name}_regs.h"
-        with output_file.open('w') as f:
-            return_code = reggen_gen_header.gen_cdefines(obj, f, "", "")
+        header_buffer = io.StringIO()
+        with timed("reggen gen_cdefines", pad_domain=pad_domain.name):
+            return_code = reggen_gen_header.gen_cdefines(obj, header_buffer, "", "")
         if return_code != 0 and not (return_code is None):
             logger.error(f"Regtool template rendering of register file header for pad domain {pad_domain.name} failed")
             raise DriverGenException("Reggen header file rendering failed")
+        write_if_changed(output_file, header_buffer.getvalue())
 
     templates.driver_header.render(dir / 'include', logger, padframe, header_text=header_text, **extra_template_kwargs)
     templates.driver_source.render(dir/'src', logger, padframe, header_text=header_text, **extra_template_kwargs)
-    with open(dir/'include'/'bitfield.h', 'w') as f:
-        f.write(resources.read_text(template_package, 'bitfield.h'))
+    write_if_changed(dir/'include'/'bitfield.h', resources.read_text(template_package, 'bitfield.h'))
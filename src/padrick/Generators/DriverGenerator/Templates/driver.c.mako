@@ -16,7 +16,6 @@
 
 <%
   import math
-  from natsort import natsorted
 %>
 #include "${padframe.name}.h"
 % for pad_domain in padframe.pad_domains:
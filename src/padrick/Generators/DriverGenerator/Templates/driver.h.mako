@@ -16,7 +16,6 @@
 
 <%
   import math
-  from natsort import natsorted
 %>
 #ifndef ${padframe.name.upper()}_H
 #define ${padframe.name.upper()}_H
@@ -38,9 +37,6 @@
       field_type = "uint16_t"
   else:
       field_type = "uint32_t"
-
-  def sort_by_name(seq):
-    return natsorted(seq, lambda x: x.name)
 %>
 /**
  * Sets the ${ps.name} pad signal for the pad: ${pad.name}
@@ -61,13 +57,9 @@ ${field_type} ${padframe.name}_${pad_domain.name}_${pad.name}_cfg_${ps.name}_get
 typedef enum {
   ${padframe.name.upper()}_${pad_domain.name.upper()}_${pad.name.upper()}_REGISTER = 0,
 <% idx = 1 %>\
-% for port_group in sort_by_name(pad_domain.port_groups):
-% for port in sort_by_name(port_group.ports):
-% if port.mux_groups.intersection(pad.mux_groups):
+% for port_group, port in pad_domain.mux_group_index.get_connectable_ports(pad):
   ${padframe.name.upper()}_${pad_domain.name.upper()}_${pad.name.upper()}_group_${port_group.name.upper()}_port_${port.name.upper()} = ${idx},
 <% idx += 1 %>\
-% endif
-% endfor
 % endfor
 } ${padframe.name}_${pad_domain.name}_${pad.name}_mux_sel_t;
 
@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import Optional
 
 import click_spinner
 from click import UsageError
@@ -9,15 +10,17 @@ from mako.template import Template
 from padrick.ConfigParser import parse_config
 from padrick.Generators.FuseSoCGenerator.FuseSoCGeneratorConfigFileModel import ConfigFileModel, GeneratorKind, \
     RTLGenerateStep, CustomGenerateStep
+from padrick.Generators.GeneratedFiles import write_if_changed
 from padrick.Generators.GeneratorSettings import GeneratorSettings
 from padrick.Generators.RTLGenerator.RTLGenerator import generate_rtl
 from padrick.Model.Padframe import Padframe
+from padrick.ModelCache import ModelCache
 from padrick.Utils.WorkingDir import working_dir
 
 logger = logging.getLogger("padrick.FuseSoCGenerator")
 
 
-def generate_core(config_file_path: Path):
+def generate_core(config_file_path: Path, cache: Optional[ModelCache] = None):
     """Parses the config file supplied by FuseSoC to generate
     a valid FuseSoC core config file."""
 
@@ -30,7 +33,8 @@ def generate_core(config_file_path: Path):
         root =  config.files_root
         if not config:
             raise UsageError("Failed to parse the configuration file")
-        padframe_config = parse_config(Padframe, root/config.parameters.padframe_manifest, include_base_dir=config.files_root)
+        padframe_config = parse_config(Padframe, root/config.parameters.padframe_manifest, include_base_dir=config.files_root,
+                                       cache=cache)
         if not padframe_config:
             raise UsageError("Failed to parse the padframe configuration file.")
         if config.parameters.generator_settings:
@@ -49,7 +53,7 @@ def generate_core(config_file_path: Path):
         elif isinstance(step, CustomGenerateStep):
             try:
                 mk_template = Template(Path(config.files_root)/step.template_file)
-                step.output_filename.write_text(mk_template.render(padframe=padframe_config, vlnv=config.vlnv))
+                write_if_changed(step.output_filename, mk_template.render(padframe=padframe_config, vlnv=config.vlnv))
             except Exception as e:
                 logger.error(f"Error while rendering custom template:\
                                         n{exceptions.text_error_template().render()}")
@@ -0,0 +1,94 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import locale
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+import click_log
+
+from padrick.Profiling import timed
+
+logger = logging.getLogger("padrick.GeneratedFiles")
+click_log.basic_config(logger)
+
+
+class GeneratedFiles:
+    """
+    Keeps track of the files emitted by the generators.
+
+    Generated content is only written to disk if it differs from the content of the existing file. This keeps the
+    modification time of unchanged outputs stable so downstream build tools (Bender, Verilator, synthesis flows etc.)
+    do not needlessly rebuild the padframe.
+    """
+
+    def __init__(self):
+        self.written: List[Path] = []
+        self.unchanged: List[Path] = []
+
+    def reset(self):
+        self.written = []
+        self.unchanged = []
+
+    def write(self, path: Union[str, Path], content: str, encoding: Optional[str] = None,
+              newline: Optional[str] = None) -> bool:
+        """
+        Write content to path unless the file already contains exactly the same data.
+
+        The encoding and newline arguments have the same meaning as for the builtin open() function in text mode.
+        Returns True if the file was written and False if it was left untouched.
+        """
+        with timed("write files", path=path):
+            return self._write(Path(path), content, encoding, newline)
+
+    def _write(self, path: Path, content: str, encoding: Optional[str], newline: Optional[str]) -> bool:
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        if newline is None:
+            newline = os.linesep
+        if newline not in ('', '\n'):
+            content = content.replace('\n', newline)
+        data = content.encode(encoding)
+        if self._has_content(path, data):
+            logger.debug(f"{path} is up-to-date.")
+            self.unchanged.append(path)
+            return False
+        path.write_bytes(data)
+        self.written.append(path)
+        return True
+
+    @staticmethod
+    def _has_content(path: Path, data: bytes) -> bool:
+        try:
+            # Cheap check first. Most modified outputs also change in size.
+            if path.stat().st_size != len(data):
+                return False
+            return path.read_bytes() == data
+        except FileNotFoundError:
+            return False
+
+    def summary(self) -> str:
+        return f"Wrote {len(self.written)} files, {len(self.unchanged)} files were already up-to-date."
+
+
+GENERATED_FILES = GeneratedFiles()
+
+
+def write_if_changed(path: Union[str, Path], content: str, encoding: Optional[str] = None,
+                     newline: Optional[str] = None) -> bool:
+    return GENERATED_FILES.write(path, content, encoding=encoding, newline=newline)
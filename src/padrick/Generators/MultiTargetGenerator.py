@@ -0,0 +1,137 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Sequence, Optional, List, Tuple, Dict
+
+import click_log
+
+from padrick.Generators.ConstraintsGenerator.ConstraintsGenerator import generate_constraints
+from padrick.Generators.ConstraintsGenerator.ConstraintsSpec import ConstraintsSpec
+from padrick.Generators.DocGenerator.DocGenerator import generate_padlist
+from padrick.Generators.DriverGenerator.DriverGenerator import generate_driver
+from padrick.Generators.GeneratedFiles import GENERATED_FILES
+from padrick.Generators.GeneratorSettings import GeneratorSettings
+from padrick.Generators.PadrickTemplate import get_template_module_directory, set_template_module_directory
+from padrick.Generators.RTLGenerator.RTLGenerator import generate_rtl
+from padrick.Generators.RegisterFile import build_regfiles
+from padrick.Model.Padframe import Padframe
+from padrick.ModelCache import dumps_model
+from reggen.ip_block import IpBlock
+
+logger = logging.getLogger("padrick.MultiTargetGenerator")
+click_log.basic_config(logger)
+
+GENERATOR_TARGETS = ('rtl', 'driver', 'padlist', 'constraints')
+DEFAULT_GENERATOR_TARGETS = ('rtl', 'driver', 'padlist')
+
+
+class MultiTargetGenException(Exception):
+    pass
+
+
+def _generate_target(target: str, generator_settings: GeneratorSettings, padframe: Padframe,
+                     constraints_spec: Optional[ConstraintsSpec], output: Path, header_text: str,
+                     regfiles: Dict[str, List[IpBlock]]):
+    dir = output / target
+    if target == 'rtl':
+        generate_rtl(generator_settings.rtl_templates, padframe, dir, header_text, regfiles=regfiles['rtl'])
+    elif target == 'driver':
+        generate_driver(generator_settings.driver_templates, padframe, dir, header_text, regfiles=regfiles['driver'])
+    elif target == 'padlist':
+        generate_padlist(padframe, dir)
+    elif target == 'constraints':
+        generate_constraints(generator_settings.constraints_templates, padframe, constraints_spec, dir,
+                             header_text=header_text)
+    else:
+        raise MultiTargetGenException(f"Unknown generator target {target}.")
+
+
+# State of the worker processes used for parallel generation. Initialized once per worker by _init_worker to avoid
+# sending the whole padframe with every task.
+_worker_args = None
+
+
+def _init_worker(generator_settings: GeneratorSettings, pickled_models: bytes, output: Path, header_text: str,
+                 template_module_directory: Optional[Path]):
+    global _worker_args
+    set_template_module_directory(template_module_directory)
+    # The padframe, the constraints spec and the register files are pickled together since the constraints spec
+    # references objects of the padframe.
+    padframe, constraints_spec, regfiles = pickle.loads(pickled_models)
+    _worker_args = (generator_settings, padframe, constraints_spec, output, header_text, regfiles)
+
+
+def _worker_generate_target(target: str) -> Tuple[List[Path], List[Path]]:
+    generator_settings, padframe, constraints_spec, output, header_text, regfiles = _worker_args
+    GENERATED_FILES.reset()
+    _generate_target(target, generator_settings, padframe, constraints_spec, output, header_text, regfiles)
+    return GENERATED_FILES.written, GENERATED_FILES.unchanged
+
+
+def generate_targets(generator_settings: GeneratorSettings, padframe: Padframe, targets: Sequence[str], output: Path,
+                     header_text: str, constraints_spec: Optional[ConstraintsSpec] = None, jobs: int = 1):
+    """
+    Generate several outputs of the same padframe. Every target is generated into its own subdirectory of output.
+
+    The register files of the pad domains are only built once and shared by the rtl and driver targets as long as both
+    use the same regfile_hjson template. With jobs > 1 (0 uses one process per CPU core) the targets are generated in
+    parallel worker processes.
+    """
+    for target in targets:
+        if target not in GENERATOR_TARGETS:
+            raise MultiTargetGenException(f"Unknown generator target {target}.")
+    if 'constraints' in targets and constraints_spec is None:
+        raise MultiTargetGenException("The constraints target requires a constraints specification.")
+
+    regfiles: Dict[str, Optional[List[IpBlock]]] = {'rtl': None, 'driver': None}
+    try:
+        if 'rtl' in targets:
+            logger.debug("Building register files for the rtl target.")
+            regfiles['rtl'] = build_regfiles(generator_settings.rtl_templates.regfile_hjson, logger, padframe,
+                                             header_text)
+        if 'driver' in targets:
+            if regfiles['rtl'] is not None and generator_settings.driver_templates.regfile_hjson.template == \
+                    generator_settings.rtl_templates.regfile_hjson.template:
+                regfiles['driver'] = regfiles['rtl']
+            else:
+                logger.debug("Building register files for the driver target.")
+                regfiles['driver'] = build_regfiles(generator_settings.driver_templates.regfile_hjson, logger,
+                                                    padframe, header_text)
+    except ValueError as e:
+        logger.error(f"Fatal error while parsing auto generated register file: {e}")
+        raise MultiTargetGenException("Error parsing regfile.") from e
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(targets))
+    if jobs <= 1:
+        for target in targets:
+            logger.debug(f"Generating target {target}.")
+            _generate_target(target, generator_settings, padframe, constraints_spec, output, header_text, regfiles)
+    else:
+        logger.debug(f"Generating {len(targets)} targets using {jobs} processes.")
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(generator_settings, dumps_model((padframe, constraints_spec, regfiles)),
+                                           output, header_text, get_template_module_directory())) as executor:
+            results = list(executor.map(_worker_generate_target, targets))
+        for written, unchanged in results:
+            GENERATED_FILES.written.extend(written)
+            GENERATED_FILES.unchanged.extend(unchanged)
@@ -14,14 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import logging
+import os
 from dataclasses import dataclass
 from importlib import resources
 from pathlib import Path
-from typing import Union, Optional, Tuple, NamedTuple
+from typing import Union, Optional, Tuple, NamedTuple, Dict
+
+import mako
 from pydantic import BaseModel
 
+from padrick.Generators.GeneratedFiles import write_if_changed
 from padrick.Model.Padframe import Padframe
+from padrick.Profiling import timed
 from mako import exceptions
 from mako.template import Template
 
@@ -33,28 +39,107 @@ class TemplatePackageResource(NamedTuple):
     package: str
     resource: str
 
+
+# Directory where Mako stores the python modules of compiled templates. If set, compiled templates are reused across
+# padrick invocations. Use set_template_module_directory() to change it.
+_template_module_directory: Optional[Path] = None
+# In-process cache of compiled templates. Package resources are keyed by package and resource name, template files by
+# their absolute path and modification time.
+_compiled_templates: Dict[Tuple, Template] = {}
+
+
+def set_template_module_directory(module_directory: Optional[Path]):
+    global _template_module_directory
+    _template_module_directory = Path(module_directory).resolve() if module_directory else None
+    _compiled_templates.clear()
+
+
+def get_template_module_directory() -> Optional[Path]:
+    return _template_module_directory
+
+
+def _compile_package_resource(template: TemplatePackageResource) -> Template:
+    text = resources.read_text(template.package, template.resource)
+    if _template_module_directory is None:
+        return Template(text)
+    # Mako only supports persistent module files for templates that live on the filesystem. Package resources might
+    # not (e.g. in the standalone binary), so we materialize them in the module directory. The content hash in the
+    # file name makes sure we never pick up a stale module after upgrading padrick.
+    content_hash = hashlib.sha256((mako.__version__ + text).encode('utf-8')).hexdigest()[:16]
+    source_path = _template_module_directory / 'resources' / template.package / f"{content_hash}_{template.resource}"
+    try:
+        if not source_path.exists():
+            source_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = source_path.with_name(f".{source_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(text, encoding='utf-8')
+            os.replace(tmp_path, source_path)
+        return Template(filename=str(source_path), uri=source_path.relative_to(_template_module_directory).as_posix(),
+                        module_directory=str(_template_module_directory), input_encoding='utf-8')
+    except OSError:
+        return Template(text)
+
+
+def _compile_template_file(template_path: Path) -> Template:
+    if _template_module_directory is None:
+        return Template(filename=str(template_path))
+    try:
+        return Template(filename=str(template_path), module_directory=str(_template_module_directory/'files'))
+    except OSError:
+        return Template(filename=str(template_path))
+
+
+def get_compiled_template(template: Union[TemplatePackageResource, Path]) -> Template:
+    """
+    Returns the compiled Mako template for the given package resource or template file.
+    """
+    if isinstance(template, TemplatePackageResource):
+        key = (template.package, template.resource)
+        if key not in _compiled_templates:
+            _compiled_templates[key] = _compile_package_resource(template)
+    else:
+        template_path = Path(template).resolve()
+        key = (str(template_path), template_path.stat().st_mtime_ns)
+        if key not in _compiled_templates:
+            _compiled_templates[key] = _compile_template_file(template_path)
+    return _compiled_templates[key]
+
+
 class PadrickTemplate(BaseModel):
     name: str
     target_file_name: str
     template: Union[TemplatePackageResource, Path]
     skip_generation = False
 
+    @property
+    def template_file_name(self) -> str:
+        if isinstance(self.template, TemplatePackageResource):
+            return self.template.resource
+        return Path(self.template).name
+
+    def render_to_string(self, logger: logging.Logger, padframe: Padframe, debug_render=False, **kwargs) -> str:
+        tp = get_compiled_template(self.template)
+        # The name may contain unformatted placeholders (e.g. {pad_domain.name}). Account the rendering to the template
+        # file instead and record the pad domain in the trace.
+        trace_args = {'pad_domain': kwargs['pad_domain'].name} if kwargs.get('pad_domain') is not None else {}
+        try:
+            with timed(f"render {self.template_file_name}", **trace_args):
+                rendered = tp.render(padframe=padframe, **kwargs)
+            if debug_render:
+                logger.debug(rendered)
+            return rendered
+        except Exception as e:
+            logger.error(f"Error while rendering {self.name} template for padframe {padframe.name}:\
+            n{exceptions.text_error_template().render()}")
+            raise TemplateRenderException(f"Rendering of template {self.name} failed") from e
+
+    def target_path(self, output_dir: Path, padframe: Padframe, **kwargs) -> Path:
+        return output_dir / self.target_file_name.format(padframe=padframe, **kwargs)
+
     def render(self, output_dir: Path, logger: logging.Logger, padframe: Padframe, debug_render=False, **kwargs):
         if self.skip_generation:
             logger.debug(f"Skipping generation of {self.name}.")
         else:
             logger.debug(f"Generating {self.name}")
-            output_file_path = output_dir / self.target_file_name.format(padframe=padframe, **kwargs)
-            with output_file_path.open(mode='w') as f:
-                if isinstance(self.template, TemplatePackageResource):
-                    tp = Template(resources.read_text(self.template.package, self.template.resource))
-                else:
-                    tp = Template(filename=str(self.template))
-                try:
-                    f.write(tp.render(padframe=padframe, **kwargs))
-                    if debug_render:
-                        logger.debug(tp.render(padframe=padframe, **kwargs))
-                except Exception as e:
-                    logger.error(f"Error while rendering {self.name} template for padframe {padframe.name}:\
-                    n{exceptions.text_error_template().render()}")
-                    raise TemplateRenderException(f"Rendering of template {self.name} failed") from e
+            output_file_path = self.target_path(output_dir, padframe, **kwargs)
+            write_if_changed(output_file_path, self.render_to_string(logger, padframe, debug_render=debug_render,
+                                                                     **kwargs))
@@ -15,17 +15,27 @@
 # limitations under the License.
 
 import importlib.resources as resources
+import itertools
 import logging
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Tuple, Mapping
+from typing import Tuple, Mapping, List, Optional
 
 import click_log
 import hjson
-from padrick.Generators.PadrickTemplate import PadrickTemplate
+from padrick.Generators.GeneratedFiles import write_if_changed, GENERATED_FILES
+from padrick.Generators.PadrickTemplate import PadrickTemplate, get_template_module_directory, \
+    set_template_module_directory
 from padrick.Generators.GeneratorSettings import RTLTemplates
+from padrick.Generators.RegisterFile import build_regfile, regfile_description, render_regfile_hjson, \
+    DEFAULT_REGFILE_TEMPLATE
 from padrick.Model import Constants
+from padrick.Model.PadDomain import PadDomain
 from padrick.Model.Padframe import Padframe
+from padrick.ModelCache import dumps_model
+from padrick.Profiling import timed
 from reggen import gen_rtl as reggen_gen_rtl
 from reggen import validate as reggen_validate
 from reggen.ip_block import IpBlock
@@ -38,38 +48,144 @@ template_package = 'padrick.Generators.RTLGenerator.Templates'
 class RTLGenException(Exception):
     pass
 
-def generate_rtl(templates: RTLTemplates, padframe: Padframe, dir: Path, header_text: str, vlnv=None, **extra_template_kwargs):
+def _generate_pad_domain_rtl(templates: RTLTemplates, padframe: Padframe, pad_domain: PadDomain, dir: Path,
+                             header_text: str, start_address_offset: int, regfile: Optional[IpBlock] = None,
+                             **extra_template_kwargs) -> int:
+    """
+    Render all files of a single pad domain. Returns the (exclusive) end address of the pad domain's register file.
+
+    If regfile is provided, it is used instead of building the register file from the regfile_hjson template again.
+    """
+    templates.pad_domain_top.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
+    templates.pad_inst_module.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
+    templates.internal_pkg.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
+    templates.pad_mux_module.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
+
+    # Generate Register file using lowRisc reg_tool
+    logger.debug("Invoking reggen to generate register file from Register file description")
+    if regfile is not None:
+        obj = regfile
+        render_regfile_hjson(templates.regfile_hjson, dir/"src", logger, padframe, pad_domain, start_address_offset,
+                             header_text, **extra_template_kwargs)
+    else:
+        try:
+            obj = build_regfile(templates.regfile_hjson, dir/"src", logger, padframe, pad_domain, start_address_offset,
+                                header_text, **extra_template_kwargs)
+        except ValueError as e:
+            logger.error(f"Fatal error while parsing auto generated register file for pad_domain {pad_domain.name}.")
+            raise RTLGenException(f"Error parsing regfile.") from e
+    with timed("reggen gen_rtl", pad_domain=pad_domain.name):
+        return_code = reggen_gen_rtl.gen_rtl(obj, (dir/"src").as_posix(),
+                                             write_file=lambda path, content: write_if_changed(path, content, encoding='UTF-8'))
+    if return_code != 0 and not (return_code is None):
+        logger.error(f"Regtool template rendering of register file for pad domain {pad_domain.name} failed")
+        raise RTLGenException("Reggen Rendering failed")
+    return obj.reg_blocks[None].offset
+
+
+def _get_regfile_size(templates: RTLTemplates, padframe: Padframe, pad_domain: PadDomain, header_text: str,
+                      **extra_template_kwargs) -> int:
+    """
+    Determine the size of the pad domain's register file by building it with a start address of 0.
+    """
+    try:
+        if templates.regfile_hjson.template == DEFAULT_REGFILE_TEMPLATE:
+            with timed("reggen build register file", pad_domain=pad_domain.name):
+                obj = IpBlock.from_raw([], regfile_description(padframe, pad_domain, 0),
+                                       f"register file of pad domain {pad_domain.name}")
+        else:
+            hjson_text = templates.regfile_hjson.render_to_string(logger, padframe, pad_domain=pad_domain,
+                                                                  start_address_offset=hex(0), header_text=header_text,
+                                                                  hw_version=Constants.HARDWARE_VERSION,
+                                                                  **extra_template_kwargs)
+            with timed("reggen build register file", pad_domain=pad_domain.name):
+                obj = IpBlock.from_text(hjson_text, [], f"register file of pad domain {pad_domain.name}")
+    except ValueError as e:
+        logger.error(f"Fatal error while parsing auto generated register file for pad_domain {pad_domain.name}.")
+        raise RTLGenException(f"Error parsing regfile.") from e
+    return obj.reg_blocks[None].offset
+
+
+# State of the worker processes used for parallel RTL generation. Initialized once per worker by _init_worker to
+# avoid sending the whole padframe with every task.
+_worker_args = None
+
+
+def _init_worker(templates: RTLTemplates, pickled_padframe: bytes, dir: Path, header_text: str,
+                 extra_template_kwargs, template_module_directory: Optional[Path]):
+    global _worker_args
+    set_template_module_directory(template_module_directory)
+    _worker_args = (templates, pickle.loads(pickled_padframe), dir, header_text, extra_template_kwargs)
+
+
+def _worker_get_regfile_size(pad_domain_idx: int) -> int:
+    templates, padframe, dir, header_text, extra_template_kwargs = _worker_args
+    return _get_regfile_size(templates, padframe, padframe.pad_domains[pad_domain_idx], header_text,
+                             **extra_template_kwargs)
+
+
+def _worker_generate_pad_domain_rtl(pad_domain_idx: int, start_address_offset: int,
+                                    regfile: Optional[IpBlock]) -> Tuple[int, List[Path], List[Path]]:
+    templates, padframe, dir, header_text, extra_template_kwargs = _worker_args
+    GENERATED_FILES.reset()
+    end_address = _generate_pad_domain_rtl(templates, padframe, padframe.pad_domains[pad_domain_idx], dir,
+                                           header_text, start_address_offset, regfile, **extra_template_kwargs)
+    return end_address, GENERATED_FILES.written, GENERATED_FILES.unchanged
+
+
+def generate_rtl(templates: RTLTemplates, padframe: Padframe, dir: Path, header_text: str, vlnv=None, jobs: int = 1,
+                 regfiles: Optional[List[IpBlock]] = None, **extra_template_kwargs):
+    """
+    Generate the SystemVerilog implementation of the padframe.
+
+    The pad domains are rendered in up to jobs worker processes (0 uses one process per CPU core). If regfiles is
+    provided (see RegisterFile.build_regfiles), the given register files are used instead of building them from the
+    regfile_hjson template again.
+    """
     os.makedirs(dir/"src", exist_ok=True)
     os.makedirs(dir/"include"/padframe.name, exist_ok=True)
     templates.toplevel_sv_package.render(dir/"src", logger=logger, padframe=padframe, header_text=header_text)
 
-    next_pad_domain_reg_offset = 0 # Offset of the first register of the current pad_frame's register file. All
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(padframe.pad_domains))
     address_ranges: Mapping[str, Tuple[int, int]] = {} # dictionary of pad_domain to start- end-address tupple
     # mappings. The end address is inclusive
     # registers in the padframe are mapped to a contiguous address space.
-    for pad_domain in padframe.pad_domains:
-        templates.pad_domain_top.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
-        templates.pad_inst_module.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
-        templates.internal_pkg.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
-        templates.pad_mux_module.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain, header_text=header_text, **extra_template_kwargs)
-        templates.regfile_hjson.render(dir /"src", logger=logger, padframe=padframe, pad_domain=pad_domain,
-                                       start_address_offset=hex(next_pad_domain_reg_offset), header_text=header_text, hw_version=Constants.HARDWARE_VERSION, **extra_template_kwargs)
-
-
-        # Generate Register file using lowRisc reg_tool
-        logger.debug("Invoking reggen to generate register file from Register file description")
-        hjson_reg_file = dir/"src"/f"{padframe.name}_{pad_domain.name}_regs.hjson"
-        try:
-            obj = IpBlock.from_path(str(hjson_reg_file), [])
-        except ValueError as e:
-            logger.error(f"Fatal error while parsing auto generated register file for pad_domain {pad_domain.name}.")
-            raise RTLGenException(f"Error parsing regfile.") from e
-        address_ranges[pad_domain.name] = (next_pad_domain_reg_offset, obj.reg_blocks[None].offset)
-        next_pad_domain_reg_offset = obj.reg_blocks[None].offset
-        return_code = reggen_gen_rtl.gen_rtl(obj, (dir/"src").as_posix())
-        if return_code != 0 and not (return_code is None):
-            logger.error(f"Regtool template rendering of register file for pad domain {pad_domain.name} failed")
-            raise RTLGenException("Reggen Rendering failed")
+    if jobs <= 1:
+        next_pad_domain_reg_offset = 0 # Offset of the first register of the current pad_frame's register file.
+        for idx, pad_domain in enumerate(padframe.pad_domains):
+            end_address = _generate_pad_domain_rtl(templates, padframe, pad_domain, dir, header_text,
+                                                   next_pad_domain_reg_offset, regfiles[idx] if regfiles else None,
+                                                   **extra_template_kwargs)
+            address_ranges[pad_domain.name] = (next_pad_domain_reg_offset, end_address)
+            next_pad_domain_reg_offset = end_address
+    else:
+        logger.debug(f"Generating RTL for {len(padframe.pad_domains)} pad domains using {jobs} processes.")
+        pad_domain_indices = range(len(padframe.pad_domains))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(templates, dumps_model(padframe), dir, header_text,
+                                           extra_template_kwargs, get_template_module_directory())) as executor:
+            # The register files of all pad domains are mapped to a contiguous address space. Determine the size of
+            # each register file first so every pad domain can be rendered independently with the right offset.
+            if regfiles is not None:
+                start_addresses = [0] + [obj.reg_blocks[None].offset for obj in regfiles[:-1]]
+                regfile_sizes = [obj.reg_blocks[None].offset - start for obj, start in zip(regfiles, start_addresses)]
+            else:
+                regfile_sizes = list(executor.map(_worker_get_regfile_size, pad_domain_indices))
+                start_addresses = list(itertools.accumulate([0] + regfile_sizes[:-1]))
+            results = list(executor.map(_worker_generate_pad_domain_rtl, pad_domain_indices, start_addresses,
+                                        regfiles if regfiles is not None else itertools.repeat(None)))
+        for pad_domain, start_address, regfile_size, (end_address, written, unchanged) in zip(
+                padframe.pad_domains, start_addresses, regfile_sizes, results):
+            if end_address != start_address + regfile_size:
+                logger.error(f"The size of the register file for pad domain {pad_domain.name} depends on its start "
+                             f"address. Use serial RTL generation for this register file template.")
+                raise RTLGenException("Inconsistent register file size.")
+            address_ranges[pad_domain.name] = (start_address, end_address)
+            GENERATED_FILES.written.extend(written)
+            GENERATED_FILES.unchanged.extend(unchanged)
+        next_pad_domain_reg_offset = results[-1][0]
 
     templates.toplevel_module.render(dir / "src", logger=logger, padframe=padframe, address_ranges=address_ranges,
                                      address_space_size=next_pad_domain_reg_offset, header_text=header_text, **extra_template_kwargs)
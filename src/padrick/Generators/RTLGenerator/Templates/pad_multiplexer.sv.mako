@@ -86,8 +86,7 @@ for port_group in pad_domain.port_groups:
          mux_to_pads_o.${pad.name}.${pad_signal.name} = s_reg2hw.${pad.name}_cfg.${pad_signal.name}.q;
 % endfor
        end
-% for port_group in pad_domain.port_groups:
-% for port in port_group.get_ports_in_mux_groups(pad.mux_groups):
+% for port_group, port in pad_domain.mux_group_index.get_ports(pad.mux_groups):
        PAD_MUX_GROUP_${pad.mux_group_name}_SEL_${port_group.name.upper()}_${port.name.upper()}: begin
 % for pad_signal in pad.dynamic_pad_signals_soc2pad:
 % if pad_signal in port.connections and not port.connections[pad_signal].is_empty:
@@ -97,7 +96,6 @@ for port_group in pad_domain.port_groups:
 % endif
 % endfor
        end
-% endfor
 % endfor
        default: begin
 % for pad_signal in pad.dynamic_pad_signals_soc2pad:
@@ -13,15 +13,15 @@
 ## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 ## See the License for the specific language governing permissions and
 ## limitations under the License.
+##
+## The register file description in padrick/Generators/RegisterFile.py (regfile_description) builds the very same
+## register file directly from the padframe model. Keep both in sync when changing this template
+## (tests/test_register_file.py compares them).
 
 <%
   import math
   import string
   from padrick.Model.PadSignal import SignalDirection
-  from natsort import natsorted
-
-  def sort_by_name(seq):
-    return natsorted(seq, lambda x: x.name)
 
 %>
 {
@@ -123,13 +123,11 @@
     connectable_ports = []
     idx = 0
     reset_value = 0
-    for port_group in sort_by_name(pad_domain.port_groups):
-      for port in sort_by_name(port_group.ports):
-        if port.mux_groups.intersection(pad.mux_groups):
-          connectable_ports.append((port_group, port))
-          idx += 1
-          if pad.default_port and pad.default_port[0].name == port_group.name and pad.default_port[1].name == port.name:
-            reset_value = idx
+    for port_group, port in pad_domain.mux_group_index.get_connectable_ports(pad):
+      connectable_ports.append((port_group, port))
+      idx += 1
+      if pad.default_port and pad.default_port[0].name == port_group.name and pad.default_port[1].name == port.name:
+        reset_value = idx
 %>
        {
           name: ${pad.name.upper()}_MUX_SEL
@@ -142,7 +140,7 @@
           resval: ${reset_value}
           fields: [
               {
-                  bits: "${max(0,math.ceil(math.log2(len(pad_domain.get_ports_in_mux_groups(pad.mux_groups))+1))-1)}:0"
+                  bits: "${max(0,math.ceil(math.log2(len(connectable_ports)+1))-1)}:0"
                   enum: [
                       { value: "0", name: "register", desc: "Connects the Pad to the internal configuration register."}
 %for idx, (port_group, port) in enumerate(connectable_ports):
@@ -0,0 +1,252 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import math
+import string
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from padrick.Generators.GeneratedFiles import write_if_changed
+from padrick.Generators.GeneratorSettings import RTLTemplatePackage
+from padrick.Generators.PadrickTemplate import PadrickTemplate, TemplatePackageResource
+from padrick.Model import Constants
+from padrick.Model.PadDomain import PadDomain
+from padrick.Model.PadInstance import PadInstance
+from padrick.Model.Padframe import Padframe
+from padrick.Profiling import timed
+from reggen.ip_block import IpBlock
+
+DEFAULT_REGFILE_TEMPLATE = TemplatePackageResource(RTLTemplatePackage, 'regfile.hjson.mako')
+
+
+def _hjson_multiline_string(text: str, indent: int) -> str:
+    """
+    Returns the value hjson assigns to a multiline string whose opening ''' sits at column indent and is directly
+    followed by a newline. Text is everything between that newline and the closing '''.
+
+    Hjson strips up to indent whitespace characters from every line and drops the final line break.
+    """
+    lines = []
+    for line in text.split('\n'):
+        skip = 0
+        while skip < indent and skip < len(line) and line[skip] in " \t\r":
+            skip += 1
+        lines.append(line[skip:].replace('\r', ''))
+    value = "\n".join(lines)
+    if value.endswith('\n'):
+        value = value[:-1]
+    return value
+
+
+def _cfg_register_suffix(idx: int, num_cfg_regs: int) -> str:
+    # Convert the config register index to a capital letter index e.g. 1 -> A, 2 -> B, 3->C
+    cfg_suffix = ""
+    if num_cfg_regs > 1:
+        num_cfg_reg_chars = math.ceil(math.log(num_cfg_regs, 26))
+        for k in range(num_cfg_reg_chars):
+            cfg_suffix = string.ascii_uppercase[idx % 26] + cfg_suffix
+            idx = idx // 26
+    return cfg_suffix
+
+
+def _pad_cfg_registers(pad: PadInstance) -> List[Dict[str, Any]]:
+    # Calculate how many config registers we need to accomodate all dynamic pad signals that need a register.
+    total_dynamic_padsignal_bits = sum([signal.size for signal in pad.dynamic_pad_signals])
+    num_cfg_regs = total_dynamic_padsignal_bits // 32 + 1
+
+    # Group pad_signals by config register
+    pad_signals_grouping = []
+    current_signal_grouping = []
+    current_group_size = 0
+    for pad_signal in pad.dynamic_pad_signals_soc2pad:
+        if current_group_size + pad_signal.size > 32:
+            # Start new grouping
+            pad_signals_grouping.append(current_signal_grouping)
+            current_group_size = 0
+            current_signal_grouping = [(pad_signal, (pad_signal.size - 1, 0))]
+        else:
+            current_signal_grouping.append((pad_signal, (current_group_size + pad_signal.size - 1, current_group_size)))
+            current_group_size = current_group_size + pad_signal.size
+    pad_signals_grouping.append(current_signal_grouping)
+
+    registers = []
+    for i, pad_signals in enumerate(pad_signals_grouping):
+        fields = []
+        for pad_signal, (msb, lsb) in pad_signals:
+            description = pad_signal.description if pad_signal.description else ""
+            if pad.connections:
+                reset_value = pad.connections.get(pad_signal, pad_signal.default_reset_value)
+            else:
+                reset_value = pad_signal.default_reset_value
+            fields.append({
+                'bits': str(msb) + ':' + str(lsb) if msb != lsb else str(lsb),
+                'name': str(pad_signal.name),
+                'desc': _hjson_multiline_string(21 * " " + f"{description}\n" + 16 * " ", indent=22),
+                'swaccess': "rw",
+                'hwaccess': "hro",
+                'resval': f"{reset_value}"
+            })
+        registers.append({
+            'name': f"{pad.name.upper()}_CFG{_cfg_register_suffix(i, num_cfg_regs)}",
+            'desc': "Pad signal configuration.",
+            'swaccess': "rw",
+            'fields': fields
+        })
+    return registers
+
+
+def _pad_mux_sel_register(pad_domain: PadDomain, pad: PadInstance) -> Dict[str, Any]:
+    # The reset value depends on whether the dynamic pad has a default_port or not. If it doesn't the resvalue is zero
+    # (connect to register file value). If it has one, we need to find the right select value that corresponds to the
+    # port.
+    connectable_ports = pad_domain.mux_group_index.get_connectable_ports(pad)
+    reset_value = 0
+    if pad.default_port:
+        reset_value = pad_domain.mux_group_index.get_select_value(pad.mux_groups, *pad.default_port)
+    enum = [{'value': "0", 'name': "register", 'desc': "Connects the Pad to the internal configuration register."}]
+    for idx, (port_group, port) in enumerate(connectable_ports):
+        enum.append({'value': f"{idx + 1}",
+                     'name': f"port_{port_group.name}_{port.name.lower()}",
+                     'desc': f"Connect port {port.name} from port group {port_group.name} to this pad."})
+    sel_width = max(0, math.ceil(math.log2(len(connectable_ports) + 1)) - 1)
+    return {
+        'name': f"{pad.name.upper()}_MUX_SEL",
+        'desc': f"Pad signal port multiplex selection for pad {pad.name}. The programmed value defines which port\n"
+                f"is connected to the pad.",
+        'swaccess': "rw",
+        'hwaccess': "hro",
+        'resval': reset_value,
+        'fields': [
+            {
+                'bits': f"{sel_width}:0",
+                'enum': enum
+            }
+        ]
+    }
+
+
+def regfile_description(padframe: Padframe, pad_domain: PadDomain, start_address_offset: int,
+                        hw_version: int = Constants.HARDWARE_VERSION) -> Dict[str, Any]:
+    """
+    Build the reggen register file description of a pad domain.
+
+    The result is identical to the parsed hjson output of the default regfile.hjson.mako template (see
+    tests/test_register_file.py) and can be passed to IpBlock.from_raw directly.
+    """
+    registers: List[Dict[str, Any]] = [
+        {'skipto': hex(start_address_offset)},
+        {
+            'name': "INFO",
+            'desc': "Read-only IP Information register",
+            'swaccess': "ro",
+            'hwaccess': "hro",
+            'fields': [
+                {
+                    'bits': "15:0",
+                    'name': "HW_VERSION",
+                    'desc': "Hardware version ID.",
+                    'resval': hw_version
+                },
+                {
+                    'bits': "31:16",
+                    'name': "PADCOUNT",
+                    'desc': "The number of muxable pads in this IP.",
+                    'resval': f"{len([pad for pad in pad_domain.pad_list if not pad.is_static])}"
+                }
+            ]
+        }
+    ]
+    for pad in pad_domain.pad_list:
+        if pad.dynamic_pad_signals_soc2pad:
+            registers.extend(_pad_cfg_registers(pad))
+        if pad.dynamic_pad_signals:
+            registers.append(_pad_mux_sel_register(pad_domain, pad))
+    return {
+        'name': f"{padframe.name}_{pad_domain.name}_config",
+        'clock_primary': "clk_i",
+        'reset_primary': "rst_ni",
+        'bus_interfaces': [
+            {'protocol': "reg_iface", 'direction': "device"}
+        ],
+        'regwidth': 32,
+        'registers': registers
+    }
+
+
+def _regfile_template_kwargs(padframe: Padframe, pad_domain: PadDomain, start_address_offset: int, header_text: str,
+                             **extra_template_kwargs) -> Dict[str, Any]:
+    return dict(padframe=padframe, pad_domain=pad_domain, start_address_offset=hex(start_address_offset),
+                header_text=header_text, hw_version=Constants.HARDWARE_VERSION, **extra_template_kwargs)
+
+
+def render_regfile_hjson(regfile_template: PadrickTemplate, output_dir: Path, logger: logging.Logger,
+                         padframe: Padframe, pad_domain: PadDomain, start_address_offset: int, header_text: str,
+                         **extra_template_kwargs):
+    """
+    Emit the hjson register file description of the pad domain (unless the template has skip_generation set).
+    """
+    regfile_template.render(output_dir, logger=logger, **_regfile_template_kwargs(
+        padframe, pad_domain, start_address_offset, header_text, **extra_template_kwargs))
+
+
+def build_regfile(regfile_template: PadrickTemplate, output_dir: Optional[Path], logger: logging.Logger,
+                  padframe: Padframe, pad_domain: PadDomain, start_address_offset: int, header_text: str,
+                  **extra_template_kwargs) -> IpBlock:
+    """
+    Build the reggen IpBlock of the pad domain's register file.
+
+    With the default register file template, the IpBlock is built directly from the padframe model and the hjson
+    register file description is only emitted as an artifact (unless the template has skip_generation set or
+    output_dir is None). Customized templates are rendered and parsed by reggen since the description might deviate
+    from the default one.
+
+    Raises ValueError if reggen rejects the register file description.
+    """
+    where = f"register file of pad domain {pad_domain.name}"
+    template_kwargs = _regfile_template_kwargs(padframe, pad_domain, start_address_offset, header_text,
+                                               **extra_template_kwargs)
+    if regfile_template.template == DEFAULT_REGFILE_TEMPLATE:
+        if output_dir is not None:
+            regfile_template.render(output_dir, logger=logger, **template_kwargs)
+        with timed("reggen build register file", pad_domain=pad_domain.name):
+            return IpBlock.from_raw([], regfile_description(padframe, pad_domain, start_address_offset), where)
+    else:
+        hjson_text = regfile_template.render_to_string(logger, **template_kwargs)
+        if output_dir is not None and not regfile_template.skip_generation:
+            write_if_changed(regfile_template.target_path(output_dir, **template_kwargs), hjson_text)
+        with timed("reggen build register file", pad_domain=pad_domain.name):
+            return IpBlock.from_text(hjson_text, [], where)
+
+
+def build_regfiles(regfile_template: PadrickTemplate, logger: logging.Logger, padframe: Padframe, header_text: str,
+                   **extra_template_kwargs) -> List[IpBlock]:
+    """
+    Build the reggen IpBlocks of all pad domains without emitting any files.
+
+    The register files are mapped to a contiguous address space in the order of padframe.pad_domains, i.e. the
+    register file of a pad domain starts at the (exclusive) end address of the previous one.
+
+    Raises ValueError if reggen rejects one of the register file descriptions.
+    """
+    regfiles = []
+    start_address_offset = 0
+    for pad_domain in padframe.pad_domains:
+        obj = build_regfile(regfile_template, None, logger, padframe, pad_domain, start_address_offset, header_text,
+                            **extra_template_kwargs)
+        regfiles.append(obj)
+        start_address_offset = obj.reg_blocks[None].offset
+    return regfiles
@@ -0,0 +1,120 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import io
+import logging
+import sys
+from importlib import resources
+from pathlib import Path
+from typing import Dict, Optional
+
+import lark
+from lark.lark import Lark
+from lark.tree import Tree
+
+logger = logging.getLogger("padrick.LazyParser")
+
+# Package containing the serialized parser tables. The tables are generated at packaging time (see setup.py and the
+# standalone_build Makefile) with `python -m padrick.Model.LazyParser <output_dir>`.
+PARSER_TABLES_PACKAGE = 'padrick.Model.ParserTables'
+PARSER_TABLE_SUFFIX = '.lark'
+
+PARSER_REGISTRY: Dict[str, 'LazyParser'] = {}
+
+
+class LazyParser:
+    """
+    A drop-in replacement for a Lark parser instance that defers the (expensive) grammar analysis until the first
+    parse call.
+
+    On first use, the parser tries to load the serialized parser tables shipped with padrick. Each table starts with a
+    hash of the grammar, the parser options and the lark version. If the hash does not match (e.g. because the grammar
+    was modified or lark was upgraded after packaging) or no table was shipped at all, the parser is rebuilt from the
+    grammar.
+    """
+
+    def __init__(self, name: str, grammar: str, **options):
+        self.name = name
+        self.grammar = grammar
+        self.options = options
+        self._parser: Optional[Lark] = None
+        PARSER_REGISTRY[name] = self
+
+    @property
+    def grammar_hash(self) -> str:
+        options_str = ",".join(f"{key}={value!r}" for key, value in sorted(self.options.items()))
+        hash_input = self.grammar + options_str + lark.__version__
+        return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()
+
+    @property
+    def table_file_name(self) -> str:
+        return self.name + PARSER_TABLE_SUFFIX
+
+    @property
+    def parser(self) -> Lark:
+        if self._parser is None:
+            self._parser = self._load_parser_table()
+            if self._parser is None:
+                self._parser = Lark(self.grammar, **self.options)
+        return self._parser
+
+    def _load_parser_table(self) -> Optional[Lark]:
+        try:
+            table = resources.read_binary(PARSER_TABLES_PACKAGE, self.table_file_name)
+        except (FileNotFoundError, ModuleNotFoundError):
+            logger.debug(f"No serialized parser table found for {self.name}. Building parser from grammar.")
+            return None
+        table_hash, _, serialized_parser = table.partition(b"\n")
+        if table_hash.decode('ascii', errors='replace') != self.grammar_hash:
+            logger.debug(f"Serialized parser table for {self.name} is stale. Building parser from grammar.")
+            return None
+        try:
+            return Lark.load(io.BytesIO(serialized_parser))
+        except Exception as e:
+            logger.debug(f"Failed to load serialized parser table for {self.name}: {e}. Building parser from grammar.")
+            return None
+
+    def parse(self, text: str) -> Tree:
+        return self.parser.parse(text)
+
+    def save(self, output_dir: Path):
+        """Serialize the parser tables of this parser into the given directory."""
+        with (output_dir / self.table_file_name).open('wb') as f:
+            f.write(self.grammar_hash.encode('ascii') + b"\n")
+            Lark(self.grammar, **self.options).save(f)
+
+
+def build_parser_tables(output_dir: Path):
+    """
+    Serialize the parser tables of all padrick grammars into output_dir.
+    """
+    # Import all modules that declare a grammar so their parsers end up in the registry.
+    import padrick.Model.SignalExpressionType
+    import padrick.Model.TemplatedIdentifier
+    import padrick.Model.TemplatedString
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for parser in PARSER_REGISTRY.values():
+        parser.save(output_dir)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(f"Usage: python -m padrick.Model.LazyParser <output_dir>", file=sys.stderr)
+        sys.exit(1)
+    # Use the registry of the regularly imported module instead of the one of the __main__ module.
+    from padrick.Model.LazyParser import build_parser_tables
+    build_parser_tables(Path(sys.argv[1]))
@@ -0,0 +1,142 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, FrozenSet, Iterable, List, Tuple, TYPE_CHECKING
+
+from padrick.Model.Utilities import natsort_key
+
+if TYPE_CHECKING:
+    from padrick.Model.PadDomain import PadDomain
+    from padrick.Model.PadInstance import PadInstance
+    from padrick.Model.Port import Port
+    from padrick.Model.PortGroup import PortGroup
+
+
+class MuxGroupIndex:
+    """
+    Connectivity index between the dynamic pads and the ports of a pad domain.
+
+    A port can be connected to a dynamic pad if they share at least one mux group. The index maps every mux group to
+    its ports and dynamic pads and memoizes the result of each query by the set of mux groups. The index is built once
+    for a fully validated pad domain (see PadDomain.mux_group_index) and must not be used if the pad domain is
+    modified afterwards.
+
+    Ports are returned as (port_group, port) tuples in one of two orders:
+
+    * Domain order: Port groups in declaration order, the ports of each group natsorted by name.
+    * Select order: Port groups and the ports within each group natsorted by name. This is the order in which the
+      ports are enumerated in the mux_sel register of a pad. Select value 0 connects the pad to its configuration
+      register, the first connectable port in select order has select value 1 and so on.
+
+    Dynamic pads are natsorted by name. This is the order in which they are enumerated by the port mux select logic.
+    """
+
+    def __init__(self, pad_domain: 'PadDomain'):
+        self._domain_rank: Dict[Tuple[str, str], int] = {}
+        self._select_rank: Dict[Tuple[str, str], int] = {}
+        self._pad_rank: Dict[str, int] = {}
+        self.ports_by_mux_group: Dict[str, List[Tuple['PortGroup', 'Port']]] = {}
+        self.dynamic_pads_by_mux_group: Dict[str, List['PadInstance']] = {}
+        self._ports_cache: Dict[FrozenSet[str], List[Tuple['PortGroup', 'Port']]] = {}
+        self._select_ports_cache: Dict[FrozenSet[str], List[Tuple['PortGroup', 'Port']]] = {}
+        self._select_values_cache: Dict[FrozenSet[str], Dict[Tuple[str, str], int]] = {}
+        self._pads_cache: Dict[FrozenSet[str], List['PadInstance']] = {}
+
+        def by_name(x):
+            return natsort_key(x.name)
+
+        for port_group in sorted(pad_domain.port_groups, key=by_name):
+            for port in sorted(port_group.ports, key=by_name):
+                self._select_rank[(port_group.name, port.name)] = len(self._select_rank)
+        for port_group in pad_domain.port_groups:
+            for port in sorted(port_group.ports, key=by_name):
+                self._domain_rank[(port_group.name, port.name)] = len(self._domain_rank)
+                for mux_group in port.mux_groups:
+                    self.ports_by_mux_group.setdefault(mux_group, []).append((port_group, port))
+        for pad in sorted(pad_domain.pad_list, key=by_name):
+            if pad.dynamic_pad_signals:
+                self._pad_rank[pad.name] = len(self._pad_rank)
+                for mux_group in pad.mux_groups:
+                    self.dynamic_pads_by_mux_group.setdefault(mux_group, []).append(pad)
+
+    def _collect_ports(self, mux_groups: FrozenSet[str]) -> Dict[Tuple[str, str], Tuple['PortGroup', 'Port']]:
+        ports = {}
+        for mux_group in mux_groups:
+            for port_group, port in self.ports_by_mux_group.get(mux_group, []):
+                ports[(port_group.name, port.name)] = (port_group, port)
+        return ports
+
+    def get_ports(self, mux_groups: Iterable[str]) -> List[Tuple['PortGroup', 'Port']]:
+        """
+        Returns all ports that share at least one mux group with mux_groups in domain order.
+        """
+        mux_groups = frozenset(mux_groups)
+        ports = self._ports_cache.get(mux_groups)
+        if ports is None:
+            collected = self._collect_ports(mux_groups)
+            ports = [collected[key] for key in sorted(collected, key=self._domain_rank.__getitem__)]
+            self._ports_cache[mux_groups] = ports
+        return ports
+
+    def get_select_ports(self, mux_groups: Iterable[str]) -> List[Tuple['PortGroup', 'Port']]:
+        """
+        Returns all ports that share at least one mux group with mux_groups in select order.
+        """
+        mux_groups = frozenset(mux_groups)
+        ports = self._select_ports_cache.get(mux_groups)
+        if ports is None:
+            collected = self._collect_ports(mux_groups)
+            ports = [collected[key] for key in sorted(collected, key=self._select_rank.__getitem__)]
+            self._select_ports_cache[mux_groups] = ports
+        return ports
+
+    def get_select_value(self, mux_groups: Iterable[str], port_group: 'PortGroup', port: 'Port') -> int:
+        """
+        Returns the mux select value of port for a pad with the given mux groups or 0 if the port is not connectable.
+        """
+        mux_groups = frozenset(mux_groups)
+        select_values = self._select_values_cache.get(mux_groups)
+        if select_values is None:
+            select_values = {(pg.name, p.name): idx + 1 for idx, (pg, p) in enumerate(self.get_select_ports(mux_groups))}
+            self._select_values_cache[mux_groups] = select_values
+        return select_values.get((port_group.name, port.name), 0)
+
+    def get_dynamic_pads(self, mux_groups: Iterable[str]) -> List['PadInstance']:
+        """
+        Returns all dynamic pads that share at least one mux group with mux_groups natsorted by name.
+        """
+        mux_groups = frozenset(mux_groups)
+        pads = self._pads_cache.get(mux_groups)
+        if pads is None:
+            collected = {}
+            for mux_group in mux_groups:
+                for pad in self.dynamic_pads_by_mux_group.get(mux_group, []):
+                    collected[pad.name] = pad
+            pads = [collected[name] for name in sorted(collected, key=self._pad_rank.__getitem__)]
+            self._pads_cache[mux_groups] = pads
+        return pads
+
+    def get_connectable_ports(self, pad: 'PadInstance') -> List[Tuple['PortGroup', 'Port']]:
+        """
+        Returns the ports that can be connected to pad in select order.
+        """
+        return self.get_select_ports(pad.mux_groups)
+
+    def get_connectable_pads(self, port: 'Port') -> List['PadInstance']:
+        """
+        Returns the dynamic pads that can be connected to port natsorted by name.
+        """
+        return self.get_dynamic_pads(port.mux_groups)
@@ -14,28 +14,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import itertools
 import logging
 from typing import List, Optional, Set, Mapping, Iterable, Dict, Union
 
 import click_log
 from padrick.Model.Constants import SYSTEM_VERILOG_IDENTIFIER
+from padrick.Model.MuxGroupIndex import MuxGroupIndex
 from padrick.Model.PadInstance import PadInstance
+from padrick.Model.PadListCSV import import_csv_pad_lists
 from padrick.Model.PadSignal import Signal, SignalDirection
 from padrick.Model.PadType import PadType
 from padrick.Model.ParseContext import PARSE_CONTEXT
 from padrick.Model.Port import Port
 from padrick.Model.PortGroup import PortGroup
-from pydantic import BaseModel, constr, conlist, root_validator, validator
-from natsort import natsorted
+from pydantic import constr, conlist, root_validator, validator
 
 from padrick.Model.SignalExpressionType import SignalExpressionType
-from padrick.Model.Utilities import sort_signals, sort_ports, sort_pads
+from padrick.Model.Utilities import sort_signals, sort_ports, cached_property, CachedPropertiesModel, \
+    natsort_key, mux_group_name
+from padrick.Profiling import timed
 
 logger = logging.getLogger("padrick.Configparser")
 click_log.basic_config(logger)
 
-class PadDomain(BaseModel):
+class PadDomain(CachedPropertiesModel):
     """
     A pad_domain contains the configuration about one collection of pads and ports that can connected with each other.
     """
@@ -46,7 +48,6 @@ class PadDomain(BaseModel):
     port_groups: List[PortGroup] = []
     user_attr: Optional[Dict[str, Union[str, int, bool]]]
 
-
     def __init__(self, *args, **kwargs):
         PARSE_CONTEXT.set_context(self)
         super().__init__(*args, **kwargs)
@@ -54,8 +55,9 @@ class PadDomain(BaseModel):
     @validator('port_groups')
     def expand_multi_port_groups(cls, port_groups: List[PortGroup]):
         expanded_port_groups = []
-        for port_group in port_groups:
-            expanded_port_groups.extend(port_group.expand_port_group())
+        with timed("expand multiple port groups"):
+            for port_group in port_groups:
+                expanded_port_groups.extend(port_group.expand_port_group())
         return expanded_port_groups
 
     @validator('port_groups')
@@ -81,11 +83,16 @@ class PadDomain(BaseModel):
                     pad_signals_seen.add(pad_signal)
         return values
 
+    @validator('pad_list', pre=True)
+    def import_pad_list_csv_files(cls, pad_list):
+        return import_csv_pad_lists(pad_list)
+
     @validator('pad_list')
     def expand_multi_pads(cls, pads: List[PadInstance]):
         expanded_pads = []
-        for pad in pads:
-            expanded_pads.extend(pad.expand_padinstance())
+        with timed("expand multiple pads"):
+            for pad in pads:
+                expanded_pads.extend(pad.expand_padinstance())
         return expanded_pads
 
     @validator("pad_list")
@@ -95,6 +102,7 @@ class PadDomain(BaseModel):
             if "self" in pad.mux_groups:
                 pad.mux_groups.discard("self")
                 pad.mux_groups.add(pad.name.lower().strip())
+                pad.invalidate_cached_properties()
         return pads
 
     @validator('port_groups')
@@ -112,6 +120,7 @@ class PadDomain(BaseModel):
                 if "self" in port.mux_groups:
                     port.mux_groups.discard("self")
                     port.mux_groups.add(f"{values['name']}_{port.name}")
+                    port.invalidate_cached_properties()
         return port_groups
 
 
@@ -149,6 +158,8 @@ class PadDomain(BaseModel):
     def validate_and_link_default_ports(cls, values):
         pad: PadInstance
         default_port2pad = {}
+        ports_by_name = {(port_group.name, port.name): (port_group, port) for port_group in values['port_groups']
+                         for port in port_group.ports}
         for pad in values['pad_list']:
             # Try to find the port in the port in the list of muxable ports for this pad_instance
             if isinstance(pad.default_port, str):
@@ -157,15 +168,13 @@ class PadDomain(BaseModel):
                 else:
                     default_port2pad[pad.default_port].append(pad)
                 (default_port_group_name, default_port_name) = pad.default_port.split(".", maxsplit=1)
-                linked_default_port = None
-                for port_group in values['port_groups']:
-                    if port_group.name == default_port_group_name:
-                        for port in port_group.ports:
-                            if port.mux_groups.intersection(pad.mux_groups) and port.name == default_port_name:
-                                linked_default_port = (port_group, port)
-                                break
-                if linked_default_port:
-                    pad.default_port = linked_default_port
+                linked_default_port = ports_by_name.get((default_port_group_name, default_port_name))
+                if linked_default_port and linked_default_port[1].mux_groups.intersection(pad.mux_groups):
+                    # Link the port without going through validate_assignment. Validating the (port_group, port)
+                    # tuple against the TemplatedPortIdentifierType alternative of the field stringifies the whole
+                    # port group which is very slow for large port groups.
+                    object.__setattr__(pad, 'default_port', linked_default_port)
+                    pad.invalidate_cached_properties()
                 else:
                     raise ValueError(f"Default_port {pad.default_port} for pad {pad.name} is not in the list of connectable ports.")
         # Now check all default_port -> pad mappings to see if there are any pads with identical default port. If there
@@ -219,31 +228,31 @@ class PadDomain(BaseModel):
                             f" {str(port.mux_groups)} but no pad specifies any of these mux groups.")
         return values
 
-    @property
+    @cached_property
     def override_signals(self) -> List[Signal]:
         override_signals = set()
         for pad in self.pad_list:
             override_signals.update(pad.override_signals)
         return sort_signals(override_signals)
 
-    @property
+    @cached_property
     def static_connection_signals(self) -> List[Signal]:
         static_connection_signals = set()
         for pad in self.pad_list:
             static_connection_signals.update(pad.static_connection_signals)
         return sort_signals(static_connection_signals)
 
-    @property
+    # The following properties filter the already sorted (and duplicate free) signal lists above which preserves
+    # their order.
+    @cached_property
     def static_connection_signals_soc2pad(self) -> List[Signal]:
-        return sort_signals(set([signal for signal in self.static_connection_signals if signal.direction ==
-                    SignalDirection.soc2pads]))
+        return [signal for signal in self.static_connection_signals if signal.direction == SignalDirection.soc2pads]
 
-    @property
+    @cached_property
     def static_connection_signals_pad2soc(self) -> List[Signal]:
-        return sort_signals(set([signal for signal in self.static_connection_signals if signal.direction ==
-                    SignalDirection.pads2soc]))
+        return [signal for signal in self.static_connection_signals if signal.direction == SignalDirection.pads2soc]
 
-    @property
+    @cached_property
     def dynamic_pad_signals(self) -> List[Signal]:
         dynamic_pad_signals = set()
         for pad in self.pad_list:
@@ -257,40 +266,42 @@ class PadDomain(BaseModel):
                 dynamic_pad_signals.update(pad.dynamic_pad_signals)
         return sort_signals(dynamic_pad_signals)
 
-    @property
+    @cached_property
     def dynamic_pad_signals_soc2pad(self) -> List[Signal]:
-        return sort_signals(set([signal for signal in self.dynamic_pad_signals if signal.direction ==
-                          SignalDirection.soc2pads]))
+        return [signal for signal in self.dynamic_pad_signals if signal.direction == SignalDirection.soc2pads]
 
     def get_dynamic_pad_signals_soc2pad_for_mux_group(self, mux_group: str) -> List[Signal]:
-        return sort_signals(set([signal for signal in self.get_dynamic_pad_signals_for_mux_group(mux_group) if
-                        signal.direction ==
-                    SignalDirection.soc2pads]))
+        return [signal for signal in self.get_dynamic_pad_signals_for_mux_group(mux_group) if
+                signal.direction == SignalDirection.soc2pads]
 
-    @property
+    @cached_property
     def dynamic_pad_signals_pad2soc(self):
-        return sort_signals(set([signal for signal in self.dynamic_pad_signals if signal.direction ==
-                                 SignalDirection.pads2soc]))
+        return [signal for signal in self.dynamic_pad_signals if signal.direction == SignalDirection.pads2soc]
 
     def get_dynamic_pad_signals_pad2soc_for_mux_group(self, mux_group: str):
-        return sort_signals(set([signal for signal in self.get_dynamic_pad_signals_for_mux_group(mux_group) if
-                        signal.direction ==
-                    SignalDirection.pads2soc]))
+        return [signal for signal in self.get_dynamic_pad_signals_for_mux_group(mux_group) if
+                signal.direction == SignalDirection.pads2soc]
+
+    @cached_property
+    def mux_group_index(self) -> MuxGroupIndex:
+        """
+        The connectivity index between the dynamic pads and the ports of this pad domain. The index is built on first
+        access, i.e. after the pad domain was validated.
+        """
+        return MuxGroupIndex(self)
 
     def get_ports_in_mux_groups(self, mux_groups: Set[str]) -> List[Port]:
-        ports_in_mux_groups = list(itertools.chain(*[port_group.get_ports_in_mux_groups(mux_groups) for port_group in self.port_groups]))
-        return ports_in_mux_groups
+        return [port for _, port in self.mux_group_index.get_ports(mux_groups)]
 
-    def get_dynamic_pads_in_mux_groups(self, mux_groups: Set[str]) -> List[Port]:
-        pads_in_mux_groups = [pad for pad in self.pad_list if mux_groups.intersection(pad.mux_groups) and pad.dynamic_pad_signals]
-        return sort_pads(pads_in_mux_groups)
+    def get_dynamic_pads_in_mux_groups(self, mux_groups: Set[str]) -> List[PadInstance]:
+        return list(self.mux_group_index.get_dynamic_pads(mux_groups))
 
-    @property
+    @cached_property
     def port_mux_group_sets(self) -> List[Set[str]]:
         port_mux_group_sets = set((frozenset(port.mux_groups) for port_group in self.port_groups for port in port_group.ports))
-        return natsorted(port_mux_group_sets, lambda x: "_".join(natsorted(x)).upper())
+        return sorted(port_mux_group_sets, key=lambda x: natsort_key(mux_group_name(x)))
 
-    @property
+    @cached_property
     def pad_mux_group_sets(self) -> List[Set[str]]:
         pad_mux_group_sets = set((frozenset(pad.mux_groups) for pad in self.pad_list if pad.dynamic_pad_signals))
-        return natsorted(pad_mux_group_sets, lambda x: "_".join(natsorted(x)).upper())
+        return sorted(pad_mux_group_sets, key=lambda x: natsort_key(mux_group_name(x)))
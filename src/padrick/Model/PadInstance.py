@@ -17,8 +17,6 @@ import logging
 from typing import Optional, Mapping, List, Union, Set, Tuple, Dict
 from typing_extensions import Literal
 
-from natsort import natsorted
-
 from padrick.Model.Port import Port
 from padrick.Model.Constants import SYSTEM_VERILOG_IDENTIFIER, LOWERCASE_IDENTIFIER
 from padrick.Model.ParseContext import PARSE_CONTEXT
@@ -26,17 +24,18 @@ from padrick.Model.PadSignal import PadSignal, ConnectionType, PadSignalKind, Si
 from padrick.Model.PadType import PadType
 from padrick.Model.PortGroup import PortGroup
 from padrick.Model.SignalExpressionType import SignalExpressionType
-from pydantic import BaseModel, constr, validator, root_validator, Extra, conint, Field, conset
+from pydantic import constr, validator, root_validator, Extra, conint, Field, conset
 
 from padrick.Model.TemplatedIdentifier import TemplatedIdentifierType
 from padrick.Model.TemplatedPortIdentifier import TemplatedPortIdentifierType
 from padrick.Model.TemplatedString import TemplatedStringType
 from padrick.Model.UserAttrs import UserAttrs
-from padrick.Model.Utilities import sort_signals, cached_property
+from padrick.Model.Utilities import sort_signals, cached_property, CachedPropertiesModel, validate_field, \
+    mux_group_name
 
 logger = logging.getLogger("padrick.Configparser")
 
-class PadInstance(BaseModel):
+class PadInstance(CachedPropertiesModel):
     name: TemplatedIdentifierType
     description: Optional[TemplatedStringType]
     multiple: conint(ge=1) = 1
@@ -46,7 +45,6 @@ class PadInstance(BaseModel):
     connections: Optional[Mapping[Union[PadSignal, str], Optional[SignalExpressionType]]]
     default_port: Optional[Union[Mapping[Union[Literal['*'], TemplatedIdentifierType], TemplatedPortIdentifierType], TemplatedPortIdentifierType, Tuple[PortGroup, Port]]]
     user_attr: Optional[UserAttrs]
-    _method_cache: Mapping = {}
 
     #pydantic model config
     class Config:
@@ -121,7 +119,7 @@ class PadInstance(BaseModel):
         return values
 
 
-    @property
+    @cached_property
     def static_connection_signals(self) -> List[Signal]:
         """
         Returns all static connection signals used for the given pad.
@@ -141,7 +139,7 @@ class PadInstance(BaseModel):
                     signals.add(static_signal)
         return sort_signals(signals)
 
-    @property
+    @cached_property
     def override_signals(self) -> List[Signal]:
         signals = set()
         for pad_signal in self.pad_type.pad_signals:
@@ -207,43 +205,57 @@ class PadInstance(BaseModel):
 
     @cached_property
     def mux_group_name(self) -> str:
-        return "_".join(natsorted(self.mux_groups)).upper()
+        return mux_group_name(self.mux_groups)
 
     def expand_padinstance(self) -> List['PadInstance']:
+        """
+        Expand a pad instance with multiple>1 into individual pad instances replacing the index templates in name,
+        description, mux_groups, default_port, user_attr and the connection expressions with the array index.
+
+        The expanded instances are built directly from the already validated fields of this instance. Only the fields
+        that change are validated again (instead of validating every single assignment of a copied instance).
+        """
+        cls = type(self)
         expanded_pads = []
         # We use the following variable to detect if a default port mapping contains any mappings that are not used which
         # most likely is a user typo. We want to warn the user about this.
         matched_default_port_mappings = set()
+        fields_set = self.__fields_set__ | {'name', 'description', 'user_attr', 'mux_groups', 'multiple'}
+        if self.default_port:
+            fields_set.add('default_port')
+        if self.connections:
+            fields_set.add('connections')
         for i in range(self.multiple):
-            expanded_pad = self.copy()
-            expanded_pad._method_cache = {}
-            expanded_pad.name = expanded_pad.name.evaluate_template(i)
-            expanded_pad.description = expanded_pad.description.evaluate_template(i) if expanded_pad.description else None
-            expanded_pad.user_attr = expanded_pad.user_attr.expand_user_attrs(i) if expanded_pad.user_attr else None
-            expanded_pad.mux_groups = set(map(lambda mux_group: mux_group.evaluate_template(i), expanded_pad.mux_groups))
-            expanded_pad.multiple = 1
-            if expanded_pad.default_port:
+            values = dict(self.__dict__)
+            values['name'] = validate_field(cls, 'name', self.name.evaluate_template(i))
+            values['description'] = self.description.evaluate_template(i) if self.description else None
+            values['user_attr'] = validate_field(cls, 'user_attr', self.user_attr.expand_user_attrs(i)) \
+                if self.user_attr else None
+            values['mux_groups'] = validate_field(cls, 'mux_groups', set(
+                map(lambda mux_group: mux_group.evaluate_template(i), self.mux_groups)))
+            values['multiple'] = 1
+            if self.default_port:
                 # Default port can be a single TemplatedPortIdentifier that we should expand or it can
                 # be a mapping from expanded pad names to TemplatedPortIdentifier. Expand both options
                 # in the right way.
-                if isinstance(expanded_pad.default_port, Mapping):
+                if isinstance(self.default_port, Mapping):
                     default_port = None
-                    for pad_name_tmpl, port_tmpl in expanded_pad.default_port.items():
-                        if pad_name_tmpl == "*" or expanded_pad.name == pad_name_tmpl.evaluate_template(i):
+                    for pad_name_tmpl, port_tmpl in self.default_port.items():
+                        if pad_name_tmpl == "*" or values['name'] == pad_name_tmpl.evaluate_template(i):
                             default_port = port_tmpl.evaluate_template(i)
                             matched_default_port_mappings.add(pad_name_tmpl)
-                    expanded_pad.default_port = default_port
                 else:
-                     expanded_pad.default_port = expanded_pad.default_port.evaluate_template(i)
+                    default_port = self.default_port.evaluate_template(i)
+                values['default_port'] = validate_field(cls, 'default_port', default_port)
 
-            expanded_connections = {}
-            if expanded_pad.connections:
-                for key, value in expanded_pad.connections.items():
+            if self.connections:
+                expanded_connections = {}
+                for key, value in self.connections.items():
                     if isinstance(value, SignalExpressionType):
-                        value = str(value.evaluate_template(i))
+                        value = value.evaluate_template(i)
                     expanded_connections[key] = value
-                expanded_pad.connections = expanded_connections
-            expanded_pads.append(expanded_pad)
+                values['connections'] = validate_field(cls, 'connections', expanded_connections, values)
+            expanded_pads.append(cls.construct(_fields_set=set(fields_set), **values))
         # For default_port mappings, check if all user supplied mappings have been matched to an expanded pad. If not,
         # this is most likely a user error (typo) and we should warn about it.
         if isinstance(self.default_port, Mapping) and matched_default_port_mappings != set(self.default_port.keys()):
@@ -0,0 +1,264 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import csv
+import re
+from typing import Callable, Dict, Any, Iterator, Tuple, List, Optional, Union
+
+from pydantic import ValidationError
+from yamlinclude.readers import Reader
+
+from padrick.Model.PadInstance import PadInstance
+from padrick.Model.ParseContext import PARSE_CONTEXT
+from padrick.Model.Utilities import validate_field
+from padrick.Profiling import timed
+
+# The columns of a pad list CSV file and whether they are required
+PAD_LIST_CSV_COLUMNS = {
+    'name': True,
+    'pad_type': True,
+    'description': False,
+    'mux_groups': False,
+    'is_static': False,
+    'default_port': False,
+    'connections': False,
+}
+
+# Report at most this many erroneous rows of a CSV file
+MAX_REPORTED_ROW_ERRORS = 20
+
+_MUX_GROUP_SEPARATOR = re.compile(r"[\s,]+")
+_TRUE_VALUES = {'true', 'yes', 'y', '1'}
+_FALSE_VALUES = {'false', 'no', 'n', '0'}
+
+
+def _convert_field(field: str) -> Callable[[str], Any]:
+    def convert(cell: str):
+        return validate_field(PadInstance, field, cell.strip())
+    return convert
+
+
+def _convert_bool(cell: str) -> bool:
+    value = cell.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value '{cell}'. Use true or false.")
+
+
+def _make_mux_groups_converter() -> Callable[[str], Any]:
+    # Pad lists usually assign the same few mux group combinations to many pads. Validate every distinct cell only
+    # once. The normalization of 'self' mux groups modifies the set in-place, hence every pad gets its own copy.
+    validated_mux_groups = {}
+
+    def convert(cell: str):
+        mux_groups = frozenset(_MUX_GROUP_SEPARATOR.split(cell.strip()))
+        if mux_groups not in validated_mux_groups:
+            validated_mux_groups[mux_groups] = validate_field(PadInstance, 'mux_groups', set(mux_groups))
+        return set(validated_mux_groups[mux_groups])
+    return convert
+
+
+def _convert_connections(cell: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a list of 'pad_signal=expression' entries separated by semicolons. An empty expression leaves the (output)
+    pad signal unconnected.
+    """
+    connections = {}
+    for entry in cell.split(';'):
+        if not entry.strip():
+            continue
+        pad_signal, separator, expression = entry.partition('=')
+        pad_signal = pad_signal.strip()
+        if not separator or not pad_signal:
+            raise ValueError(f"Invalid connection '{entry.strip()}'. Connections must be of the form "
+                             f"'pad_signal=expression' and separated by semicolons.")
+        if pad_signal in connections:
+            raise ValueError(f"Pad signal {pad_signal} is connected more than once.")
+        connections[pad_signal] = expression.strip() or None
+    return connections
+
+
+def _make_converters() -> Dict[str, Callable[[str], Any]]:
+    """
+    Returns the converters from the cell content of each column to the value of the corresponding PadInstance field
+    that do not depend on the other columns. The pad_type and the connections are linked with the pad domain when the
+    pad instance is built.
+    """
+    return {
+        'name': _convert_field('name'),
+        'pad_type': str.strip,
+        'description': _convert_field('description'),
+        'mux_groups': _make_mux_groups_converter(),
+        'is_static': _convert_bool,
+        'default_port': _convert_field('default_port'),
+        'connections': _convert_connections,
+    }
+
+
+def _format_error(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(error['msg'] for error in e.errors())
+    return str(e)
+
+
+class PadListCSV:
+    """
+    A pad list stored in a CSV file with one pad instance per row. Include it as the pad_list of a pad domain (or as
+    one of several pad list fragments matched by a wildcard pattern) with:
+
+        pad_list: !include {pathname: pads.csv, reader: pad_list}
+
+    The first row contains the column names (see PAD_LIST_CSV_COLUMNS). mux_groups are separated by whitespace or
+    commas and connections are 'pad_signal=expression' entries separated by semicolons. Empty rows and rows whose first
+    cell starts with '#' are ignored.
+
+    The file is only read when the pad domain is validated. Its rows are streamed and converted to pad instances
+    directly.
+    """
+
+    def __init__(self, path: str, encoding: Optional[str] = None):
+        self.path = path
+        self.encoding = encoding
+
+    def __repr__(self):
+        return f"PadListCSV({self.path!r})"
+
+    def rows(self) -> Iterator[Tuple[int, Union[Dict[str, Any], Exception]]]:
+        """
+        Stream the rows of the CSV file. Yields the line number of every row and its cells converted to PadInstance
+        field values. Rows that cannot be converted yield the exception instead of the values.
+
+        Raises a ValueError if the header row is invalid.
+        """
+        converters = _make_converters()
+        with open(self.path, encoding=self.encoding, newline='') as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, None)
+            if header is None:
+                raise ValueError(f"{self.path}: The pad list is empty.")
+            columns = [column.strip().lower() for column in header]
+            unknown_columns = [column for column in columns if column not in PAD_LIST_CSV_COLUMNS]
+            if unknown_columns:
+                raise ValueError(f"{self.path}, line {reader.line_num}: Unknown column(s) "
+                                 f"{', '.join(unknown_columns)}. Valid columns are {', '.join(PAD_LIST_CSV_COLUMNS)}.")
+            missing_columns = [column for column, required in PAD_LIST_CSV_COLUMNS.items()
+                               if required and column not in columns]
+            if missing_columns:
+                raise ValueError(f"{self.path}, line {reader.line_num}: Missing column(s) "
+                                 f"{', '.join(missing_columns)}.")
+            if len(set(columns)) != len(columns):
+                raise ValueError(f"{self.path}, line {reader.line_num}: Duplicate column names.")
+            column_converters = [(column, converters[column]) for column in columns]
+            for row in reader:
+                if not any(cell.strip() for cell in row) or row[0].lstrip().startswith('#'):
+                    continue
+                if len(row) > len(columns):
+                    yield reader.line_num, ValueError(f"Expected {len(columns)} cells but got {len(row)}.")
+                    continue
+                values = {}
+                try:
+                    # Empty cells leave the field unset
+                    for (column, convert), cell in zip(column_converters, row):
+                        if cell.strip():
+                            values[column] = convert(cell)
+                except (ValueError, TypeError) as e:
+                    yield reader.line_num, ValueError(f"Column {column}: {_format_error(e)}")
+                    continue
+                empty_columns = [column for column, required in PAD_LIST_CSV_COLUMNS.items()
+                                 if required and column not in values]
+                if empty_columns:
+                    yield reader.line_num, ValueError(f"Missing value for column(s) {', '.join(empty_columns)}.")
+                    continue
+                yield reader.line_num, values
+
+    def pad_instances(self) -> List[PadInstance]:
+        """
+        Build the pad instances of all rows. Must be called while the pad domain is validated since the pad types and
+        pad signals are looked up in the parse context.
+
+        Raises a ValueError that lists the line numbers of all (up to MAX_REPORTED_ROW_ERRORS) erroneous rows.
+        """
+        pad_instances = []
+        errors = []
+        with timed("import pad list CSV", file=self.path):
+            for line, values in self.rows():
+                if isinstance(values, Exception):
+                    errors.append(f"{self.path}, line {line}: {_format_error(values)}")
+                    continue
+                try:
+                    pad_instances.append(_build_pad_instance(values))
+                except (ValueError, TypeError) as e:
+                    errors.append(f"{self.path}, line {line}: {_format_error(e)}")
+        if errors:
+            message = "\n".join(errors[:MAX_REPORTED_ROW_ERRORS])
+            if len(errors) > MAX_REPORTED_ROW_ERRORS:
+                message += f"\n... and {len(errors) - MAX_REPORTED_ROW_ERRORS} more erroneous rows"
+            raise ValueError(f"Invalid rows in pad list CSV file:\n{message}")
+        return pad_instances
+
+
+def _build_pad_instance(values: Dict[str, Any]) -> PadInstance:
+    """
+    Build a pad instance from the converted cells of a CSV row. Only the fields that depend on the pad domain are
+    validated here, the other ones have already been validated by the column converters.
+    """
+    fields_set = set(values.keys())
+    pad_type = PARSE_CONTEXT.find_pad_type(values['pad_type'])
+    if not pad_type:
+        raise ValueError(f"Unknown pad_type {values['pad_type']}. Did you mispell the pad_type or forgot to declare "
+                         f"it?")
+    values['pad_type'] = pad_type
+    values.setdefault('is_static', False)
+    if 'mux_groups' not in values:
+        values['mux_groups'] = set(PadInstance.__fields__['mux_groups'].default)
+    for field in ('description', 'default_port', 'connections', 'user_attr'):
+        values.setdefault(field, None)
+    if values['connections'] is not None:
+        values['connections'] = validate_field(PadInstance, 'connections', values['connections'], values)
+    values['multiple'] = 1
+    for _, root_validator in PadInstance.__post_root_validators__:
+        values = root_validator(PadInstance, values)
+    return PadInstance.construct(_fields_set=fields_set, **values)
+
+
+class PadListCSVReader(Reader):
+    """
+    Reader for the yamlinclude package that includes a CSV file as a PadListCSV (use reader: pad_list).
+    """
+
+    def __init__(self, path, encoding, *args, **kwargs):  # pylint:disable=unused-argument
+        super().__init__(path, encoding)
+
+    def __call__(self) -> PadListCSV:
+        return PadListCSV(self._path, self._encoding)
+
+
+def import_csv_pad_lists(pad_list: Union[PadListCSV, List[Any], Any]) -> Union[List[Any], Any]:
+    """
+    Replace all PadListCSV entries of a pad list (or the pad list itself) with the pad instances of their rows.
+    """
+    if isinstance(pad_list, PadListCSV):
+        return pad_list.pad_instances()
+    if isinstance(pad_list, list) and any(isinstance(entry, PadListCSV) for entry in pad_list):
+        imported_pad_list = []
+        for entry in pad_list:
+            if isinstance(entry, PadListCSV):
+                imported_pad_list.extend(entry.pad_instances())
+            else:
+                imported_pad_list.append(entry)
+        return imported_pad_list
+    return pad_list
@@ -39,28 +39,70 @@ class ConnectionType(str, Enum):
     static = "static"
     dynamic = "dynamic"
 
-class Signal(BaseModel):
-    name: TemplatedIdentifierType
-    size: conint(ge=1, le=32) = 1
-    _direction: Optional[SignalDirection] = PrivateAttr(None)
-
-    def __init__(self, direction=None, *values, **kwargs):
-        super().__init__(*values, **kwargs)
-        self._direction = direction
+class _SignalIdentity:
+    """
+    Signals and pad signals are identified by their name, size and direction. A signal compares equal to (and hashes
+    like) any other signal or pad signal with the same name, size and direction.
+    """
+    __slots__ = ()
 
     def __eq__(self, other):
-        if isinstance(other, Signal):
+        if isinstance(other, _SignalIdentity):
             return self.name == other.name and self.size == other.size and self.direction == other.direction
         else:
-            raise NotImplemented
-    @property
-    def direction(self):
-        return self._direction
+            return NotImplemented
 
     def __hash__(self):
         return hash((self.name, self.size, self.direction))
 
-class PadSignal(Signal):
+
+class Signal(_SignalIdentity):
+    """
+    An immutable signal derived from the configuration, e.g. the port signals of a port or the signals referenced by
+    connection expressions.
+
+    Derived signals are created in large numbers while validating and rendering a padframe. In contrast to the
+    pydantic models of the configuration, creating one does not involve any validation.
+    """
+    __slots__ = ('name', 'size', 'direction', '_hash')
+
+    def __init__(self, name: str, size: int = 1, direction: Optional[SignalDirection] = None):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'size', size)
+        object.__setattr__(self, 'direction', direction)
+        object.__setattr__(self, '_hash', hash((name, size, direction)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Signal is immutable. Cannot set attribute {key}.")
+
+    # Signals are hashed far more often than they are created
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return Signal, (self.name, self.size, self.direction)
+
+    def __repr__(self):
+        return f"Signal(name={self.name!r}, size={self.size}, direction={self.direction})"
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, v):
+        # Derived signals are never part of the user's configuration. Only accept signals that have already been
+        # linked (e.g. when a validated model is validated again).
+        if isinstance(v, Signal):
+            return v
+        elif isinstance(v, PadSignal):
+            return Signal(v.name, v.size, v.direction)
+        raise TypeError("Expected a signal")
+
+
+class PadSignal(_SignalIdentity, BaseModel):
+    name: TemplatedIdentifierType
+    size: conint(ge=1, le=32) = 1
     description: Optional[str]
     kind: PadSignalKind
     conn_type: Optional[ConnectionType]
@@ -71,6 +113,9 @@ class PadSignal(Signal):
     _static_signals: Set[Signal] = PrivateAttr(default=set())
     user_attr: Optional[UserAttrs]
 
+    # The pydantic metaclass sets __hash__ to None for models that are not frozen
+    __hash__ = _SignalIdentity.__hash__
+
     @property
     def direction(self):
         if self.kind == PadSignalKind.input:
@@ -21,12 +21,13 @@ from padrick.Model.ParseContext import PARSE_CONTEXT
 from padrick.Model.PadSignal import PadSignal, PadSignalKind
 from mako import exceptions
 from mako.template import Template
-from pydantic import BaseModel, constr, validator, conlist, Extra
+from pydantic import constr, validator, conlist, Extra
 
 from padrick.Model.UserAttrs import UserAttrs
+from padrick.Model.Utilities import cached_property, CachedPropertiesModel
 
 
-class PadType(BaseModel):
+class PadType(CachedPropertiesModel):
     name: constr(regex=SYSTEM_VERILOG_IDENTIFIER)
     description: Optional[str]
     template: str
@@ -63,8 +64,15 @@ class PadType(BaseModel):
             raise ValueError("Each IO Pad Type must contain at least one Pad Signal of kind 'pad'")
         return v
 
-    def get_pad_signal(self, name: str) -> PadSignal:
+    @cached_property
+    def pad_signal_index(self) -> Dict[str, PadSignal]:
+        pad_signal_index = {}
         for pad_signal in self.pad_signals:
-            if pad_signal.name == name:
-                return pad_signal
+            pad_signal_index.setdefault(pad_signal.name, pad_signal)
+        return pad_signal_index
+
+    def get_pad_signal(self, name: str) -> PadSignal:
+        pad_signal = self.pad_signal_index.get(name)
+        if pad_signal is not None:
+            return pad_signal
         raise ValueError(f"Did not find  Pad Signal {name} in scope of Pad Type {self.name}")
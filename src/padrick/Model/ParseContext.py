@@ -14,29 +14,63 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Set, Mapping, Union, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Mapping, Union, List, Optional, Iterator, Dict
+
+
+class _ParseState:
+    def __init__(self, pad_domain: Optional['PadDomain'] = None):
+        self.current_pad_domain = pad_domain
+        self.pad_types: Mapping[str, 'PadType'] = {}
+        # Index of all pad signals of the registered pad types by name
+        self.pad_signals: Dict[str, List['PadSignal']] = {}
+
+
+_PARSE_STATE: ContextVar[Optional[_ParseState]] = ContextVar('padrick_parse_state', default=None)
 
 
 class ParseContext:
-    _current_pad_domain: 'PadDomain'
-    _pad_types: Mapping[str, 'PadType'] = {}
+    """
+    Keeps track of the pad domain that is currently being validated and of its pad types. Validators of pad instances
+    and ports use it to link pad types and pad signals by name.
+
+    The state is stored in a context variable. Every thread (and every asyncio task) thus sees its own parse context
+    and several configurations can be validated concurrently within the same process.
+    """
+
+    @property
+    def _state(self) -> _ParseState:
+        state = _PARSE_STATE.get()
+        if state is None:
+            state = _ParseState()
+            _PARSE_STATE.set(state)
+        return state
+
+    @contextmanager
+    def scope(self) -> Iterator['ParseContext']:
+        """
+        Validate a configuration within a fresh parse context that is discarded afterwards.
+        """
+        token = _PARSE_STATE.set(_ParseState())
+        try:
+            yield self
+        finally:
+            _PARSE_STATE.reset(token)
 
     def set_context(self, ctx: 'PadDomain'):
-        self._current_pad_domain = ctx
-        self._pad_types = {}
+        _PARSE_STATE.set(_ParseState(ctx))
 
     def register_pad_type(self, pad_type: 'PadType'):
-        self._pad_types[pad_type.name] = pad_type
+        state = self._state
+        state.pad_types[pad_type.name] = pad_type
+        for pad_signal in pad_type.pad_signals:
+            state.pad_signals.setdefault(pad_signal.name, []).append(pad_signal)
 
     def find_pad_type(self, name: str) -> Union['PadType', None]:
-        return self._pad_types.get(name, None)
+        return self._state.pad_types.get(name, None)
 
     def find_pad_signal_instances(self, name: str) -> List[Union['Signal']]:
-        pad_signal_references = []
-        for pad_type in self._pad_types.values():
-            for pad_signal in pad_type.pad_signals:
-                if pad_signal.name == name:
-                    pad_signal_references.append(pad_signal)
-        return pad_signal_references
+        return list(self._state.pad_signals.get(name, []))
 
 PARSE_CONTEXT = ParseContext()
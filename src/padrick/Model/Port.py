@@ -17,21 +17,20 @@
 from functools import reduce
 from typing import Optional, Mapping, Union, Set, List, Dict
 
-from natsort import natsorted
-
 from padrick.Model.TemplatedIdentifier import TemplatedIdentifierType
 from padrick.Model.Constants import SYSTEM_VERILOG_IDENTIFIER, LOWERCASE_IDENTIFIER
 from padrick.Model.ParseContext import PARSE_CONTEXT
 from padrick.Model.PadSignal import PadSignal, ConnectionType, PadSignalKind, Signal, SignalDirection
 from padrick.Model.SignalExpressionType import SignalExpressionType
-from pydantic import BaseModel, constr, validator, Extra, PrivateAttr, conint, conset
+from pydantic import constr, validator, Extra, PrivateAttr, conint, conset
 
 from padrick.Model.TemplatedString import TemplatedStringType
 from padrick.Model.UserAttrs import UserAttrs
-from padrick.Model.Utilities import sort_signals
+from padrick.Model.Utilities import sort_signals, cached_property, CachedPropertiesModel, validate_field, \
+    mux_group_name
 
 
-class Port(BaseModel):
+class Port(CachedPropertiesModel):
     name: TemplatedIdentifierType
     description: Optional[TemplatedStringType]
     connections: Optional[Mapping[Union[Signal, str], Optional[SignalExpressionType]]]
@@ -100,7 +99,9 @@ class Port(BaseModel):
             #Generate Signal instance from size information of the discovered pad_signal_instance. The PadDomain
             # validator ensures, that all pad_signal instances have the same size so it doesn't matter which instance
             # we use for that matter
-            signal = Signal(name=signal_name, size=pad_signal_instances[0].size, direction=pad_signal_instances[0].direction)
+            # The name is part of the user's configuration and must thus be validated.
+            signal = Signal(name=TemplatedIdentifierType.validate(signal_name), size=pad_signal_instances[0].size,
+                            direction=pad_signal_instances[0].direction)
             linked_connections[signal] = expression
         return linked_connections
 
@@ -112,7 +113,7 @@ class Port(BaseModel):
         return mux_group
 
 
-    @property
+    @cached_property
     def port_signals_chip2pad(self) -> List[Signal]:
         port_signals = set()
         if self.connections:
@@ -123,7 +124,7 @@ class Port(BaseModel):
                         port_signals.add(port_signal)
         return sort_signals(port_signals)
 
-    @property
+    @cached_property
     def port_signals_pad2chip(self) -> List[Signal]:
         port_signals = set()
         if self.connections:
@@ -132,7 +133,7 @@ class Port(BaseModel):
                     port_signals.add(signal)
         return sort_signals(port_signals)
 
-    @property
+    @cached_property
     def port_signals(self) -> List[Signal]:
         """
 
@@ -141,30 +142,42 @@ class Port(BaseModel):
         """
         return sort_signals(self.port_signals_pad2chip + self.port_signals_chip2pad)
 
-    @property
+    @cached_property
     def mux_group_name(self) -> str:
-        return "_".join(natsorted(self.mux_groups)).upper()
+        return mux_group_name(self.mux_groups)
 
     def expand_port(self) -> List['Port']:
+        """
+        Expand a port with multiple>1 into individual ports replacing the index templates in name, description,
+        mux_groups, user_attr and the connections with the array index.
+
+        The expanded ports are built directly from the already validated fields of this port. Only the fields that
+        change are validated again (instead of validating every single assignment of a copied port).
+        """
+        cls = type(self)
         expanded_ports = []
+        fields_set = self.__fields_set__ | {'name', 'description', 'user_attr', 'mux_groups', 'multiple',
+                                            'connections'}
         for i in range(self.multiple):
-            expanded_port: Port = self.copy()
-            expanded_port.name = expanded_port.name.evaluate_template(i)
-            expanded_port.description = expanded_port.description.evaluate_template(i) if expanded_port.description else None
-            expanded_port.user_attr = expanded_port.user_attr.expand_user_attrs(i) if expanded_port.user_attr else None
-            expanded_port.mux_groups = set(map(lambda mux_group: mux_group.evaluate_template(i), expanded_port.mux_groups))
-            expanded_port.multiple = 1
+            values = dict(self.__dict__)
+            values['name'] = validate_field(cls, 'name', self.name.evaluate_template(i))
+            values['description'] = self.description.evaluate_template(i) if self.description else None
+            values['user_attr'] = validate_field(cls, 'user_attr', self.user_attr.expand_user_attrs(i)) \
+                if self.user_attr else None
+            values['mux_groups'] = validate_field(cls, 'mux_groups', set(
+                map(lambda mux_group: mux_group.evaluate_template(i), self.mux_groups)))
+            values['multiple'] = 1
             expanded_connections = {}
-            for key, value in expanded_port.connections.items():
+            for key, value in self.connections.items():
                 if isinstance(key, SignalExpressionType):
                     key = str(key.evaluate_template(i))
                 elif isinstance(key, Signal):
                     key = str(key.name.evaluate_template(i))
                 if isinstance(value, SignalExpressionType):
-                    value = str(value.evaluate_template(i))
+                    value = value.evaluate_template(i)
                 elif isinstance(value, Signal):
                     value = str(value.name.evaluate_template(i))
                 expanded_connections[key] = value
-            expanded_port.connections = expanded_connections
-            expanded_ports.append(expanded_port)
+            values['connections'] = validate_field(cls, 'connections', expanded_connections, values)
+            expanded_ports.append(cls.construct(_fields_set=set(fields_set), **values))
         return expanded_ports
@@ -20,15 +20,16 @@ from padrick.Model.Constants import SYSTEM_VERILOG_IDENTIFIER
 from padrick.Model.PadSignal import Signal, SignalDirection
 from padrick.Model.Port import Port
 from padrick.Model.SignalExpressionType import SignalExpressionType
-from pydantic import BaseModel, constr, conint, validator, root_validator, Extra, conset
+from pydantic import constr, conint, validator, root_validator, Extra, conset
 
 from padrick.Model.TemplatedIdentifier import TemplatedIdentifierType
 from padrick.Model.TemplatedString import TemplatedStringType
 from padrick.Model.UserAttrs import UserAttrs
-from padrick.Model.Utilities import sort_signals, sort_ports, cached_property
+from padrick.Model.Utilities import sort_signals, sort_ports, cached_property, CachedPropertiesModel
+from padrick.Profiling import timed
 
 
-class PortGroup(BaseModel):
+class PortGroup(CachedPropertiesModel):
     name: TemplatedIdentifierType
     description: Optional[TemplatedStringType]
     mux_groups: Optional[conset(TemplatedIdentifierType, min_items=1)]
@@ -36,7 +37,6 @@ class PortGroup(BaseModel):
     output_defaults: Union[SignalExpressionType, Mapping[Union[Signal, str], Optional[SignalExpressionType]]] = {}
     multiple: conint(ge=1) = 1
     user_attr: Optional[UserAttrs]
-    _method_cache = {}
 
     class Config:
         extra = Extra.forbid
@@ -56,32 +56,29 @@ class PortGroup(BaseModel):
         """Make sure the signals specified in connection_defaults are actually pad2chip port signals and make sure
         the associated expression is static."""
         linked_connection_defaults: Mapping[Signal, SignalExpressionType] = {}
+        port_signals = set.union(set(), *[set(port.port_signals) for port in values.get('ports', [])])
+        # Index the implicitly declared port signals (a name used in the connections section declares a new port
+        # signal) by name. If there are several port signals with the same name, the first one wins.
+        port_signals_by_name: Dict[str, Signal] = {}
+        for port_signal in port_signals:
+            port_signals_by_name.setdefault(port_signal.name, port_signal)
         for signal_name, expression in v.items():
-            port_signals = set.union(*[set(port.port_signals) for port in values.get('ports', [])])
-            # Try to find the port signal in the implicitly declared port signal list (a name used in the connections
-            # section declares a new port signal)
-            signal_found = False
-            for port_signal in port_signals:
-                if port_signal.name == signal_name:
-                    # Make sure the port signal has the right directionality. Only pad2chip port signals can have a
-                    # default_connection.
-                    if port_signal.direction == SignalDirection.pads2soc:
-                        # Make sure the expression on the RHS is a constant expression
-                        if expression.is_const_expr:
-                            signal_found = True
-                            linked_connection_defaults[port_signal] = expression
-                            break
-                        else:
-                            raise ValueError(f"Expression {expression} for connection_default of port signal {signal_name} is "
-                                             f"not constant.")
-                    else:
-                        raise ValueError(f"Found port-signal {signal_name} with wrong direcitonality in "
-                                         f"connection_default "
-                                         f"section. Only port_signals with direction pad2chip can be referenced.")
-            if not signal_found:
+            port_signal = port_signals_by_name.get(signal_name)
+            if port_signal is None:
                 raise ValueError(f"Found unknown port signal {signal_name} in connetion_defaults section. Only port "
                                  f"signal names declared in the connection sections of one of the port within this "
                                  f"port group are legal.")
+            # Make sure the port signal has the right directionality. Only pad2chip port signals can have a
+            # default_connection.
+            if port_signal.direction != SignalDirection.pads2soc:
+                raise ValueError(f"Found port-signal {signal_name} with wrong direcitonality in "
+                                 f"connection_default "
+                                 f"section. Only port_signals with direction pad2chip can be referenced.")
+            # Make sure the expression on the RHS is a constant expression
+            if not expression.is_const_expr:
+                raise ValueError(f"Expression {expression} for connection_default of port signal {signal_name} is "
+                                 f"not constant.")
+            linked_connection_defaults[port_signal] = expression
 
         return linked_connection_defaults
 
@@ -102,8 +99,9 @@ class PortGroup(BaseModel):
         Expand ports with muliple>1 into individual port objects replacing the '<>' token in name, description and signalexpression with the array index.
         """
         expanded_ports = []
-        for port in ports:
-            expanded_ports.extend(port.expand_port())
+        with timed("expand multiple ports"):
+            for port in ports:
+                expanded_ports.extend(port.expand_port())
         return expanded_ports
 
     @validator('ports')
@@ -148,17 +146,16 @@ class PortGroup(BaseModel):
 
     @cached_property
     def port_signals(self) -> List[Signal]:
-        return sort_signals(set.union(*[set(port.port_signals) for port in self.ports]))
+        return sort_signals(set.union(set(), *[set(port.port_signals) for port in self.ports]))
 
+    # Filtering the sorted (and duplicate free) port signals preserves their order
     @cached_property
     def port_signals_soc2pads(self) -> List[Signal]:
-        return sort_signals(set([signal for signal in self.port_signals if signal.direction ==
-                                 SignalDirection.soc2pads]))
+        return [signal for signal in self.port_signals if signal.direction == SignalDirection.soc2pads]
 
     @cached_property
     def port_signals_pads2soc(self) -> List[Signal]:
-        return sort_signals(set([signal for signal in self.port_signals if signal.direction ==
-                                 SignalDirection.pads2soc]))
+        return [signal for signal in self.port_signals if signal.direction == SignalDirection.pads2soc]
 
     def get_ports_in_mux_groups(self, mux_groups: Set[str]) -> List[Port]:
         ports_in_mux_group = [port for port in self.ports if mux_groups.intersection(port.mux_groups)]
@@ -15,27 +15,33 @@
 # limitations under the License.
 
 from copy import deepcopy
-from typing import Set, Mapping
+from functools import lru_cache
+from typing import Set, Mapping, NamedTuple, Tuple, Union, Optional
 
 from lark.exceptions import UnexpectedInput
-from lark.lark import Lark
+from lark import Token
 from lark.tree import Tree
-from lark.visitors import Transformer
 
-from padrick.Model.TemplatedIndexGrammar import templated_index_grammar, TemplatedIdxEvaluator, \
-    TemplatedIdxToStringTransformer
+from padrick.Model.LazyParser import LazyParser
+from padrick.Model.TemplatedIndexGrammar import templated_index_grammar, TemplatedIdxToStringTransformer, \
+    CompiledTemplate
 
 expression_language = r"""
-?start: expression
+?start: binary_expression
+      | empty_expression
+
+// All binary operators share the same precedence and are parsed left-associative. The tree is only used to
+// reassemble the (remapped) expression string and to collect the referenced signals so the associativity does not
+// matter.
+?binary_expression: expression
+                 | binary_expression WS? BINARY_OP WS? expression -> binary_operation
 
 ?expression: _primary
           | UNARY_OP WS? _primary -> unary_operation
-          | "(" WS? expression WS? ")"
-          | expression WS? BINARY_OP WS? expression -> binary_operation
-          | empty_expression
-          
+          | "(" WS? binary_expression WS? ")"
+
 empty_expression: WS*
-          
+
 _primary: literal
        | signal_expression
 
@@ -82,15 +88,17 @@ hex_number: SIZE? HEX_BASE HEX_VALUE
 HEX_VALUE: /[0-9a-fA-F][_0-9a-fA-F]*/
 
 UNSIGNED_NUMBER: /[0-9]+/
-SIZE: /[1-9][_0-9]*/
+// The lookahead allows the LALR lexer to distinguish the size prefix of a sized literal from an unsized decimal number.
+SIZE.2: /[1-9][_0-9]*(?=')/
 DECIMAL_BASE: /'[s|S]?d|'[s|S]?D/
 BINARY_BASE: /'[s|S]?b|'[s|S]?B/
 OCTAL_BASE: /'[s|S]?o|'[s|S]?O/
 HEX_BASE: /'[s|S]?h|'[s|S]?H/
 
-UNARY_OP: /\+|-|!|~|&|~&|\||~|\^|~\^|\^~/
+// Alternatives are ordered longest first since the LALR lexer picks the first alternative that matches.
+UNARY_OP: /~&|~\||~\^|\^~|\+|-|!|~|&|\||\^/
 
-BINARY_OP: /\+|-|\*|\/|%|==|!=|===|!==|==?|!=\?|&&|\|\||\*\*|<|<=|>|>=|&|\||\^|\^~|~\^|>>|<<|>>>|<<<|->|<->/
+BINARY_OP: /===|!==|==\?|!=\?|>>>|<<<|<->|==|!=|&&|\|\||\*\*|<=|>=|\^~|~\^|>>|<<|->|\+|-|\*|\/|%|<|>|&|\||\^/
 
 // It would be cleaner to import those rules from Lark common grammar but this prevents pyoxidized binary creation 
 // due to stupid package resource importing scheme used in lark
@@ -156,43 +164,120 @@ SQL_COMMENT: /--[^\n]*/
 //%ignore WS
 """
 
-simple_expression_parser = Lark(expression_language+templated_index_grammar, parser="earley")
+simple_expression_parser = LazyParser('signal_expression', expression_language+templated_index_grammar, parser="lalr")
 
-class SignalNameRemapTransformer(Transformer):
-    def __init__(self, signal_name_mapping: Mapping[str, str]):
-        super().__init__()
-        self._map = signal_name_mapping
+def parse_expression(expression: str) -> Tree:
+    return simple_expression_parser.parse(expression)
+
+
+class CompactExpression(NamedTuple):
+    """
+    The information of a parsed signal expression that is needed after validation, without the AST.
 
-    def signal_name(self, characters):
-        name = "".join(characters)
-        return self._map.get(name, name)
+    Parts alternates between literal text and signal names starting and ending with literal text (e.g. `~a & 1'b0`
+    becomes ('~', 'a', "&1'b0")). Joining the parts yields the same string as transforming the AST with
+    TemplatedIdxToStringTransformer.
+    """
+    parts: Tuple[str, ...]
+    is_single_signal: bool
+    is_templated: bool
 
+    @property
+    def signal_names(self) -> Tuple[str, ...]:
+        return self.parts[1::2]
+
+    def mapped_expr(self, signal_name_mapping: Mapping[str, str]) -> str:
+        parts = list(self.parts)
+        parts[1::2] = [signal_name_mapping.get(name, name) for name in self.signal_names]
+        return "".join(parts)
+
+
+def _collect_parts(node: Union[Tree, Token], parts: list) -> bool:
+    # Returns True if the subtree contains an index template
+    if isinstance(node, Tree):
+        if node.data in ('signal_name', 'idx_template'):
+            text = TemplatedIdxToStringTransformer().transform(node)
+            if node.data == 'signal_name':
+                parts.extend([text, ""])
+            else:
+                parts[-1] += text
+            return any(True for _ in node.find_data('idx_template'))
+        is_templated = False
+        for child in node.children:
+            is_templated |= _collect_parts(child, parts)
+        return is_templated
+    parts[-1] += str(node)
+    return False
+
+
+# The empty expression is the default value of several model fields. Its representation is known upfront so defining
+# the models does not build the parser.
+EMPTY_EXPRESSION = CompactExpression(("",), False, False)
+
+
+@lru_cache(maxsize=None)
+def compact_expression(expression: str) -> CompactExpression:
+    """
+    Parse the given expression string into its compact representation. The result is interned process-wide so that
+    identical expressions (e.g. `1'b0`) are only parsed once and share their representation. The AST is not retained.
+    """
+    if expression == "":
+        return EMPTY_EXPRESSION
+    ast = parse_expression(expression)
+    parts = [""]
+    is_templated = _collect_parts(ast, parts)
+    return CompactExpression(tuple(parts), ast.data == "signal_expression", is_templated)
 
 
 class SignalExpressionType(str):
+    """
+    A validated signal expression.
+
+    Instances only hold the compact representation of the parsed expression (see CompactExpression). The AST is
+    rebuilt on demand if someone explicitly asks for it.
+
+    None is accepted as the empty expression (e.g. to leave an output pad signal unconnected).
+    """
     _expression: str
     ast: Tree
+    # Only set on instances that needed them
+    _ast = None
+    _compiled_template = None
 
-    def __init__(self, expression: str):
+    def __new__(cls, expression: Optional[str]):
+        return super().__new__(cls, "" if expression is None else expression)
+
+    def __init__(self, expression: Optional[str]):
         super().__init__()
-        if expression == None:
-            self._ast = ""
-        elif isinstance(expression, str):
+        if expression is None:
+            expression = ""
+        if isinstance(expression, str):
             try:
-                self._ast = simple_expression_parser.parse(expression)
+                self._compact = compact_expression(str(expression))
             except UnexpectedInput as e:
                 raise ValueError("Illegal signal expresion: "+str(e))
         else:
             raise ValueError("Expression must be a string or None")
 
-    def get_mapped_expr(self, signal_name_mapping: Mapping[str, str]) -> 'SignalExpressionType':
-        return (SignalNameRemapTransformer(signal_name_mapping)*TemplatedIdxToStringTransformer()).transform(self.ast)
+    def get_mapped_expr(self, signal_name_mapping: Mapping[str, str]) -> str:
+        return self._compact.mapped_expr(signal_name_mapping)
+
+    @property
+    def compiled_template(self) -> CompiledTemplate:
+        if self._compiled_template is None:
+            self._compiled_template = CompiledTemplate(self.ast)
+            # The AST is not needed anymore once the template is compiled
+            self.__dict__.pop('_ast', None)
+        return self._compiled_template
 
     def evaluate_template(self, i):
-        if not isinstance(self.ast, str):
-            return SignalExpressionType((TemplatedIdxEvaluator(i)*TemplatedIdxToStringTransformer()).transform(self.ast))
+        if self._compact.is_templated:
+            return SignalExpressionType(self.compiled_template(i))
         else:
-            return self
+            expression = "".join(self._compact.parts)
+            # Without index templates, the evaluated expression is the same for every index. Share the instance
+            # unless the normalized expression differs from the original one (e.g. due to dropped parentheses).
+            return self if expression == self else SignalExpressionType(expression)
 
     @property
     def expression(self) -> str:
@@ -200,6 +285,8 @@ class SignalExpressionType(str):
 
     @property
     def ast(self):
+        if self._ast is None:
+            self._ast = parse_expression(str(self))
         return self._ast
 
     @property
@@ -208,18 +295,15 @@ class SignalExpressionType(str):
 
     @property
     def is_const_expr(self):
-        return len(self.signal_collection) == 0
+        return len(self._compact.parts) == 1
 
     @property
     def is_single_signal(self):
-        return self.ast.data == "signal_expression"
+        return self._compact.is_single_signal
 
     @property
     def signal_collection(self):
-        signal_collection = set()
-        for signal_name in self.ast.find_data('signal_name'):
-            signal_collection.add(TemplatedIdxToStringTransformer().transform(signal_name))
-        return signal_collection
+        return set(self._compact.signal_names)
 
     @classmethod
     def __get_validators__(cls):
@@ -14,16 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 from copy import deepcopy
 from functools import lru_cache
 
-from lark import Token, Transformer
+from lark import Transformer
 from lark.exceptions import UnexpectedInput
-from lark.lark import Lark
 from lark.tree import Tree
 
-from padrick.Model.TemplatedIndexGrammar import TemplatedIdxToStringTransformer, TemplatedIdxEvaluator, \
-    templated_index_grammar
+from padrick.Model.Constants import SYSTEM_VERILOG_IDENTIFIER
+from padrick.Model.LazyParser import LazyParser
+from padrick.Model.TemplatedIndexGrammar import templated_index_grammar, CompiledTemplate
 
 expression_language = r"""
 ?start: identifier
@@ -92,7 +93,7 @@ SQL_COMMENT: /--[^\n]*/
 
 """
 
-templated_identifier_parser = Lark(expression_language + templated_index_grammar, parser="lalr")
+templated_identifier_parser = LazyParser('templated_identifier', expression_language + templated_index_grammar, parser="lalr")
 
 # class TokenMerger(Transformer):
 #     def identifier(self, children):
@@ -110,6 +111,9 @@ templated_identifier_parser = Lark(expression_language + templated_index_grammar
 #             merged_children.append("".join(tokens_to_merge))
 #         if len(merged_children)
 
+# Identifiers without any index template. For those we can skip the parser entirely.
+plain_identifier_pattern = re.compile(SYSTEM_VERILOG_IDENTIFIER)
+
 #@lru_cache()
 def parse_expression(expression: str):
     return templated_identifier_parser.parse(str(expression))
@@ -117,8 +121,14 @@ def parse_expression(expression: str):
 class TemplatedIdentifierType(str):
     def __init__(self, expression: str):
         super().__init__()
+        self._is_templated = True
+        self._compiled_template = None
         if expression == None:
             self._ast = ""
+        elif plain_identifier_pattern.fullmatch(self):
+            # The AST of a plain identifier is only built if someone explicitly asks for it.
+            self._is_templated = False
+            self._ast = None
         else:
             try:
                 self._ast = parse_expression(str(self))
@@ -130,15 +140,31 @@ class TemplatedIdentifierType(str):
     def identifier(self) -> str:
         return str(self)
 
+    @property
+    def is_templated(self) -> bool:
+        return self._is_templated
+
     @property
     def ast(self):
+        if self._ast is None:
+            self._ast = parse_expression(str(self))
         return self._ast
 
+    @property
+    def compiled_template(self) -> CompiledTemplate:
+        if self._compiled_template is None:
+            self._compiled_template = CompiledTemplate(self.ast)
+            # The AST is rebuilt on demand. Don't keep it around once the template is compiled.
+            self._ast = None
+        return self._compiled_template
+
     def evaluate_template(self, i):
-        if not isinstance(self.ast, Token):
-            return (TemplatedIdxEvaluator(i) * TemplatedIdxToStringTransformer()).transform(self._ast)
+        if not self.is_templated:
+            # Return the same type as the evaluated template below would
+            return str(self)
         else:
-            return self
+            # The AST of a templated identifier is always an 'identifier' tree
+            return self.compiled_template(i)
 
     @classmethod
     def __get_validators__(cls):
@@ -14,9 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+import operator
+from typing import List, Optional, Dict, Callable, Union
 
-from lark import Transformer, v_args, Tree
+from lark import Transformer, v_args, Tree, Token
 
 templated_index_grammar = r"""
 idx_template: "{" idx_expression format_spec? "}"
@@ -74,16 +75,7 @@ class TemplatedIdxEvaluator(Transformer):
             raise ValueError(f"Unknown operator {operator}")
 
     def number_to_base26(cls, value:int) -> List[int]:
-        if value<0:
-            raise ValueError("Value must not be negative.")
-        elif value == 0:
-            return [0]
-        else:
-            result = []
-            while value:
-                value, digit = divmod(value, 26)
-                result.insert(0, digit)
-            return result
+        return number_to_base26(value)
 
     def idx_template(self, idx_expression, format_spec: Tree=None):
         if format_spec:
@@ -93,18 +85,116 @@ class TemplatedIdxEvaluator(Transformer):
             else:
                 length = length.children[0]
             format_class = next(format_spec.find_data('format_class')).children[0]
-            if format_class in ['d', 'o', 'b', 'X']:
-                return '{idx_expression:0{length}{format_class}}'.format(idx_expression=idx_expression,
-                                                                         length=length, format_class=format_class)
-            elif format_class in ['c', 'C']:
-                base26_value = self.number_to_base26(idx_expression)
-                if len(base26_value) < length:
-                    base26_value = (length - len(base26_value))*[0]+base26_value
-                if format_class == 'c':
-                    start_character = 'a'
-                else:
-                    start_character = 'A'
-                return "".join(map(lambda x: chr(ord(start_character)+x), base26_value))
+            return format_index(idx_expression, length, format_class)
+        else:
+            return format_index(idx_expression)
+
+
+def number_to_base26(value: int) -> List[int]:
+    if value<0:
+        raise ValueError("Value must not be negative.")
+    elif value == 0:
+        return [0]
+    else:
+        result = []
+        while value:
+            value, digit = divmod(value, 26)
+            result.insert(0, digit)
+        return result
+
+
+def format_index(value: int, length: int = 0, format_class: Optional[str] = None) -> str:
+    """
+    Format the evaluated index expression of an idx_template according to its (optional) format spec.
+    """
+    if format_class is None:
+        return str(value)
+    elif format_class in ['d', 'o', 'b', 'x']:
+        return '{value:0{length}{format_class}}'.format(value=value, length=length, format_class=format_class)
+    elif format_class in ['c', 'C']:
+        base26_value = number_to_base26(value)
+        if len(base26_value) < length:
+            base26_value = (length - len(base26_value))*[0]+base26_value
+        if format_class == 'c':
+            start_character = 'a'
+        else:
+            start_character = 'A'
+        return "".join(map(lambda x: chr(ord(start_character)+x), base26_value))
+    else:
+        raise ValueError(f"Unknown format class {format_class}")
+
+
+_operators: Dict[str, Callable[[int, int], int]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.floordiv,
+    '%': operator.mod
+}
+
+
+def _compile_idx_expression(node: Union[Tree, Token]) -> Callable[[int], int]:
+    if isinstance(node, Token):
+        if node.type == 'INDEX_VAR':
+            return lambda i: i
+        else:
+            raise ValueError(f"Unexpected token {node} in index expression")
+    if node.data == 'constant':
+        constant = int(node.children[0])
+        return lambda i: constant
+    elif node.data in ['idx_expression', 'term']:
+        left, op, right = node.children
+        left_fn = _compile_idx_expression(left)
+        right_fn = _compile_idx_expression(right)
+        op_fn = _operators[str(op)]
+        return lambda i: op_fn(left_fn(i), right_fn(i))
+    else:
+        raise ValueError(f"Unexpected node {node.data} in index expression")
+
+
+def _compile_idx_template(idx_template: Tree) -> Callable[[int], str]:
+    idx_expression = _compile_idx_expression(idx_template.children[0])
+    if len(idx_template.children) > 1:
+        format_spec = idx_template.children[1]
+        length = next(format_spec.find_data('length'), None)
+        length = int(length.children[0].children[0]) if length is not None else 0
+        format_class = str(next(format_spec.find_data('format_class')).children[0])
+        if format_class in ['d', 'o', 'b', 'x']:
+            # Resolve the format string once instead of for every index
+            format_str = f'{{:0{length}{format_class}}}'
+            return lambda i: format_str.format(idx_expression(i))
+        return lambda i: format_index(idx_expression(i), length, format_class)
+    else:
+        return lambda i: str(idx_expression(i))
+
+
+class CompiledTemplate:
+    """
+    A templated AST compiled into a sequence of literal string chunks and idx_template evaluation functions.
+
+    Evaluating a compiled template for a given index is equivalent to transforming the AST with
+    `TemplatedIdxEvaluator(i) * TemplatedIdxToStringTransformer()` but avoids walking the AST for every index. The
+    compiled template does not reference the AST so the latter can be dropped once the template is compiled.
+    """
+    __slots__ = ('_chunks',)
+
+    def __init__(self, ast: Union[Tree, Token]):
+        chunks: List[Union[str, Callable[[int], str]]] = []
+        self._compile(ast, chunks)
+        self._chunks = tuple(chunks)
+
+    def _compile(self, node: Union[Tree, Token], chunks: List[Union[str, Callable[[int], str]]]):
+        if isinstance(node, Tree):
+            if node.data == 'idx_template':
+                chunks.append(_compile_idx_template(node))
+            else:
+                for child in node.children:
+                    self._compile(child, chunks)
+        elif chunks and isinstance(chunks[-1], str):
+            # Merge consecutive literal chunks
+            chunks[-1] += str(node)
         else:
-            return str(idx_expression)
+            chunks.append(str(node))
 
+    def __call__(self, i: int) -> str:
+        return "".join([chunk if isinstance(chunk, str) else chunk(i) for chunk in self._chunks])
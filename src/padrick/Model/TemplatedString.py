@@ -16,19 +16,18 @@
 
 from copy import deepcopy
 
-from lark import Token
 from lark.exceptions import UnexpectedInput
-from lark.lark import Lark
 from lark.tree import Tree
 from lark.visitors import Transformer, v_args
-from padrick.Model.TemplatedIndexGrammar import TemplatedIdxToStringTransformer, TemplatedIdxEvaluator, templated_index_grammar
+from padrick.Model.LazyParser import LazyParser
+from padrick.Model.TemplatedIndexGrammar import templated_index_grammar, CompiledTemplate
 
 grammar = r"""
 ?start: (idx_template | TEXT)*
 TEXT: /[^{}]+/ 
 """
 
-templated_string_parser = Lark(grammar + templated_index_grammar, parser='lalr')
+templated_string_parser = LazyParser('templated_string', grammar + templated_index_grammar, parser='lalr')
 
 class TemplatedStringType(str):
     _expression: str
@@ -38,21 +37,43 @@ class TemplatedStringType(str):
         super().__init__()
         if expression == None:
             expression = ""
-        self._ast = templated_string_parser.parse(str(expression))
+        self._expression = str(expression)
+        self._compiled_template = None
+        self._is_templated = "{" in self._expression or "}" in self._expression
+        if self._is_templated:
+            self._ast = templated_string_parser.parse(self._expression)
+        else:
+            # Plain text without any index template. The AST is only built if someone explicitly asks for it.
+            self._ast = None
 
     @property
     def identifier(self) -> str:
         return str(self)
 
+    @property
+    def is_templated(self) -> bool:
+        return self._is_templated
+
     @property
     def ast(self):
+        if self._ast is None:
+            self._ast = templated_string_parser.parse(self._expression)
         return self._ast
 
+    @property
+    def compiled_template(self) -> CompiledTemplate:
+        if self._compiled_template is None:
+            self._compiled_template = CompiledTemplate(self.ast)
+            # The AST is rebuilt on demand. Don't keep it around once the template is compiled.
+            self._ast = None
+        return self._compiled_template
+
     def evaluate_template(self, i):
-        if not isinstance(self.ast, Token):
-            return TemplatedStringType((TemplatedIdxEvaluator(i) * TemplatedIdxToStringTransformer()).transform(self.ast))
-        else:
+        if not self.is_templated:
             return self
+        else:
+            # The AST of a templated string always is a tree since it contains at least one idx_template
+            return TemplatedStringType(self.compiled_template(i))
 
     @classmethod
     def __get_validators__(cls):
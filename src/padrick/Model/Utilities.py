@@ -14,32 +14,119 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Iterable, List, Optional, Dict, Union
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict, Union, Any, Type
 
-from natsort import natsorted
+from natsort import natsort_keygen
+from pydantic import BaseModel, PrivateAttr, ValidationError
 
 from padrick.Model.TemplatedString import TemplatedStringType
 
 
+_natsort_keygen = natsort_keygen()
+
+
+@lru_cache(maxsize=None)
+def _natsort_key(name: str):
+    return _natsort_keygen(name)
+
+
+def natsort_key(name: str):
+    """
+    Returns the natural sort key of name (i.e. the key natsorted() uses). The key of every distinct name is only
+    computed once.
+    """
+    return _natsort_key(str(name))
+
+
+def _name_natsort_key(x):
+    return _natsort_key(str(x.name))
+
+
+def sort_by_name(seq: Iterable[Any]) -> List[Any]:
+    """
+    Returns the items of seq naturally sorted by their name. Equivalent to natsorted(seq, key=lambda x: x.name).
+    """
+    return sorted(seq, key=_name_natsort_key)
+
+
 def sort_signals(seq: Iterable['Signal']):
-    return natsorted(seq, key=lambda x: x.name)
+    return sort_by_name(seq)
 
 
 def sort_ports(seq: Iterable['Port']):
-    return natsorted(seq, key=lambda x: x.name)
+    return sort_by_name(seq)
 
 
 def sort_pads(seq: Iterable['PadInstance']):
-    return natsorted(seq, key=lambda x: x.name)
+    return sort_by_name(seq)
+
+
+def mux_group_name(mux_groups: Iterable[str]) -> str:
+    """
+    Returns the name of a set of mux groups, i.e. the naturally sorted mux groups joined by underscores in upper case.
+    """
+    return "_".join(sorted(mux_groups, key=natsort_key)).upper()
+
+
+def validate_field(model_cls: Type[BaseModel], name: str, value: Any, values: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Validate value as if it was assigned to the field name of model_cls (including the field's validators). Values
+    contains the already validated fields that are passed on to the validators. In contrast to an assignment with
+    validate_assignment enabled, the root validators of the model are not run.
+
+    Raises a ValidationError if the value is invalid.
+    """
+    value, errors = model_cls.__fields__[name].validate(value, values if values is not None else {}, loc=name,
+                                                         cls=model_cls)
+    if errors:
+        raise ValidationError([errors], model_cls)
+    return value
+
+
+class cached_property(property):
+    """
+    A property whose value is computed once per instance and then memoized in the _method_cache of the instance.
+
+    Can only be used on subclasses of CachedPropertiesModel. The cache is dropped whenever a field of the instance is
+    assigned and when the instance is copied.
+    """
+
+    def __init__(self, func):
+        super().__init__(func)
+        self.name = func.__name__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._method_cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.fget(instance)
+            return value
+
+
+class CachedPropertiesModel(BaseModel):
+    """
+    Base class of models with cached_property attributes.
+
+    Cached properties derive their value from the fields of the model (and of its children). The cache is invalidated
+    automatically if a field of the model is assigned. Validators that mutate a field in-place (e.g. add an element to
+    a set) must call invalidate_cached_properties themselves. Once the whole configuration is validated, the model is
+    not modified anymore and every cached property is computed at most once.
+    """
+    _method_cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        self.invalidate_cached_properties()
 
-def cached_property(func):
-    @property
-    def wrapper(self, *args, **kwargs):
-        if not hasattr(self, '_method_cache'):
-            raise RuntimeError(f"Object of type {self.__class__.__name__} has _method_cache attribute.")
-        if func.__name__ not in self._method_cache:
-            self._method_cache[func.__name__] =  func(self, *args, **kwargs)
-        return self._method_cache[func.__name__]
+    def copy(self, **kwargs):
+        # BaseModel.copy() shares the private attributes with the original instance.
+        copied_model = super().copy(**kwargs)
+        copied_model.invalidate_cached_properties()
+        return copied_model
 
-    return wrapper
\ No newline at end of file
+    def invalidate_cached_properties(self):
+        object.__setattr__(self, '_method_cache', {})
@@ -0,0 +1,301 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copyreg
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from glob import iglob
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Type, TypeVar, Any, Iterator
+
+import click
+import click_log
+from mako.template import Template
+from pydantic import BaseModel
+
+import padrick
+
+logger = logging.getLogger("padrick.ModelCache")
+click_log.basic_config(logger)
+
+T = TypeVar('T', bound=BaseModel)
+
+DEFAULT_MAX_CACHE_SIZE = 256 * 1024 * 1024
+MODEL_SUFFIX = '.pickle'
+MANIFEST_SUFFIX = '.manifest.json'
+MODEL_CACHE_META_KEY = 'padrick.model_cache'
+# The logger the models report validation warnings to. Its warnings are stored alongside the cached model and replayed
+# when the model is loaded from the cache.
+VALIDATION_LOGGER = 'padrick.Configparser'
+
+# A warning logged during validation: (logger name, level, message)
+ValidationWarning = Tuple[str, int, str]
+
+
+def default_cache_dir() -> Path:
+    """
+    Returns the root directory of all padrick caches.
+    """
+    xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / 'padrick'
+    else:
+        return Path.home() / '.cache' / 'padrick'
+
+
+def get_model_cache() -> Optional['ModelCache']:
+    """
+    Returns the model cache configured on the command line or None if caching is disabled or we are not running
+    within a click command.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return None
+    return ctx.meta.get(MODEL_CACHE_META_KEY, None)
+
+
+@lru_cache(maxsize=None)
+def padrick_source_hash() -> str:
+    """
+    Returns a hash over the padrick version and the content of padrick's python modules. The version alone does not
+    change while working on a source checkout or a development install.
+    """
+    source_hash = hashlib.sha256(padrick.__version__.encode('utf-8'))
+    # Modules embedded into the standalone binary have no file on disk, its version identifies the sources.
+    package_file = getattr(padrick, '__file__', None)
+    if package_file:
+        package_dir = Path(package_file).parent
+        for source_file in sorted(package_dir.rglob('*.py')):
+            source_hash.update(b"\0" + source_file.relative_to(package_dir).as_posix().encode('utf-8') + b"\0")
+            source_hash.update(source_file.read_bytes())
+    return source_hash.hexdigest()
+
+
+# The lists the warnings logged by the current thread (or asyncio task) are recorded to, one per active (nested)
+# record_validation_warnings context
+_RECORDED_WARNINGS: ContextVar[Tuple[List[ValidationWarning], ...]] = ContextVar('padrick_recorded_warnings',
+                                                                                 default=())
+
+
+class _WarningRecorder(logging.Handler):
+    """
+    Records the warnings logged to the validation logger into the lists of the current context (see
+    record_validation_warnings). The logger is shared by the whole process, so concurrent validations only record
+    their own warnings.
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+
+    def emit(self, record: logging.LogRecord):
+        for warnings in _RECORDED_WARNINGS.get():
+            warnings.append((record.name, record.levelno, record.getMessage()))
+
+
+_WARNING_RECORDER = _WarningRecorder()
+
+
+@contextmanager
+def record_validation_warnings() -> Iterator[List[ValidationWarning]]:
+    """
+    Record the warnings the models log while they are validated within the context. The returned list is filled in
+    while the context is active. Warnings logged by other threads are not recorded.
+    """
+    # Installing the handler is idempotent. It is (re)installed on every use since click_log.basic_config replaces
+    # the handlers of the logger.
+    logging.getLogger(VALIDATION_LOGGER).addHandler(_WARNING_RECORDER)
+    warnings: List[ValidationWarning] = []
+    token = _RECORDED_WARNINGS.set(_RECORDED_WARNINGS.get() + (warnings,))
+    try:
+        yield warnings
+    finally:
+        _RECORDED_WARNINGS.reset(token)
+
+
+def _reduce_mako_template(template: Template):
+    # Compiled Mako templates hold a reference to the generated python module and cannot be pickled. Recompile them
+    # from their source instead.
+    return Template, (template.source,)
+
+
+def dumps_model(model: Any) -> bytes:
+    """
+    Pickle a validated model (e.g. to store it in the cache or to send it to a worker process). Objects that reference
+    a model (e.g. a tuple of models) are pickled the same way.
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[Template] = _reduce_mako_template
+    pickler.dump(model)
+    return buffer.getvalue()
+
+
+class ModelCache:
+    """
+    On-disk cache of fully validated (and expanded) configuration models.
+
+    The cache is content addressed: The key of an entry is a hash over the padrick sources (see padrick_source_hash),
+    the model class and the content of the root config file and all files it pulled in with !include directives. Since the set of included
+    files is only known after parsing, a small manifest per root config file records the dependencies of the last
+    successful parse. Entries are evicted in least-recently-used order once the total size of the cache exceeds
+    max_size bytes.
+
+    Validation of a model may log warnings (e.g. about unconnected pads). They are stored along with the model and
+    logged again whenever the model is loaded from the cache.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size: int = DEFAULT_MAX_CACHE_SIZE):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir() / 'models'
+        self.max_size = max_size
+
+    def _manifest_path(self, cls: Type[T], config_file: Path, include_base_dir: Optional[Path]) -> Path:
+        include_base_dir = str(Path(include_base_dir).resolve()) if include_base_dir else ""
+        manifest_key = "\0".join([padrick_source_hash(), cls.__module__ + '.' + cls.__qualname__,
+                                  str(config_file.resolve()), include_base_dir])
+        return self.cache_dir / (hashlib.sha256(manifest_key.encode('utf-8')).hexdigest() + MANIFEST_SUFFIX)
+
+    def _compute_key(self, cls: Type[T], config_file: Path, dependencies: List[str]) -> str:
+        key_hash = hashlib.sha256()
+        key_hash.update(padrick_source_hash().encode('utf-8'))
+        key_hash.update((cls.__module__ + '.' + cls.__qualname__).encode('utf-8'))
+        for path in [str(config_file.resolve())] + dependencies:
+            key_hash.update(b"\0" + path.encode('utf-8') + b"\0")
+            key_hash.update(hashlib.sha256(Path(path).read_bytes()).digest())
+        return key_hash.hexdigest()
+
+    def load(self, cls: Type[T], config_file: Path, include_base_dir: Optional[Path] = None) -> Optional[T]:
+        """
+        Returns the cached model for the given config file or None if there is no up-to-date cache entry. The warnings
+        that were logged while validating the model are logged again.
+        """
+        manifest_path = self._manifest_path(cls, config_file, include_base_dir)
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            # If a wildcard include matches a different set of files now, the dependencies recorded in the manifest
+            # are out of date.
+            for pattern, (recursive, matched_paths) in manifest['include_patterns'].items():
+                if sorted(filter(os.path.isfile, iglob(pattern, recursive=recursive))) != matched_paths:
+                    logger.debug(f"Files matched by include pattern {pattern} changed. Ignoring cache.")
+                    return None
+            key = self._compute_key(cls, config_file, manifest['dependencies'])
+            model_path = self.cache_dir / (key + MODEL_SUFFIX)
+            with model_path.open('rb') as f:
+                model, warnings = pickle.load(f)
+            # Mark the entry as recently used
+            os.utime(model_path)
+        except FileNotFoundError:
+            logger.debug(f"No cache entry for {config_file}.")
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unusable cache entry for {config_file}: {e}")
+            return None
+        if not isinstance(model, cls):
+            return None
+        logger.debug(f"Loaded {config_file} from cache entry {model_path}.")
+        for logger_name, level, message in warnings:
+            logging.getLogger(logger_name).log(level, message)
+        return model
+
+    def store(self, model: T, config_file: Path, include_base_dir: Optional[Path], dependencies: List[str],
+              include_patterns: Dict[str, Tuple[bool, List[str]]], warnings: Optional[List[ValidationWarning]] = None):
+        """
+        Store a validated model and the warnings logged during its validation (see record_validation_warnings) in the
+        cache. Failures to write the cache are logged but otherwise ignored.
+        """
+        cls = type(model)
+        # Normalize all paths so the manifest does not depend on the current working directory
+        dependencies = list(dict.fromkeys(os.path.abspath(path) for path in dependencies))
+        include_patterns = {os.path.abspath(pattern): (recursive, [os.path.abspath(path) for path in matched_paths])
+                            for pattern, (recursive, matched_paths) in include_patterns.items()}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            key = self._compute_key(cls, config_file, dependencies)
+            self._atomic_write(self.cache_dir / (key + MODEL_SUFFIX), dumps_model((model, list(warnings or []))))
+            manifest = {'model': key + MODEL_SUFFIX, 'dependencies': dependencies,
+                        'include_patterns': include_patterns}
+            self._atomic_write(self._manifest_path(cls, config_file, include_base_dir),
+                               json.dumps(manifest).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Failed to store parsed configuration in cache directory {self.cache_dir}: {e}")
+            return
+        self.evict()
+
+    def _atomic_write(self, path: Path, data: bytes):
+        # Write to a temporary file first so concurrent padrick invocations never observe partially written entries.
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def evict(self):
+        """
+        Remove the least recently used model entries until the cache fits into max_size. Manifests whose model entry
+        no longer exists are removed as well.
+        """
+        entries = []
+        for entry in self.cache_dir.glob('*' + MODEL_SUFFIX):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self.max_size:
+                break
+            logger.debug(f"Evicting cache entry {entry}.")
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+        self._evict_orphaned_manifests()
+
+    def _evict_orphaned_manifests(self):
+        for manifest_path in self.cache_dir.glob('*' + MANIFEST_SUFFIX):
+            try:
+                model_name = json.loads(manifest_path.read_text()).get('model')
+            except FileNotFoundError:
+                continue
+            except Exception:
+                # Unreadable manifests (or manifests without a model reference) are of no use either
+                model_name = None
+            if model_name and (self.cache_dir / model_name).exists():
+                continue
+            logger.debug(f"Evicting orphaned cache manifest {manifest_path}.")
+            try:
+                manifest_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        if not self.cache_dir.exists():
+            return
+        for entry in list(self.cache_dir.glob('*' + MODEL_SUFFIX)) + list(self.cache_dir.glob('*' + MANIFEST_SUFFIX)):
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
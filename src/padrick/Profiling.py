@@ -0,0 +1,413 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cProfile
+import functools
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Callable, Type, Tuple
+
+import click
+import click_log
+from pydantic import BaseModel
+
+logger = logging.getLogger("padrick.Profiling")
+click_log.basic_config(logger)
+
+# Files with this suffix receive a Chrome trace event file instead of cProfile statistics
+TRACE_SUFFIX = '.json'
+
+# tracemalloc.reset_peak() is only available since Python 3.9
+_reset_peak = getattr(tracemalloc, 'reset_peak', None)
+
+MIB = 1024 * 1024
+
+
+class _PhaseStats:
+    __slots__ = ('calls', 'total', 'self_time', 'peak_memory')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.peak_memory = 0
+
+
+class _Phase:
+    __slots__ = ('timer', 'name', 'args', 'start', 'child_time', 'start_memory', 'peak_memory')
+
+    def __init__(self, timer: 'PhaseTimer', name: str, args: Dict[str, Any]):
+        self.timer = timer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.child_time = 0.0
+        self.timer._enter(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self.start
+        self.timer._exit(self, duration)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class PhaseTimer:
+    """
+    Accumulates the wall clock time spent in named phases (e.g. 'yaml load' or 'render pad_domain_top').
+
+    Phases may be nested. The total time of a phase includes the time of all nested phases, the self time excludes
+    it. If record_trace is True, every single phase is additionally recorded as a Chrome trace event.
+
+    If trace_memory is True (tracemalloc must be tracing), the peak amount of memory allocated on top of what was
+    allocated when the phase was entered is recorded as well (the maximum over all calls of the phase). On Python <
+    3.9, only the memory that is still allocated when the phase is left can be accounted.
+    """
+
+    def __init__(self, record_trace: bool = False, trace_memory: bool = False):
+        self.stats: Dict[str, _PhaseStats] = {}
+        self.trace_events: Optional[List[Dict[str, Any]]] = [] if record_trace else None
+        self.trace_memory = trace_memory
+        self.max_memory = 0
+        self.origin = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def phase(self, name: str, **args) -> _Phase:
+        return _Phase(self, name, args)
+
+    def _stack(self) -> List[_Phase]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _enter(self, phase: _Phase):
+        stack = self._stack()
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            phase.start_memory = phase.peak_memory = current
+            self.max_memory = max(self.max_memory, peak)
+            # There is only a single global peak. Hand the peak observed so far over to the enclosing phase before
+            # resetting it.
+            if stack and _reset_peak is not None:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak)
+            if _reset_peak is not None:
+                _reset_peak()
+        stack.append(phase)
+
+    def _exit(self, phase: _Phase, duration: float):
+        stack = self._stack()
+        stack.pop()
+        if stack:
+            stack[-1].child_time += duration
+        peak_memory = 0
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.max_memory = max(self.max_memory, peak)
+            peak = max(phase.peak_memory, peak if _reset_peak is not None else current)
+            peak_memory = peak - phase.start_memory
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak)
+            if _reset_peak is not None:
+                _reset_peak()
+        # Recursive phases (e.g. nested user attributes) must only be accounted once in the total
+        is_outermost = all(parent.name != phase.name for parent in stack)
+        with self._lock:
+            stats = self.stats.get(phase.name)
+            if stats is None:
+                stats = self.stats[phase.name] = _PhaseStats()
+            stats.calls += 1
+            if is_outermost:
+                stats.total += duration
+            stats.self_time += duration - phase.child_time
+            stats.peak_memory = max(stats.peak_memory, peak_memory)
+            if self.trace_events is not None:
+                event = {'name': phase.name, 'ph': 'X', 'ts': (phase.start - self.origin) * 1e6,
+                         'dur': duration * 1e6, 'pid': os.getpid(), 'tid': threading.get_ident()}
+                if phase.args:
+                    event['args'] = {key: str(value) for key, value in phase.args.items()}
+                self.trace_events.append(event)
+
+    def summary(self) -> str:
+        """
+        Returns a table of all phases sorted by their total time.
+        """
+        name_width = max([len("Phase")] + [len(name) for name in self.stats])
+        lines = [f"{'Phase':<{name_width}}  {'Calls':>8}  {'Total [s]':>10}  {'Self [s]':>10}"]
+        if self.trace_memory:
+            lines[0] += f"  {'Peak [MiB]':>10}"
+        lines.append("-" * len(lines[0]))
+        for name, stats in sorted(self.stats.items(), key=lambda item: item[1].total, reverse=True):
+            line = f"{name:<{name_width}}  {stats.calls:>8}  {stats.total:>10.3f}  {stats.self_time:>10.3f}"
+            if self.trace_memory:
+                line += f"  {stats.peak_memory / MIB:>10.1f}"
+            lines.append(line)
+        lines.append("-" * len(lines[0]))
+        lines.append(f"Wall clock time: {time.perf_counter() - self.origin:.3f}s")
+        if self.trace_memory and tracemalloc.is_tracing():
+            lines.append(f"Peak memory: {max(self.max_memory, tracemalloc.get_traced_memory()[1]) / MIB:.1f} MiB")
+        return "\n".join(lines)
+
+    def write_trace(self, path: Path):
+        """
+        Write the recorded phases as a Chrome trace event file (viewable in chrome://tracing or Perfetto).
+        """
+        with path.open('w') as f:
+            json.dump({'traceEvents': self.trace_events or [], 'displayTimeUnit': 'ms'}, f)
+
+
+_TIMER: Optional[PhaseTimer] = None
+_INSTRUMENTED_INITS: Dict[Type[BaseModel], Optional[Callable]] = {}
+_MEMORY_REPORTS: Optional[List[str]] = None
+_CENSUS_BASELINE: Dict[str, Tuple[int, int]] = {}
+
+
+def timed(name: str, **args):
+    """
+    Returns a context manager that accounts the time spent within it to the phase name. Args are only recorded in
+    trace files.
+
+    If phase timing is disabled (the default), a shared no-op context manager is returned.
+    """
+    if _TIMER is None:
+        return _NULL_PHASE
+    return _TIMER.phase(name, **args)
+
+
+def timed_function(name: str, func: Callable) -> Callable:
+    """
+    Wrap func such that every call is accounted to the phase name. Use it to instrument third-party code when
+    enabling phase timing.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with timed(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def get_timer() -> Optional[PhaseTimer]:
+    return _TIMER
+
+
+def _padrick_model_classes(cls: Type[BaseModel] = BaseModel) -> List[Type[BaseModel]]:
+    classes = []
+    for subclass in cls.__subclasses__():
+        if subclass.__module__.startswith('padrick.'):
+            classes.append(subclass)
+        classes.extend(_padrick_model_classes(subclass))
+    return list(dict.fromkeys(classes))
+
+
+def _timed_init(cls: Type[BaseModel], original_init: Callable) -> Callable:
+    phase_name = f"validate {cls.__name__}"
+
+    @functools.wraps(original_init)
+    def __init__(__pydantic_self__, *args, **kwargs):
+        # Only account the class that is actually instantiated and not the base classes it calls via super()
+        if type(__pydantic_self__) is not cls:
+            return original_init(__pydantic_self__, *args, **kwargs)
+        with timed(phase_name):
+            return original_init(__pydantic_self__, *args, **kwargs)
+    return __init__
+
+
+def _instrument_model_validation():
+    # Pydantic validates a model by calling its __init__ (also for nested models). Collect the original __init__
+    # functions first so the wrappers of subclasses do not call the wrappers of their base classes.
+    classes = [cls for cls in _padrick_model_classes() if cls not in _INSTRUMENTED_INITS]
+    original_inits = {cls: cls.__init__ for cls in classes}
+    for cls, original_init in original_inits.items():
+        _INSTRUMENTED_INITS[cls] = cls.__dict__.get('__init__')
+        cls.__init__ = _timed_init(cls, original_init)
+
+
+def _restore_model_validation():
+    for cls, own_init in _INSTRUMENTED_INITS.items():
+        if own_init is None:
+            del cls.__init__
+        else:
+            cls.__init__ = own_init
+    _INSTRUMENTED_INITS.clear()
+
+
+def enable_timings(record_trace: bool = False, instrument_models: bool = True,
+                   trace_memory: bool = False) -> PhaseTimer:
+    """
+    Start accounting the time spent in the individual phases of padrick (YAML loading, include resolution, model
+    validation per model class, expansion of multiple pads/ports, template rendering, reggen invocations and file
+    writes). Timing the validation of every single model instance has a noticeable overhead. With
+    instrument_models=False, the validation per model class is not accounted. With trace_memory=True, the peak memory
+    allocated by every phase is accounted as well (see PhaseTimer).
+
+    Phases executed in worker processes (e.g. with --jobs) are not accounted.
+    """
+    global _TIMER
+    _TIMER = PhaseTimer(record_trace=record_trace, trace_memory=trace_memory)
+    if instrument_models:
+        _instrument_model_validation()
+    return _TIMER
+
+
+def disable_timings():
+    global _TIMER
+    _restore_model_validation()
+    _TIMER = None
+
+
+def object_type_census() -> Dict[str, Tuple[int, int]]:
+    """
+    Returns the number of live objects and their total (shallow) size in bytes per type name.
+
+    Only objects tracked by the garbage collector are considered, i.e. instances of all classes and containers but
+    not plain strings and numbers.
+    """
+    gc.collect()
+    census: Dict[type, List[int]] = {}
+    for obj in gc.get_objects():
+        entry = census.get(type(obj))
+        if entry is None:
+            entry = census[type(obj)] = [0, 0]
+        entry[0] += 1
+        entry[1] += sys.getsizeof(obj)
+    result = {}
+    for obj_type, (count, size) in census.items():
+        type_name = obj_type.__qualname__ if obj_type.__module__ == 'builtins' \
+            else f"{obj_type.__module__}.{obj_type.__qualname__}"
+        old_count, old_size = result.get(type_name, (0, 0))
+        result[type_name] = (old_count + count, old_size + size)
+    return result
+
+
+def _format_memory_report(label: str, top: int) -> str:
+    current = tracemalloc.get_traced_memory()[0]
+    lines = [f"Memory after {label}: {current / MIB:.1f} MiB allocated"]
+    # Only report the objects created since the memory report session was started (and not e.g. the classes and
+    # functions of imported modules).
+    census = []
+    for type_name, (count, size) in object_type_census().items():
+        baseline_count, baseline_size = _CENSUS_BASELINE.get(type_name, (0, 0))
+        if count > baseline_count:
+            census.append((type_name, count - baseline_count, size - baseline_size))
+    census.sort(key=lambda entry: entry[2], reverse=True)
+    type_width = max([len("Type")] + [len(type_name) for type_name, _, _ in census[:top]])
+    lines.append("Objects created since the start of the command:")
+    lines.append(f"{'Type':<{type_width}}  {'Count':>10}  {'Size [MiB]':>10}")
+    lines.append("-" * len(lines[-1]))
+    for type_name, count, size in census[:top]:
+        lines.append(f"{type_name:<{type_width}}  {count:>10}  {size / MIB:>10.1f}")
+    lines.append("")
+    lines.append("Allocation sites of the memory still allocated:")
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__)
+    ])
+    for statistic in snapshot.statistics('lineno')[:top]:
+        frame = statistic.traceback[0]
+        lines.append(f"{statistic.size / MIB:>8.1f} MiB  {statistic.count:>10} blocks  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines)
+
+
+def memory_report(label: str, top: int = 20):
+    """
+    Record the live objects per type and the allocation sites of the memory currently allocated (e.g. right after
+    validating a configuration). The reports are printed once the memory report session is stopped.
+
+    Does nothing unless a memory report was requested (see ProfilingSession).
+    """
+    if _MEMORY_REPORTS is None or not tracemalloc.is_tracing():
+        return
+    with timed("memory report"):
+        _MEMORY_REPORTS.append(_format_memory_report(label, top))
+
+
+class ProfilingSession:
+    """
+    Profiling of a single padrick command as requested on the command line.
+
+    With print_timings, a summary of the phase timings is printed once the session is stopped. If profile_out ends
+    with .json, a Chrome trace event file of the phases is written to it. Any other profile_out receives the cProfile
+    statistics of the whole command (see python -m pstats).
+
+    With print_memory_report, all allocations are traced with tracemalloc (which slows padrick down considerably). The
+    phase summary then contains the peak memory of every phase and the reports recorded with memory_report() are
+    printed as well.
+    """
+
+    def __init__(self, print_timings: bool, profile_out: Optional[Path] = None, print_memory_report: bool = False):
+        self.print_timings = print_timings or print_memory_report
+        self.profile_out = profile_out
+        self.print_memory_report = print_memory_report
+        self.write_trace = profile_out is not None and profile_out.suffix == TRACE_SUFFIX
+        self._profiler: Optional[cProfile.Profile] = None
+        self._timer: Optional[PhaseTimer] = None
+
+    def start(self):
+        global _MEMORY_REPORTS, _CENSUS_BASELINE
+        if self.print_memory_report:
+            _MEMORY_REPORTS = []
+            _CENSUS_BASELINE = object_type_census()
+            tracemalloc.start()
+        if self.print_timings or self.write_trace:
+            self._timer = enable_timings(record_trace=self.write_trace, trace_memory=self.print_memory_report)
+        if self.profile_out is not None and not self.write_trace:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self):
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(str(self.profile_out))
+            logger.info(f"Wrote cProfile statistics to {self.profile_out}.")
+            self._profiler = None
+        if self._timer is not None:
+            disable_timings()
+            if self.write_trace:
+                self._timer.write_trace(self.profile_out)
+                logger.info(f"Wrote trace of {len(self._timer.trace_events)} phases to {self.profile_out}.")
+            if self.print_timings:
+                click.echo(self._timer.summary(), err=True)
+            self._timer = None
+        if self.print_memory_report:
+            global _MEMORY_REPORTS, _CENSUS_BASELINE
+            tracemalloc.stop()
+            for report in _MEMORY_REPORTS:
+                click.echo("\n" + report, err=True)
+            _MEMORY_REPORTS = None
+            _CENSUS_BASELINE = {}
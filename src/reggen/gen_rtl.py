@@ -5,7 +5,7 @@
 
 import logging as log
 import os
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from mako import exceptions  # type: ignore
 from mako.template import Template  # type: ignore
@@ -90,7 +90,13 @@ def get_reg_tx_type(block: IpBlock, reg: RegBase, hw2reg: bool) -> str:
                      type_suff])
 
 
-def gen_rtl(block: IpBlock, outdir: str) -> int:
+def _write_file(path: str, content: str) -> None:
+    with open(path, 'w', encoding='UTF-8') as fout:
+        fout.write(content)
+
+
+def gen_rtl(block: IpBlock, outdir: str,
+            write_file: Callable[[str, str], None] = _write_file) -> int:
     # Read Register templates
     reg_top_tpl = Template(resources.read_text('reggen', 'reg_top.sv.tpl'))
     reg_pkg_tpl = Template(resources.read_text('reggen', 'reg_pkg.sv.tpl'))
@@ -100,12 +106,11 @@ def gen_rtl(block: IpBlock, outdir: str) -> int:
     # This defines the various types used to interface between the *_reg_top
     # module(s) and the block itself.
     reg_pkg_path = os.path.join(outdir, block.name.lower() + "_reg_pkg.sv")
-    with open(reg_pkg_path, 'w', encoding='UTF-8') as fout:
-        try:
-            fout.write(reg_pkg_tpl.render(block=block))
-        except:  # noqa F722 for template Exception handling
-            log.error(exceptions.text_error_template().render())
-            return 1
+    try:
+        write_file(reg_pkg_path, reg_pkg_tpl.render(block=block))
+    except:  # noqa F722 for template Exception handling
+        log.error(exceptions.text_error_template().render())
+        return 1
 
     # Generate the register block implementation(s). For a device interface
     # with no name we generate the register module "<block>_reg_top" (writing
@@ -120,15 +125,14 @@ def gen_rtl(block: IpBlock, outdir: str) -> int:
 
         mod_name = mod_base + '_reg_top'
         reg_top_path = os.path.join(outdir, mod_name + '.sv')
-        with open(reg_top_path, 'w', encoding='UTF-8') as fout:
-            try:
-                fout.write(reg_top_tpl.render(block=block,
-                                              mod_base=mod_base,
-                                              mod_name=mod_name,
-                                              if_name=if_name,
-                                              rb=rb))
-            except:  # noqa F722 for template Exception handling
-                log.error(exceptions.text_error_template().render())
-                return 1
+        try:
+            write_file(reg_top_path, reg_top_tpl.render(block=block,
+                                                        mod_base=mod_base,
+                                                        mod_name=mod_name,
+                                                        if_name=if_name,
+                                                        rb=rb))
+        except:  # noqa F722 for template Exception handling
+            log.error(exceptions.text_error_template().render())
+            return 1
 
     return 0
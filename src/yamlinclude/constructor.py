@@ -4,12 +4,15 @@
 Include YAML files within YAML
 """
 
+import copy
 import os.path
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from glob import iglob
 from re import Pattern
 from sys import version_info
-from typing import Sequence, Tuple
+from typing import Sequence, Tuple, Dict, Any, Optional, Mapping, Type
 
 import ruamel.yaml
 from ruamel import yaml
@@ -17,13 +20,24 @@ from ruamel.yaml import YAML
 
 from .readers import Reader, get_reader_class_by_name, get_reader_class_by_path
 
-__all__ = ['YamlIncludeConstructor']
+__all__ = ['YamlIncludeConstructor', 'register_include_constructor']
 
 PYTHON_MAYOR_MINOR = '{0[0]}.{0[1]}'.format(version_info)
 
 WILDCARDS_REGEX = re.compile(r'^.*(\*|\?|\[!?.+]).*$')
 
 
+def register_include_constructor(yaml_instance: YAML, include_constructor):
+    """Register an include constructor with a single YAML instance
+
+    :meth:`YAML.register_class` adds the constructor to the class level constructor table of the loader
+    class which is shared by all YAML instances of the same type. Derive a private loader class first so
+    concurrent loads with different include constructors (e.g. different base directories) do not interfere.
+    """
+    yaml_instance.Constructor = type(yaml_instance.Constructor.__name__, (yaml_instance.Constructor,), {})
+    yaml_instance.register_class(include_constructor)
+
+
 class YamlIncludeConstructor:
     """The `include constructor` for ruamel.yaml Loaders
 
@@ -47,7 +61,10 @@ class YamlIncludeConstructor:
             tag: str = DEFAULT_TAG_NAME,
             base_dir: str = '',
             encoding: str = '',
-            reader_map: Sequence[Tuple[re.Pattern, Reader]] = None  # noqa
+            reader_map: Sequence[Tuple[re.Pattern, Reader]] = None,  # noqa
+            yaml_typ: str = 'rt',
+            max_workers: Optional[int] = 1,
+            readers: Mapping[str, Type[Reader]] = None
     ):
         """
         :param str base_dir: Base directory where search including YAML files
@@ -61,12 +78,43 @@ class YamlIncludeConstructor:
         :param Collection reader_map: A collection of `(path-pattern, reader-class)` tuple
 
             :default: ``None``: set :data:`readers.READER_TABLE` as default readers map
+
+        :param str yaml_typ: Type of the :class:`ruamel.yaml.YAML` instances used to load included YAML files
+
+            :default: ``"rt"``: round-trip loading (preserves line information and comments). Use ``"safe"`` to
+            load included files with the (C accelerated if available) safe loader.
+
+        :param int max_workers: Number of threads used to read and parse the files matched by a wildcard pattern
+            concurrently
+
+            :default: ``1``: read the files one after another. ``0`` or ``None`` uses the default number of
+            threads of :class:`concurrent.futures.ThreadPoolExecutor`.
+
+        :param Mapping readers: Additional reader classes selectable by name with the ``reader`` argument of
+            ``!include``
+
+            :default: ``None``: Only the built-in readers are available
         """
         self.yaml_tag = tag
         self.__name__ = tag
         self._base_dir = base_dir
         self._encoding = encoding
         self._reader_map = reader_map
+        self.yaml_typ = yaml_typ
+        self.max_workers = max_workers
+        self._readers = readers or {}
+        # Bookkeeping of all files (and wildcard patterns) included so far. Used by padrick's model cache to
+        # determine the dependencies of a config file.
+        self.included_files = []
+        self.include_patterns = {}
+        # Content of the files read so far keyed by (resolved path, mtime, reader class, encoding). Files included
+        # multiple times (directly or through wildcard patterns) are only read and parsed once. Every further include
+        # of a file gets a deep copy of the cached content, so modifying the data of one include in-place (e.g. while
+        # validating it) does not affect the others.
+        self._file_cache: Dict[Tuple[str, int, type, str], Any] = {}
+        # Threads that include the same file concurrently wait for the first one to read it
+        self._file_locks: Dict[Tuple[str, int, type, str], threading.RLock] = {}
+        self._file_locks_lock = threading.Lock()
 
     def from_yaml(self, constructor, node):
         args = []
@@ -76,7 +124,8 @@ class YamlIncludeConstructor:
         elif isinstance(node, yaml.SequenceNode):  # type: ignore
             args = constructor.construct_sequence(node)
         elif isinstance(node, yaml.MappingNode):  # type: ignore
-            kwargs = constructor.construct_mapping(node)
+            # The round-trip constructor's construct_mapping fills a given CommentedMap. Construct a plain dict instead.
+            kwargs = ruamel.yaml.constructor.SafeConstructor.construct_mapping(constructor, node, deep=True)
         else:
             raise TypeError('Un-supported YAML node {!r}'.format(node))
         return self.load(constructor, *args, **kwargs)
@@ -156,24 +205,53 @@ class YamlIncludeConstructor:
             pathname = os.path.join(self._base_dir, pathname)
         reader_clz = None
         if reader:
-            reader_clz = get_reader_class_by_name(reader)
+            reader_clz = self._readers.get(reader.strip().lower()) or get_reader_class_by_name(reader)
         if re.match(WILDCARDS_REGEX, pathname):
-            result = []
-            iterable = iglob(pathname, recursive=recursive)
-            for path in filter(os.path.isfile, iterable):
-                if reader_clz:
-                    result.append(reader_clz(path, encoding=encoding, include_constructor=self)())
-                else:
-                    result.append(self._read_file(path, encoding))
+            # Sort the matches since the order in which iglob yields them depends on the file system
+            matched_paths = sorted(filter(os.path.isfile, iglob(pathname, recursive=recursive)))
+            self.include_patterns[pathname] = (recursive, matched_paths)
+            self.included_files.extend(matched_paths)
+            if self.max_workers == 1 or len(matched_paths) < 2:
+                return [self._read_file(path, encoding, reader_clz) for path in matched_paths]
+            # Every file is read with its own include constructor. Their bookkeeping of nested includes is merged
+            # in the order of the matched paths afterwards to keep included_files deterministic.
+            children = [self._child() for _ in matched_paths]
+            with ThreadPoolExecutor(max_workers=self.max_workers or None) as executor:
+                result = list(executor.map(lambda child, path: child._read_file(path, encoding, reader_clz),
+                                           children, matched_paths))
+            for child in children:
+                self.included_files.extend(child.included_files)
+                self.include_patterns.update(child.include_patterns)
             return result
-        if reader_clz:
-            return reader_clz(pathname, encoding=encoding, loader_class=type(loader))()
-        return self._read_file(pathname, encoding)
-
-    def _read_file(self, path, encoding):
-        reader_clz = get_reader_class_by_path(path, self._reader_map)
-        reader_obj = reader_clz(path, encoding=encoding, include_constructor=self)
-        return reader_obj()
+        self.included_files.append(pathname)
+        return self._read_file(pathname, encoding, reader_clz)
+
+    def _read_file(self, path, encoding, reader_clz=None):
+        if not reader_clz:
+            reader_clz = get_reader_class_by_path(path, self._reader_map)
+        key = (os.path.realpath(path), os.stat(path).st_mtime_ns, reader_clz, encoding)
+        if key in self._file_cache:
+            return copy.deepcopy(self._file_cache[key])
+        with self._file_locks_lock:
+            file_lock = self._file_locks.setdefault(key, threading.RLock())
+        with file_lock:
+            # Another thread may have read the file while we were waiting for the lock
+            if key in self._file_cache:
+                return copy.deepcopy(self._file_cache[key])
+            reader_obj = reader_clz(path, encoding=encoding, include_constructor=self)
+            content = reader_obj()
+            self._file_cache[key] = content
+            return content
+
+    def _child(self) -> 'YamlIncludeConstructor':
+        """Returns an include constructor with empty bookkeeping that shares the file cache with this one. Nested
+        wildcard includes are read sequentially."""
+        child = YamlIncludeConstructor(self.yaml_tag, self._base_dir, self._encoding, self._reader_map, self.yaml_typ,
+                                       max_workers=1, readers=self._readers)
+        child._file_cache = self._file_cache
+        child._file_locks = self._file_locks
+        child._file_locks_lock = self._file_locks_lock
+        return child
 
 class IgnoreIncludeConstructor:
     """Dummy version of the YamlIncludeConstructor that ignores all includes"""
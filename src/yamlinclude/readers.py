@@ -86,9 +86,9 @@ class YamlReader(Reader):
 
     def __call__(self):
         with open(self._path, encoding=self._encoding) as fp:  # pylint:disable=invalid-name
-            yaml = YAML()
+            yaml = YAML(typ=self._include_constructor.yaml_typ)
             # Register YamlIncludeConstructor to allow for recursive includes
-            yaml.register_class(self._include_constructor)
+            yamlinclude.constructor.register_include_constructor(yaml, self._include_constructor)
             return yaml.load(fp)
 
 
@@ -122,7 +122,7 @@ def get_reader_class_by_name(name: str):
         return PlainTextReader
     if name in ('yaml', 'yml'):
         return YamlReader
-    if name == csv:
+    if name == 'csv':
         return CSVReader
     raise ValueError('Un-supported name reader "{0}"'.format(name))
 
@@ -253,6 +253,9 @@ def make_exe():
     # `add_python_resources()` adds these objects to the binary, with a load
     # location as defined by the packaging policy's resource location
     # attributes.
+    # The serialized Lark parser tables (padrick/Model/ParserTables/*.lark,
+    # generated by the `parser_tables` Makefile target) are package data of
+    # padrick and thus embedded together with the padrick sources.
     exe.add_python_resources(exe.pip_install([".."]))
 
     # Invoke `pip install` using a requirements file and add the collected resources
@@ -0,0 +1,123 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from padrick.ConfigParser import parse_config
+from padrick.Generators.DriverGenerator.DriverGenerator import generate_driver
+from padrick.Generators.GeneratorSettings import RTLTemplates, DriverTemplates
+from padrick.Generators.RTLGenerator.RTLGenerator import generate_rtl
+from padrick.Model.PadDomain import PadDomain
+from padrick.Model.PadInstance import PadInstance
+from padrick.Model.PadType import PadType
+from padrick.Model.Padframe import Padframe
+from padrick.Model.Port import Port
+from padrick.Model.PortGroup import PortGroup
+from padrick.Model.Utilities import cached_property, CachedPropertiesModel
+
+KRAKEN_PADFRAME = Path(__file__).parent.parent / 'examples' / 'kraken_padframe.yml'
+MODEL_CLASSES = [PadDomain, PadInstance, PadType, Port, PortGroup]
+
+# Number of computations of CountingModel.scaled_sum per instance id
+scaled_sum_computations = Counter()
+
+
+class CountingModel(CachedPropertiesModel):
+    values: List[int]
+    factor: int = 1
+
+    @cached_property
+    def scaled_sum(self) -> int:
+        scaled_sum_computations[id(self)] += 1
+        return sum(self.values) * self.factor
+
+
+@pytest.fixture
+def counting_model():
+    scaled_sum_computations.clear()
+    return CountingModel(values=[1, 2, 3])
+
+
+def test_computed_once(counting_model):
+    assert [counting_model.scaled_sum for _ in range(3)] == [6, 6, 6]
+    assert scaled_sum_computations[id(counting_model)] == 1
+
+
+def test_recomputed_after_assignment(counting_model):
+    assert counting_model.scaled_sum == 6
+    counting_model.factor = 2
+    assert counting_model.scaled_sum == 12
+    assert counting_model.scaled_sum == 12
+    assert scaled_sum_computations[id(counting_model)] == 2
+
+
+def test_recomputed_after_invalidation(counting_model):
+    assert counting_model.scaled_sum == 6
+    # In-place modifications are not detected automatically
+    counting_model.values.append(4)
+    assert counting_model.scaled_sum == 6
+    counting_model.invalidate_cached_properties()
+    assert counting_model.scaled_sum == 10
+    assert scaled_sum_computations[id(counting_model)] == 2
+
+
+def test_copy_has_its_own_cache(counting_model):
+    assert counting_model.scaled_sum == 6
+    copied_model = counting_model.copy(update={'factor': 3})
+    assert copied_model.scaled_sum == 18
+    assert counting_model.scaled_sum == 6
+    assert scaled_sum_computations[id(counting_model)] == 1
+    assert scaled_sum_computations[id(copied_model)] == 1
+
+
+@pytest.fixture
+def property_computations(monkeypatch):
+    """
+    Count the computations of every cached property of the padframe models per instance.
+    """
+    computations = Counter()
+    # Keep the instances alive so their ids stay unique
+    instances = {}
+
+    def counting(func):
+        @functools.wraps(func)
+        def wrapper(self):
+            instances[id(self)] = self
+            computations[(type(self).__name__, func.__name__, id(self))] += 1
+            return func(self)
+        return wrapper
+
+    for cls in MODEL_CLASSES:
+        for name, attribute in list(vars(cls).items()):
+            if isinstance(attribute, cached_property):
+                monkeypatch.setattr(cls, name, cached_property(counting(attribute.fget)))
+    return computations
+
+
+def test_render_computes_each_property_at_most_once(tmp_path, property_computations):
+    padframe = parse_config(Padframe, KRAKEN_PADFRAME)
+    assert padframe is not None
+    property_computations.clear()
+    generate_rtl(RTLTemplates(), padframe, tmp_path / 'rtl', header_text="")
+    generate_driver(DriverTemplates(), padframe, tmp_path / 'driver', header_text="")
+    assert property_computations, "The render did not use any cached property"
+    recomputed = {key: count for key, count in property_computations.items() if count > 1}
+    assert not recomputed
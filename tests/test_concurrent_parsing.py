@@ -0,0 +1,103 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The parse context is stored in a context variable (see padrick.Model.ParseContext). Configurations validated
+concurrently in several threads must not see each other's pad types and pad signals. Likewise, the model cache must
+only record (and replay) the validation warnings of the configuration it stores.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from mako.template import Template
+from pydantic import BaseModel
+
+from padrick.ConfigParser import parse_config
+from padrick.Model.Padframe import Padframe
+from padrick.ModelCache import ModelCache, record_validation_warnings
+
+EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+EXAMPLE_CONFIGS = [
+    EXAMPLES_DIR / 'kraken_padframe.yml',
+    EXAMPLES_DIR / 'sample_padframe.yaml',
+    EXAMPLES_DIR / 'modular_config' / 'modular_config_top.yml',
+]
+REPETITIONS = 4
+THREADS = 8
+
+
+def fingerprint(obj):
+    """
+    A comparable representation of a validated model. Models do not compare equal across parses since their compiled
+    Mako templates only compare by identity.
+    """
+    if isinstance(obj, BaseModel):
+        return type(obj).__name__, tuple((name, fingerprint(getattr(obj, name))) for name in obj.__fields__)
+    if isinstance(obj, Template):
+        return obj.source
+    if isinstance(obj, dict):
+        return tuple(sorted(((fingerprint(key), fingerprint(value)) for key, value in obj.items()), key=repr))
+    if isinstance(obj, (set, frozenset)):
+        return tuple(sorted((fingerprint(value) for value in obj), key=repr))
+    if isinstance(obj, (list, tuple)):
+        return tuple(fingerprint(value) for value in obj)
+    return type(obj).__name__, str(obj)
+
+
+def parse_fingerprint(config_file: Path):
+    padframe = parse_config(Padframe, config_file)
+    assert padframe is not None
+    return fingerprint(padframe)
+
+
+def test_concurrent_parsing_equals_serial_parsing():
+    serial_results = {config_file: parse_fingerprint(config_file) for config_file in EXAMPLE_CONFIGS}
+    assert len(set(serial_results.values())) == len(EXAMPLE_CONFIGS)
+
+    config_files = EXAMPLE_CONFIGS * REPETITIONS
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        concurrent_results = list(executor.map(parse_fingerprint, config_files))
+    for config_file, result in zip(config_files, concurrent_results):
+        assert result == serial_results[config_file], f"Concurrent parse of {config_file} differs"
+
+
+def parse_with_warnings(config_file: Path, cache: ModelCache):
+    with record_validation_warnings() as warnings:
+        padframe = parse_config(Padframe, config_file, cache=cache)
+    assert padframe is not None
+    return fingerprint(padframe), warnings
+
+
+def test_concurrent_parsing_with_cache(tmp_path):
+    # Validating a config with an outdated (but still supported) manifest version logs a warning. The other configs
+    # do not log any warnings.
+    outdated_config = tmp_path / 'outdated_padframe.yml'
+    outdated_config.write_text((EXAMPLES_DIR / 'kraken_padframe.yml').read_text()
+                               .replace('manifest_version: 3', 'manifest_version: 2', 1))
+    config_files = EXAMPLE_CONFIGS + [outdated_config]
+    serial_results = {config_file: parse_with_warnings(config_file, cache=None) for config_file in config_files}
+    assert [config_file for config_file, (_, warnings) in serial_results.items() if warnings] == [outdated_config]
+
+    cache = ModelCache(tmp_path / 'cache')
+    # The first round validates and stores the models, the second one loads them from the cache
+    for _ in range(2):
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(parse_with_warnings, config_files * REPETITIONS,
+                                        [cache] * len(config_files) * REPETITIONS))
+        for config_file, result in zip(config_files * REPETITIONS, results):
+            assert result == serial_results[config_file], f"Cached concurrent parse of {config_file} differs"
+    assert len(list(cache.cache_dir.glob('*.pickle'))) == len(config_files)
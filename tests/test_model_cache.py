@@ -0,0 +1,103 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import padrick
+import padrick.ModelCache
+from padrick.ConfigParser import parse_config
+from padrick.Model.Padframe import Padframe
+from padrick.ModelCache import ModelCache, record_validation_warnings, padrick_source_hash
+
+KRAKEN_PADFRAME = Path(__file__).parent.parent / 'examples' / 'kraken_padframe.yml'
+
+
+@pytest.fixture
+def outdated_config(tmp_path):
+    # Validating a config with an outdated (but still supported) manifest version logs a warning
+    config_file = tmp_path / 'padframe.yml'
+    config_file.write_text(KRAKEN_PADFRAME.read_text().replace('manifest_version: 3', 'manifest_version: 2', 1))
+    return config_file
+
+
+def pad_names(padframe: Padframe):
+    return [(pad_domain.name, pad.name) for pad_domain in padframe.pad_domains for pad in pad_domain.pad_list]
+
+
+def forbid_validation(monkeypatch):
+    def parse_obj(*args, **kwargs):
+        raise AssertionError("The model was validated instead of loaded from the cache")
+    monkeypatch.setattr(Padframe, 'parse_obj', parse_obj)
+
+
+def test_cache_hit_replays_validation_warnings(tmp_path, outdated_config, monkeypatch):
+    cache = ModelCache(tmp_path / 'cache')
+    with record_validation_warnings() as cold_warnings:
+        cold_model = parse_config(Padframe, outdated_config, cache=cache)
+    assert any('outdated manifest version 2' in message for _, _, message in cold_warnings)
+
+    forbid_validation(monkeypatch)
+    with record_validation_warnings() as warm_warnings:
+        warm_model = parse_config(Padframe, outdated_config, cache=cache)
+    assert pad_names(warm_model) == pad_names(cold_model)
+    assert warm_warnings == cold_warnings
+
+
+def test_cache_key_depends_on_padrick_sources(tmp_path, outdated_config, monkeypatch):
+    cache = ModelCache(tmp_path / 'cache')
+    assert parse_config(Padframe, outdated_config, cache=cache) is not None
+    assert cache.load(Padframe, outdated_config, outdated_config.parent) is not None
+    monkeypatch.setattr(padrick.ModelCache, 'padrick_source_hash', lambda: 'modified sources')
+    assert cache.load(Padframe, outdated_config, outdated_config.parent) is None
+
+
+def test_eviction_removes_orphaned_manifests(tmp_path, outdated_config):
+    cache = ModelCache(tmp_path / 'cache')
+    assert parse_config(Padframe, outdated_config, cache=cache) is not None
+    [evicted_model] = cache.cache_dir.glob('*.pickle')
+    # Mark the first entry as least recently used and only leave room for one entry
+    os.utime(evicted_model, (0, 0))
+    cache.max_size = evicted_model.stat().st_size * 3 // 2
+    other_config = tmp_path / 'other_padframe.yml'
+    other_config.write_text(KRAKEN_PADFRAME.read_text())
+    assert parse_config(Padframe, other_config, cache=cache) is not None
+
+    [model] = cache.cache_dir.glob('*.pickle')
+    [manifest] = cache.cache_dir.glob('*.manifest.json')
+    assert model != evicted_model
+    assert json.loads(manifest.read_text())['model'] == model.name
+    assert cache.load(Padframe, outdated_config, outdated_config.parent) is None
+    assert cache.load(Padframe, other_config, other_config.parent) is not None
+
+
+def test_source_hash_changes_with_sources(tmp_path, monkeypatch):
+    package_dir = tmp_path / 'padrick'
+    (package_dir / 'Model').mkdir(parents=True)
+    (package_dir / '__init__.py').write_text("")
+    (package_dir / 'Model' / 'Padframe.py').write_text("class Padframe: pass\n")
+    monkeypatch.setattr(padrick, '__file__', str(package_dir / '__init__.py'))
+    padrick_source_hash.cache_clear()
+    try:
+        original_hash = padrick_source_hash()
+        (package_dir / 'Model' / 'Padframe.py').write_text("class Padframe: version = 2\n")
+        padrick_source_hash.cache_clear()
+        assert padrick_source_hash() != original_hash
+    finally:
+        padrick_source_hash.cache_clear()
@@ -0,0 +1,173 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pad lists imported from CSV files (see padrick.Model.PadListCSV) must validate to the same model as the equivalent
+pad lists in YAML and report errors with the line of the offending CSV row.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from padrick.ConfigParser import load_yaml, FAST_YAML_TYPE
+from padrick.Model.PadListCSV import PadListCSV, PAD_LIST_CSV_COLUMNS, MAX_REPORTED_ROW_ERRORS
+from padrick.Model.Padframe import Padframe
+from padrick.Model.ParseContext import PARSE_CONTEXT
+from test_concurrent_parsing import fingerprint
+
+PADFRAME = """\
+name: csv_padframe
+manifest_version: 3
+pad_domains:
+  - name: main
+    pad_types:
+      - name: gpio_pad
+        template: |
+          GPIO ${{instance_name}} (.PAD(${{conn["pad"]}}));
+        pad_signals:
+          - {{name: output_en, size: 1, kind: input, conn_type: dynamic, default_reset_value: 0, default_static_value: "1'b0"}}
+          - {{name: rx_en, size: 1, kind: input, conn_type: dynamic, default_reset_value: 0, default_static_value: "1'b0"}}
+          - {{name: chip2pad, size: 1, kind: input, conn_type: dynamic, default_reset_value: 0, default_static_value: "1'b0"}}
+          - {{name: pad2chip, size: 1, kind: output, conn_type: dynamic, default_static_value: ~}}
+          - {{name: drive, size: 2, kind: input, conn_type: static, default_reset_value: 0, default_static_value: "2'b0"}}
+          - {{name: pad, size: 1, kind: pad}}
+    pad_list: {pad_list}
+    port_groups:
+      - name: uart
+        mux_groups: [all, grp1]
+        output_defaults: {{rx_i: "1'b1"}}
+        ports:
+          - name: tx
+            connections: {{chip2pad: tx_o, output_en: "1'b1"}}
+          - name: rx
+            connections: {{rx_i: pad2chip, rx_en: "1'b1"}}
+"""
+
+YAML_PAD_LIST = """
+      - name: pad_a
+        pad_type: gpio_pad
+        description: First pad
+        mux_groups: [all, self]
+        connections: {drive: "2'b01"}
+      - name: pad_b
+        pad_type: gpio_pad
+        is_static: true
+        connections: {chip2pad: sig_b, output_en: "1'b1", rx_en: "1'b0", pad2chip: ~}
+      - name: pad_c
+        pad_type: gpio_pad
+        mux_groups: [grp1, grp2]
+        is_static: false
+        default_port: uart.tx
+      - name: pad_d
+        pad_type: gpio_pad
+"""
+
+CSV_HEADER = ",".join(PAD_LIST_CSV_COLUMNS) + "\n"
+CSV_ROWS = [
+    "pad_a,gpio_pad,First pad,\"all, self\",,,drive=2'b01\n",
+    "pad_b,gpio_pad,,,yes,,chip2pad=sig_b; output_en=1'b1; rx_en=1'b0; pad2chip=\n",
+    "pad_c,gpio_pad,,grp1 grp2,no,uart.tx,\n",
+    "pad_d,gpio_pad,,,,,\n",
+]
+
+
+def parse_padframe(tmp_path, pad_list: str) -> Padframe:
+    config_file = tmp_path / 'padframe.yml'
+    config_file.write_text(PADFRAME.format(pad_list=pad_list))
+    config_data, _ = load_yaml(config_file, tmp_path, typ=FAST_YAML_TYPE)
+    with PARSE_CONTEXT.scope():
+        return Padframe.parse_obj(config_data)
+
+
+def pad_names(padframe: Padframe):
+    return [pad.name for pad in padframe.pad_domains[0].pad_list]
+
+
+def test_csv_equals_yaml(tmp_path):
+    (tmp_path / 'pads.csv').write_text(CSV_HEADER + "".join(CSV_ROWS))
+    csv_padframe = parse_padframe(tmp_path, "!include {pathname: pads.csv, reader: pad_list}")
+    yaml_padframe = parse_padframe(tmp_path, YAML_PAD_LIST)
+    assert pad_names(csv_padframe) == ['pad_a', 'pad_b', 'pad_c', 'pad_d']
+    assert fingerprint(csv_padframe) == fingerprint(yaml_padframe)
+
+
+def test_wildcard_concatenates_csv_files_in_order(tmp_path):
+    (tmp_path / 'pads').mkdir()
+    # Written in reverse order, the files are included in sorted order regardless
+    for index, row in reversed(list(enumerate(CSV_ROWS))):
+        (tmp_path / 'pads' / f'pads_{index}.csv').write_text(CSV_HEADER + row)
+    csv_padframe = parse_padframe(tmp_path, "!include {pathname: pads/*.csv, reader: pad_list}")
+    yaml_padframe = parse_padframe(tmp_path, YAML_PAD_LIST)
+    assert pad_names(csv_padframe) == ['pad_a', 'pad_b', 'pad_c', 'pad_d']
+    assert fingerprint(csv_padframe) == fingerprint(yaml_padframe)
+
+
+def test_self_mux_group_is_normalized_per_pad(tmp_path):
+    (tmp_path / 'pads.csv').write_text(CSV_HEADER + "".join(f"pad_{i},gpio_pad,,all self,,,\n" for i in range(3)))
+    padframe = parse_padframe(tmp_path, "!include {pathname: pads.csv, reader: pad_list}")
+    pads = padframe.pad_domains[0].pad_list
+    assert [pad.mux_groups for pad in pads] == [{'all', f'pad_{i}'} for i in range(3)]
+    assert len({id(pad.mux_groups) for pad in pads}) == len(pads)
+
+
+def invalid_rows_error(tmp_path, rows: str) -> str:
+    (tmp_path / 'pads.csv').write_text(CSV_HEADER + rows)
+    with pytest.raises(ValidationError) as exc_info:
+        parse_padframe(tmp_path, "!include {pathname: pads.csv, reader: pad_list}")
+    [error] = exc_info.value.errors()
+    assert error['loc'] == ('pad_domains', 0, 'pad_list')
+    return error['msg']
+
+
+@pytest.mark.parametrize('row, message', [
+    ("pad_x,unknown_pad,,,,,\n", "Unknown pad_type unknown_pad"),
+    ("pad_x,gpio_pad,,,,,chip2pad\n", "Invalid connection 'chip2pad'"),
+    ("pad_x,gpio_pad,,,,,chip2pad=a;chip2pad=b\n", "Pad signal chip2pad is connected more than once"),
+    ("pad_x,gpio_pad,,,maybe,,\n", "Invalid boolean value 'maybe'"),
+    ("pad_x,gpio_pad,,,,,,extra\n", "Expected 7 cells but got 8"),
+    (",gpio_pad,,,,,\n", "Missing value for column(s) name"),
+])
+def test_row_error_names_line(tmp_path, row, message):
+    # The erroneous row is preceded by the header, a valid row, a comment and an empty line
+    error = invalid_rows_error(tmp_path, CSV_ROWS[0] + "# comment,,,,,,\n\n" + row)
+    lines = error.splitlines()
+    assert lines[0] == "Invalid rows in pad list CSV file:"
+    assert len(lines) == 2
+    assert lines[1].startswith(f"{tmp_path / 'pads.csv'}, line 5: ")
+    assert message in lines[1]
+
+
+def test_row_errors_are_truncated(tmp_path):
+    error_rows = MAX_REPORTED_ROW_ERRORS + 5
+    error = invalid_rows_error(tmp_path, "".join(f"pad_{i},unknown_pad,,,,,\n" for i in range(error_rows)))
+    lines = error.splitlines()
+    assert len(lines) == 1 + MAX_REPORTED_ROW_ERRORS + 1
+    assert [line.split(': ')[0] for line in lines[1:-1]] == \
+           [f"{tmp_path / 'pads.csv'}, line {line}" for line in range(2, MAX_REPORTED_ROW_ERRORS + 2)]
+    assert lines[-1] == "... and 5 more erroneous rows"
+
+
+@pytest.mark.parametrize('header, message', [
+    ("name,pad_type,color\n", "line 1: Unknown column(s) color."),
+    ("name,description\n", "line 1: Missing column(s) pad_type."),
+    ("name,pad_type,Name\n", "line 1: Duplicate column names."),
+])
+def test_header_errors(tmp_path, header, message):
+    csv_file = tmp_path / 'pads.csv'
+    csv_file.write_text(header + "pad_a,gpio_pad,\n")
+    with pytest.raises(ValueError) as exc_info:
+        list(PadListCSV(str(csv_file)).rows())
+    assert str(exc_info.value).startswith(f"{csv_file}, {message}")
@@ -0,0 +1,79 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import pytest
+
+from padrick.Model.PadSignal import Signal, PadSignal, SignalDirection
+
+
+@pytest.fixture
+def pad_signal():
+    return PadSignal(name='chip2pad', size=2, kind='input', conn_type='dynamic', default_reset_value=0,
+                     default_static_value="2'b0")
+
+
+def test_signal_equals_pad_signal(pad_signal):
+    signal = Signal('chip2pad', 2, SignalDirection.soc2pads)
+    assert signal == pad_signal and pad_signal == signal
+    assert hash(signal) == hash(pad_signal)
+    assert len({signal, pad_signal}) == 1
+
+
+@pytest.mark.parametrize('signal', [
+    Signal('pad2chip', 2, SignalDirection.soc2pads),
+    Signal('chip2pad', 1, SignalDirection.soc2pads),
+    Signal('chip2pad', 2, SignalDirection.pads2soc),
+    Signal('chip2pad', 2),
+])
+def test_signal_differs_from_pad_signal(pad_signal, signal):
+    assert signal != pad_signal and pad_signal != signal
+
+
+def test_signal_does_not_equal_other_types():
+    signal = Signal('chip2pad')
+    assert signal != 'chip2pad'
+    assert signal != ('chip2pad', 1, None)
+
+
+def test_signal_is_immutable():
+    signal = Signal('chip2pad')
+    with pytest.raises(AttributeError):
+        signal.name = 'pad2chip'
+    with pytest.raises(AttributeError):
+        signal.unknown = 1
+    assert signal.name == 'chip2pad'
+
+
+def test_signal_pickle_round_trip():
+    signal = Signal('chip2pad', 4, SignalDirection.pads2soc)
+    unpickled = pickle.loads(pickle.dumps(signal))
+    assert unpickled == signal and hash(unpickled) == hash(signal)
+    assert (unpickled.name, unpickled.size, unpickled.direction) == ('chip2pad', 4, SignalDirection.pads2soc)
+
+
+def test_validate_links_signals(pad_signal):
+    signal = Signal('chip2pad')
+    assert Signal.validate(signal) is signal
+    converted = Signal.validate(pad_signal)
+    assert type(converted) is Signal and converted == pad_signal
+
+
+@pytest.mark.parametrize('value', ['chip2pad', {'name': 'chip2pad', 'size': 1}, None])
+def test_validate_rejects_configuration_values(value):
+    with pytest.raises(TypeError):
+        Signal.validate(value)
@@ -0,0 +1,33 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from pydantic import ValidationError
+
+from padrick.Model.PortGroup import PortGroup
+
+
+def test_port_group_without_ports():
+    port_group = PortGroup(name='empty', ports=[])
+    assert port_group.port_signals == []
+    assert port_group.port_signals_soc2pads == []
+    assert port_group.port_signals_pads2soc == []
+
+
+def test_output_defaults_of_port_group_without_ports():
+    # Used to fail with "unbound method set.union() needs an argument"
+    with pytest.raises(ValidationError, match="Found unknown port signal rx_en"):
+        PortGroup(name='empty', ports=[], output_defaults={'rx_en': "1'b0"})
@@ -0,0 +1,63 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The register files of the default template are built from RegisterFile.regfile_description while the emitted hjson
+artifact is rendered from regfile.hjson.mako. Both must describe the same register file.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import hjson
+import pytest
+
+from padrick.ConfigParser import parse_config
+from padrick.Generators.GeneratorSettings import RTLTemplates, DriverTemplates
+from padrick.Generators.RegisterFile import DEFAULT_REGFILE_TEMPLATE, regfile_description, \
+    _regfile_template_kwargs, build_regfiles
+from padrick.Model.Padframe import Padframe
+
+EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+EXAMPLE_CONFIGS = [
+    EXAMPLES_DIR / 'kraken_padframe.yml',
+    EXAMPLES_DIR / 'sample_padframe.yaml',
+    EXAMPLES_DIR / 'modular_config' / 'modular_config_top.yml',
+]
+
+logger = logging.getLogger("padrick.tests")
+
+
+@pytest.mark.parametrize('templates', [RTLTemplates(), DriverTemplates()], ids=['rtl', 'driver'])
+def test_default_templates_use_regfile_description(templates):
+    assert templates.regfile_hjson.template == DEFAULT_REGFILE_TEMPLATE
+
+
+@pytest.mark.parametrize('config_file', EXAMPLE_CONFIGS, ids=lambda config_file: config_file.name)
+def test_rendered_hjson_matches_regfile_description(config_file):
+    padframe = parse_config(Padframe, config_file)
+    assert padframe is not None
+    regfile_template = RTLTemplates().regfile_hjson
+    regfiles = build_regfiles(regfile_template, logger, padframe, header_text="header")
+    start_address_offset = 0
+    for pad_domain, regfile in zip(padframe.pad_domains, regfiles):
+        rendered = regfile_template.render_to_string(logger, **_regfile_template_kwargs(
+            padframe, pad_domain, start_address_offset, "header"))
+        description = regfile_description(padframe, pad_domain, start_address_offset)
+        # Compare the serialized descriptions to also catch differences in the order of the registers and fields
+        assert json.dumps(hjson.loads(rendered), indent=2) == json.dumps(description, indent=2)
+        start_address_offset = regfile.reg_blocks[None].offset
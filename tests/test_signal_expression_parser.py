@@ -0,0 +1,158 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parity tests of the LALR signal expression parser against the Earley parser of padrick v0.3.6
+(tests/data/earley_signal_expression.lark).
+"""
+
+import pickle
+from pathlib import Path
+
+import pytest
+from lark import Lark
+from lark.exceptions import UnexpectedInput
+
+from padrick.Model.SignalExpressionType import SignalExpressionType, parse_expression, EMPTY_EXPRESSION, \
+    _collect_parts
+from padrick.Model.TemplatedIndexGrammar import templated_index_grammar, TemplatedIdxToStringTransformer
+
+EARLEY_GRAMMAR = Path(__file__).parent / 'data' / 'earley_signal_expression.lark'
+
+
+@pytest.fixture(scope='module')
+def earley_parser():
+    return Lark(EARLEY_GRAMMAR.read_text() + templated_index_grammar, parser='earley')
+
+
+def to_string(tree) -> str:
+    return TemplatedIdxToStringTransformer().transform(tree)
+
+
+def earley_signal_collection(tree):
+    return {to_string(signal) for signal in tree.find_data('signal_name')}
+
+
+# Both parsers yield identical trees for these expressions
+IDENTICAL_TREES = [
+    "", "a", "pad2chip", "gpio{i}_o", "cfg{i}", "mx_gpio{(i+1)%2:c}", "a{i+1}_b{i}", "sig{i:x}_o",
+    "1'b0", "1'b1", "8'hff", "4'd10", "3'sb101", "16'o777", "'0", "'1", "12",
+    "~a", "!a", "-a", "a & b", "a&b", "a | b", "a ^ b", "a ~^ b", "a && b", "a || b", "a == b", "a != b",
+    "a < b", "a > b", "a + b", "a * b", "(a)", "(a & b)", "~a & b", "(a | b) & ~c", "a & ~b",
+    "out{i}_o & en{i}", "a & 1'b0",
+]
+
+# The LALR grammar tokenizes multi-character operators differently and parses operator chains left-associative (the
+# Earley parser picks an arbitrary derivation of the ambiguous chains). The trees differ but their string
+# representation and the referenced signals are the same.
+EQUIVALENT_STRINGS = [
+    "a & b | c", "~a & b | 8'hff", "a === b", "a !== b", "a <= b", "a >= b", "a << 2", "a >> 2", "a >>> 2",
+    "a ** 2", "a -> b", "a <-> b", "a<=b",
+]
+
+
+@pytest.mark.parametrize('expression', IDENTICAL_TREES)
+def test_identical_trees(earley_parser, expression):
+    assert parse_expression(expression) == earley_parser.parse(expression)
+
+
+@pytest.mark.parametrize('expression', IDENTICAL_TREES + EQUIVALENT_STRINGS)
+def test_string_and_signal_collection_parity(earley_parser, expression):
+    earley_tree = earley_parser.parse(expression)
+    expr = SignalExpressionType(expression)
+    assert to_string(parse_expression(expression)) == to_string(earley_tree)
+    assert expr.get_mapped_expr({}) == to_string(earley_tree)
+    assert expr.signal_collection == earley_signal_collection(earley_tree)
+    assert expr.is_single_signal == (earley_tree.data == 'signal_expression')
+    assert expr.is_const_expr == (not expr.signal_collection)
+
+
+def test_signal_name_mapping():
+    expression = "~gpio{i}_o & en | 1'b0"
+    expr = SignalExpressionType(expression)
+    assert expr.signal_collection == {'gpio{i}_o', 'en'}
+    assert expr.get_mapped_expr({'gpio{i}_o': 'gpio_o[{i}]', 'en': 'enable'}) == "~gpio_o[{i}] & enable | 1'b0"
+
+
+# Expressions the Earley parser accepted (with the string it produced) that the LALR parser rejects
+REJECTED_EXPRESSIONS = {
+    'a & ': 'a & ',  # Dangling binary operator
+    'a &&': 'a &&',
+    '()': '',  # Empty parentheses
+    '-(a&b)': '-a&b',  # Unary operators only apply to primaries. Earley silently dropped the parentheses.
+}
+
+
+@pytest.mark.parametrize('expression, earley_string', REJECTED_EXPRESSIONS.items())
+def test_rejected_expressions(earley_parser, expression, earley_string):
+    assert to_string(earley_parser.parse(expression)) == earley_string
+    with pytest.raises(UnexpectedInput):
+        parse_expression(expression)
+    with pytest.raises(ValueError):
+        SignalExpressionType(expression)
+
+
+# Operators the Earley lexer could not tokenize that are accepted now
+@pytest.mark.parametrize('expression, signals', [
+    ('a ==? b', {'a', 'b'}),
+    ('a !=? b', {'a', 'b'}),
+    ('~&bus', {'bus'}),
+])
+def test_newly_accepted_expressions(earley_parser, expression, signals):
+    with pytest.raises(UnexpectedInput):
+        earley_parser.parse(expression)
+    assert to_string(parse_expression(expression)) == expression
+    assert SignalExpressionType(expression).signal_collection == signals
+
+
+@pytest.mark.parametrize('expression', [' a ', 'a ? b : c', '{a, b}', 'a b'])
+def test_rejected_by_both(earley_parser, expression):
+    with pytest.raises(UnexpectedInput):
+        earley_parser.parse(expression)
+    with pytest.raises(UnexpectedInput):
+        parse_expression(expression)
+
+
+@pytest.mark.parametrize('expression, message', [
+    ('a & ', "Unexpected token Token('$END', '') at line 1, column 4."),
+    ('()', "Unexpected token Token('RPAR', ')') at line 1, column 2."),
+    ('-(a&b)', "Unexpected token Token('LPAR', '(') at line 1, column 2."),
+    ('a b', "Unexpected token Token('B', 'b') at line 1, column 3."),
+])
+def test_error_messages(expression, message):
+    with pytest.raises(ValueError) as exc_info:
+        SignalExpressionType(expression)
+    assert str(exc_info.value).startswith("Illegal signal expresion: " + message)
+
+
+@pytest.mark.parametrize('expression', [None, ''])
+def test_empty_expression(expression):
+    expr = SignalExpressionType(expression)
+    assert expr == '' and expr.is_empty
+    assert expr.is_const_expr
+    assert not expr.is_single_signal
+    assert expr.signal_collection == set()
+    assert expr.get_mapped_expr({'a': 'b'}) == ''
+    assert expr.evaluate_template(3) is expr
+    assert pickle.loads(pickle.dumps(expr)).is_empty
+
+
+def test_empty_expression_shortcut():
+    # The empty expression is not parsed (see EMPTY_EXPRESSION). Its representation must match the parsed one.
+    ast = parse_expression("")
+    parts = [""]
+    is_templated = _collect_parts(ast, parts)
+    assert EMPTY_EXPRESSION == (tuple(parts), ast.data == 'signal_expression', is_templated)
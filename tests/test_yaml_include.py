@@ -0,0 +1,143 @@
+# Manuel Eggimann <meggimann@iis.ee.ethz.ch>
+#
+# Copyright (C) 2021-2022 ETH Zürich
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+
+import pytest
+
+from padrick.ConfigParser import load_yaml, FAST_YAML_TYPE
+from yamlinclude import YamlIncludeConstructor
+from yamlinclude.readers import YamlReader
+
+INCLUDES = 5
+FRAGMENTS = ['c', 'a', 'd', 'b']
+PAD_SIGNALS = """\
+- name: chip2pad
+  size: 1
+  kind: input
+- name: pad2chip
+  size: 1
+  kind: output
+"""
+
+
+@pytest.fixture
+def file_reads(monkeypatch):
+    """
+    Count the YAML files read from disk by path.
+    """
+    reads = Counter()
+    original_call = YamlReader.__call__
+
+    def counting_call(self):
+        reads[self._path] += 1
+        return original_call(self)
+    monkeypatch.setattr(YamlReader, '__call__', counting_call)
+    return reads
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    (tmp_path / 'signals').mkdir()
+    (tmp_path / 'signals' / 'pad_signals.yml').write_text(PAD_SIGNALS)
+    config_file = tmp_path / 'config.yml'
+    config_file.write_text("direct:\n" + INCLUDES * "  - !include signals/pad_signals.yml\n"
+                           + "wildcard: !include signals/*.yml\n")
+    return config_file
+
+
+@pytest.mark.parametrize('typ', ['rt', FAST_YAML_TYPE])
+@pytest.mark.parametrize('include_jobs', [1, 4])
+def test_included_file_is_read_once(config_file, file_reads, typ, include_jobs):
+    config_data, _ = load_yaml(config_file, config_file.parent, typ=typ, include_jobs=include_jobs)
+    assert [path for path, reads in file_reads.items() if reads > 1] == []
+    assert sum(file_reads.values()) == 1
+    includes = config_data['direct'] + config_data['wildcard']
+    assert len(includes) == INCLUDES + 1
+    assert all(included == includes[0] for included in includes)
+
+
+def test_includes_do_not_share_data(config_file, file_reads):
+    config_data, _ = load_yaml(config_file, config_file.parent, typ=FAST_YAML_TYPE)
+    includes = config_data['direct'] + config_data['wildcard']
+    assert len({id(included) for included in includes}) == len(includes)
+    # Validators may modify the included data in-place
+    includes[0][0]['size'] = 2
+    includes[0].append({'name': 'output_en'})
+    assert all(included[0]['size'] == 1 and len(included) == 2 for included in includes[1:])
+
+
+@pytest.fixture
+def fragments_config_file(tmp_path):
+    """
+    A config file with a wildcard include that matches several files. Each of them includes a common file and a file
+    of its own.
+    """
+    (tmp_path / 'common').mkdir()
+    (tmp_path / 'common' / 'pad_signals.yml').write_text(PAD_SIGNALS)
+    (tmp_path / 'fragments').mkdir()
+    for name in FRAGMENTS:
+        (tmp_path / 'common' / f'{name}_attrs.yml').write_text(f"fragment: {name}\n")
+        (tmp_path / 'fragments' / f'{name}.yml').write_text(f"name: {name}\n"
+                                                             "pad_signals: !include common/pad_signals.yml\n"
+                                                             f"user_attr: !include common/{name}_attrs.yml\n")
+    config_file = tmp_path / 'config.yml'
+    config_file.write_text("fragments: !include fragments/*.yml\n")
+    return config_file
+
+
+@pytest.mark.parametrize('typ', ['rt', FAST_YAML_TYPE])
+def test_parallel_wildcard_include_equals_serial(fragments_config_file, monkeypatch, typ):
+    # The matched files are read in parallel by child include constructors
+    children = []
+    original_child = YamlIncludeConstructor._child
+
+    def counting_child(self):
+        children.append(original_child(self))
+        return children[-1]
+    monkeypatch.setattr(YamlIncludeConstructor, '_child', counting_child)
+
+    results = {}
+    for include_jobs in [1, 4]:
+        children.clear()
+        config_data, include_constructor = load_yaml(fragments_config_file, fragments_config_file.parent, typ=typ,
+                                                     include_jobs=include_jobs)
+        assert len(children) == (len(FRAGMENTS) if include_jobs > 1 else 0)
+        results[include_jobs] = (config_data, include_constructor.included_files,
+                                 include_constructor.include_patterns)
+    assert results[1] == results[4]
+
+    config_data, included_files, include_patterns = results[4]
+    assert [fragment['name'] for fragment in config_data['fragments']] == sorted(FRAGMENTS)
+    assert all(fragment['user_attr'] == {'fragment': fragment['name']} for fragment in config_data['fragments'])
+    base_dir = str(fragments_config_file.parent)
+    matched_paths = [f'{base_dir}/fragments/{name}.yml' for name in sorted(FRAGMENTS)]
+    assert list(include_patterns.values()) == [(False, matched_paths)]
+    # The matched files in sorted order, followed by the files included by each of them in the same order
+    assert included_files == matched_paths + [path for name in sorted(FRAGMENTS)
+                                              for path in [f'{base_dir}/common/pad_signals.yml',
+                                                           f'{base_dir}/common/{name}_attrs.yml']]
+
+
+@pytest.mark.parametrize('include_jobs', [1, 4])
+def test_nested_include_is_read_once(fragments_config_file, file_reads, include_jobs):
+    config_data, _ = load_yaml(fragments_config_file, fragments_config_file.parent, typ=FAST_YAML_TYPE,
+                               include_jobs=include_jobs)
+    assert file_reads[str(fragments_config_file.parent / 'common' / 'pad_signals.yml')] == 1
+    assert sum(file_reads.values()) == 2 * len(FRAGMENTS) + 1
+    pad_signals = [fragment['pad_signals'] for fragment in config_data['fragments']]
+    assert len({id(included) for included in pad_signals}) == len(FRAGMENTS)
+    assert all(included == pad_signals[0] for included in pad_signals)